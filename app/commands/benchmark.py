@@ -0,0 +1,264 @@
+"""Micro-benchmarks of the per-request serialization, logging and redaction paths.
+
+Usage:
+    PYTHONPATH="./app" python -m commands.benchmark [--case parse_entity ...] [--size 1 --size 10k ...] \
+        [--repeat 5] [--output report.json] [--save-baseline PATH | --baseline PATH [--tolerance 0.25]]
+
+Every response goes through `views.helpers.parse_entity`, `json.dumps` of the parsed entity for the `response_body`
+of the log context, and the structlog processor chain of `core.logging.logger` when the view logs;
+`core.logging.redactors.redact_sensitive_info` walks the same payloads. Each case runs on a single claim node
+(size 1) and on lists of 10, 1k and 10k claims, built in memory so no database is needed.
+
+The time per call is the median and the minimum of `--repeat` timings, each long enough (`timeit` autorange) to
+make the timer resolution irrelevant. Allocations are measured on one more call under `tracemalloc`: the peak of the
+memory it allocated and the memory still held once it returned (the result included).
+
+The report (JSON, on stdout and in `--output`) holds these figures per case and size. `--baseline` compares it with a
+report saved by `--save-baseline`, `benchmarks/baseline.json` in the repository: cases whose median time grew by more
+than `--tolerance`, or whose peak allocations grew by more than `--memory-tolerance`, are listed under `regressions`
+and the command exits with 1. Times depend on the machine, compare reports taken on the same one; allocations do not.
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from core.logging.context import get_temporary_log_context, set_request_ctx_http_data
+from core.logging.logger import _get_structlog_processors
+from core.logging.redactors import redact_sensitive_info
+from core.settings import get_settings
+from external.neo4j.serializers import Claim
+from views.helpers import parse_entity
+from views.serializers import ClaimStatus
+
+settings = get_settings()
+
+SIZES = {"1": 1, "10": 10, "1k": 1_000, "10k": 10_000}
+
+# redacted keys when ATTRIBUTES_TO_REDACT is empty: the walk costs the same whether keys match or not
+_DEFAULT_KEYS_TO_REDACT = {"claim_number", "password"}
+
+
+def make_claims(size: int) -> Claim | list[Claim]:
+    """Unsaved claim nodes with every property set; size 1 is a single node, like the get-by-id endpoints return."""
+    start = datetime(2024, 1, 1)
+    statuses = list(ClaimStatus)
+    claims = [
+        Claim(
+            pid=f"claim-{index:05d}",
+            claim_number=f"CLM-{index:05d}",
+            amount=round(100 + index * 1.25, 2),
+            status=statuses[index % len(statuses)].value,
+            submission_date=start + timedelta(minutes=index),
+            description=float(index),
+        )
+        for index in range(size)
+    ]
+    return claims[0] if size == 1 else claims
+
+
+###
+# Cases: each builds its input once and returns the callable measured
+###
+def parse_entity_case(size: int) -> Callable[[], Any]:
+    claims = make_claims(size)
+    return lambda: parse_entity(claims)
+
+
+def json_dumps_case(size: int) -> Callable[[], Any]:
+    parsed = parse_entity(make_claims(size))
+    return lambda: json.dumps(parsed)
+
+
+def log_chain_case(size: int) -> Callable[[], Any]:
+    """The processor chain rendering one log line of a view, its response body in the log context; no output I/O."""
+    response_body = json.dumps(parse_entity(make_claims(size)))
+    processors = _get_structlog_processors()
+
+    def log() -> Any:
+        with get_temporary_log_context(create_new_context=True):
+            set_request_ctx_http_data(
+                method="GET",
+                url="/v1/claims",
+                status_code=200,
+                response_body=response_body,
+            )
+            event_dict: Any = {"event": "Successfully retrieved claims"}
+            for processor in processors:
+                event_dict = processor(None, "info", event_dict)
+            return event_dict
+
+    return log
+
+
+def redact_case(size: int) -> Callable[[], Any]:
+    parsed = parse_entity(make_claims(size))
+    keys = settings.attributes_to_redact or _DEFAULT_KEYS_TO_REDACT
+    return lambda: redact_sensitive_info(parsed, keys)
+
+
+CASES: dict[str, Callable[[int], Callable[[], Any]]] = {
+    "parse_entity": parse_entity_case,
+    "json_dumps": json_dumps_case,
+    "log_chain": log_chain_case,
+    "redact_sensitive_info": redact_case,
+}
+
+
+###
+# Measuring
+###
+def measure(func: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    timings = [elapsed / loops for elapsed in timer.repeat(repeat=repeat, number=loops)]
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = func()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    return {
+        "loops": loops,
+        "median_us": round(statistics.median(timings) * 1e6, 3),
+        "min_us": round(min(timings) * 1e6, 3),
+        "peak_bytes": peak - before,
+        "retained_bytes": after - before,
+    }
+
+
+def run(cases: list[str], sizes: list[str], repeat: int) -> dict[str, Any]:
+    results: dict[str, dict[str, Any]] = {}
+    for case in cases:
+        results[case] = {}
+        for size in sizes:
+            results[case][size] = measure(CASES[case](SIZES[size]), repeat)
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "log_renderer": "dev" if settings.dev_mode else "json",
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float,
+    memory_tolerance: float,
+) -> list[dict[str, Any]]:
+    """Cases and sizes whose median time grew by more than `tolerance`, or peak allocations by `memory_tolerance`."""
+    regressions = []
+    for case, sizes in report["results"].items():
+        for size, now in sizes.items():
+            if (before := baseline["results"].get(case, {}).get(size)) is None:
+                continue
+            if now["median_us"] > before["median_us"] * (1 + tolerance):
+                regressions.append(
+                    _regression(
+                        case, size, "median_us", before["median_us"], now["median_us"]
+                    )
+                )
+            if now["peak_bytes"] > before["peak_bytes"] * (1 + memory_tolerance):
+                regressions.append(
+                    _regression(
+                        case,
+                        size,
+                        "peak_bytes",
+                        before["peak_bytes"],
+                        now["peak_bytes"],
+                    )
+                )
+    return regressions
+
+
+def _regression(
+    case: str, size: str, metric: str, baseline: float, current: float
+) -> dict[str, Any]:
+    change = (current - baseline) / baseline if baseline else math.inf
+    return {
+        "case": case,
+        "size": size,
+        "metric": metric,
+        "baseline": baseline,
+        "current": current,
+        "change": round(change, 4),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmark the serialization, logging and redaction paths."
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=list(CASES),
+        help="case to run, repeatable (default: all)",
+    )
+    parser.add_argument(
+        "--size",
+        action="append",
+        choices=list(SIZES),
+        help="payload size, repeatable (default: all)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="timings per case, the median is reported"
+    )
+    parser.add_argument("--output", type=Path, help="file receiving the JSON report")
+    baseline = parser.add_mutually_exclusive_group()
+    baseline.add_argument(
+        "--save-baseline", type=Path, help="save the report as the baseline"
+    )
+    baseline.add_argument(
+        "--baseline", type=Path, help="baseline report to compare with"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="relative time increase flagged"
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.1,
+        help="relative allocation increase flagged",
+    )
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1:
+        parser.error("--repeat must be positive")
+    baseline_report = json.loads(args.baseline.read_text()) if args.baseline else None
+
+    started = time.perf_counter()
+    report = run(args.case or list(CASES), args.size or list(SIZES), args.repeat)
+    report["took_s"] = round(time.perf_counter() - started, 1)
+
+    if baseline_report is not None:
+        report["regressions"] = compare(
+            report, baseline_report, args.tolerance, args.memory_tolerance
+        )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(text + "\n")
+    print(text)
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
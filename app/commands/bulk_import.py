@@ -0,0 +1,512 @@
+"""Load persons, companies, claims, documents and their links from CSV/JSONL files.
+
+Usage:
+    PYTHONPATH="./app" python -m commands.bulk_import --person persons.csv --company companies.jsonl \
+        --claim claims.csv --document documents.jsonl.gz --links links.csv \
+        [--workers 4] [--executor thread|process] [--batch-size 1000] [--checkpoint PATH] [--restart]
+
+Files are streamed, `.gz` ones decompressed on the fly. Rows are validated with the API models
+(`views.serializers`), links are `from_id,to_id,type` rows. Every node file is written before the link files, in
+batches of `--batch-size` rows handed to a pool of workers that validate them and write them with the UNWIND bulk
+operations.
+
+The checkpoint file records the finished batches of every file; rerunning the same command after an interruption
+skips them, and it is removed once the import completes. Writes are MERGEs by pid, so the batches that were in
+flight when the import stopped are replayed without creating anything twice. That only holds when every row has its
+own `pid`, so rows without one are rejected instead of getting a random id.
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import batched
+from pathlib import Path
+from typing import Any, NamedTuple, TextIO
+
+from neo4j.exceptions import DriverError, Neo4jError
+from pydantic import BaseModel, ValidationError
+
+from core.settings import get_settings
+from external.neo4j import operations
+from external.neo4j.driver import close_driver
+from external.neo4j.exceptions import DatabaseUnavailableError
+from views.serializers import Claim, Company, Document, Person, RelationshipLink
+
+settings = get_settings()
+db_settings = settings.db_settings
+
+# input kind -> (model validating its rows, bulk operation writing them), in import order: nodes before links
+KINDS: dict[str, tuple[type[BaseModel], Callable[[list[dict[str, Any]]], Any]]] = {
+    "person": (Person, operations.bulk_create_persons),
+    "company": (Company, operations.bulk_create_companies),
+    "claim": (Claim, operations.bulk_create_claims),
+    "document": (Document, operations.bulk_create_documents),
+    "links": (RelationshipLink, operations.bulk_create_relationships),
+}
+
+# errors stopping an import that a rerun resumes from the checkpoint: the database, a worker or an input file failing
+_RESUMABLE_ERRORS = (
+    Neo4jError,
+    DriverError,
+    DatabaseUnavailableError,
+    BrokenExecutor,
+    OSError,
+    ValueError,
+    csv.Error,
+)
+
+# rejected rows kept in the summary, the others are only counted (and written to --rejects)
+_REJECT_SAMPLES = 10
+
+
+class RejectedRow(NamedTuple):
+    line: int
+    error: str
+
+
+class BatchResult(NamedTuple):
+    rows: int
+    rejected: list[RejectedRow]
+    # created/exists/duplicate for nodes, linked/skipped for links
+    counts: dict[str, int]
+
+
+###
+# Reading
+###
+def open_input(path: Path) -> TextIO:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return path.open(encoding="utf-8", newline="")
+
+
+def input_format(path: Path) -> str:
+    suffix = path.with_suffix("").suffix if path.suffix == ".gz" else path.suffix
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(
+        f"Unsupported input file {path}, expected .csv, .jsonl or .ndjson (optionally .gz)"
+    )
+
+
+def read_rows(path: Path) -> Iterator[tuple[int, dict[str, Any] | RejectedRow]]:
+    """Stream the `(line number, row)` of a CSV or JSONL file. Empty CSV cells are left out, like absent keys.
+
+    A JSONL line that is not a JSON object is streamed as its `RejectedRow`, so it is counted with the invalid rows
+    instead of stopping the import.
+    """
+    fmt = input_format(path)
+    with open_input(path) as file:
+        if fmt == "csv":
+            reader = csv.DictReader(file)
+            for row in reader:
+                yield (
+                    reader.line_num,
+                    {
+                        key: value
+                        for key, value in row.items()
+                        if value not in ("", None)
+                    },
+                )
+        else:
+            for line, text in enumerate(file, start=1):
+                if text.strip():
+                    yield line, _parse_json_row(path, line, text)
+
+
+def _parse_json_row(path: Path, line: int, text: str) -> dict[str, Any] | RejectedRow:
+    try:
+        row = json.loads(text.rstrip("\r\n"))
+    except json.JSONDecodeError as exc:
+        return RejectedRow(
+            line, f"{path}:{line}: invalid JSON: {exc.msg} (column {exc.colno})"
+        )
+    if not isinstance(row, dict):
+        return RejectedRow(
+            line, f"{path}:{line}: expected a JSON object, got {type(row).__name__}"
+        )
+    return row
+
+
+###
+# Writing, runs in the workers
+###
+def import_batch(
+    kind: str, rows: list[tuple[int, dict[str, Any] | RejectedRow]]
+) -> BatchResult:
+    """Validate a batch of rows and write the valid ones."""
+    model, write = KINDS[kind]
+    items, rejected = [], []
+    for line, row in rows:
+        if isinstance(row, RejectedRow):
+            rejected.append(row)
+            continue
+        if kind != "links" and not row.get("pid"):
+            rejected.append(RejectedRow(line, "pid: Field required"))
+            continue
+        try:
+            items.append(model.model_validate(row).model_dump())
+        except ValidationError as exc:
+            error = exc.errors()[0]
+            rejected.append(
+                RejectedRow(line, f"{'.'.join(map(str, error['loc']))}: {error['msg']}")
+            )
+
+    counts: Counter[str] = Counter()
+    if items:
+        result = write(items)
+        if kind == "links":
+            counts.update(linked=result.linked, skipped=result.skipped)
+        else:
+            counts.update(item.status.value for item in result)
+    return BatchResult(rows=len(rows), rejected=rejected, counts=dict(counts))
+
+
+###
+# Checkpoints
+###
+class Checkpoint:
+    """Finished batches of every input file, saved atomically after each batch."""
+
+    def __init__(
+        self,
+        path: Path | None,
+        batch_size: int,
+        inputs: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.inputs = inputs or {}
+
+    @classmethod
+    def load(
+        cls, path: Path | None, batch_size: int, restart: bool = False
+    ) -> "Checkpoint":
+        if path is None or restart or not path.exists():
+            return cls(path, batch_size)
+
+        data = json.loads(path.read_text())
+        if data["batch_size"] != batch_size:
+            raise ValueError(
+                f"Checkpoint {path} was written with --batch-size {data['batch_size']}, "
+                "rerun with the same value or pass --restart"
+            )
+        return cls(path, batch_size, data["inputs"])
+
+    def _entry(self, kind: str, path: Path) -> dict[str, Any]:
+        stat = path.stat()
+        fingerprint = [stat.st_size, stat.st_mtime_ns]
+        entry = self.inputs.setdefault(
+            f"{kind}:{path.resolve()}", {"fingerprint": fingerprint, "done": []}
+        )
+        if entry["fingerprint"] != fingerprint:
+            raise ValueError(
+                f"{path} changed since the checkpoint was written, pass --restart to import it again"
+            )
+        return entry
+
+    def done_batches(self, kind: str, path: Path) -> set[int]:
+        return set(self._entry(kind, path)["done"])
+
+    def is_complete(self, kind: str, path: Path) -> bool:
+        return self._entry(kind, path).get("complete", False)
+
+    def mark_done(self, kind: str, path: Path, index: int) -> None:
+        entry = self._entry(kind, path)
+        entry["done"] = sorted({*entry["done"], index})
+        self.save()
+
+    def mark_complete(self, kind: str, path: Path) -> None:
+        entry = self._entry(kind, path)
+        # the batch numbers are not needed anymore once the whole file is in
+        entry.update(complete=True, done=[])
+        self.save()
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(
+            json.dumps({"batch_size": self.batch_size, "inputs": self.inputs})
+        )
+        os.replace(tmp, self.path)
+
+    def remove(self) -> None:
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+
+###
+# Statistics
+###
+class InputStats:
+    def __init__(self, kind: str, path: Path) -> None:
+        self.kind = kind
+        self.path = path
+        self.started_at = time.monotonic()
+        self.finished_at: float | None = None
+        self.rows = 0
+        # rows of the batches finished by an earlier run
+        self.resumed = 0
+        self.rejected = 0
+        self.rejected_samples: list[dict[str, Any]] = []
+        self.counts: Counter[str] = Counter()
+
+    def add(self, result: BatchResult) -> None:
+        self.rows += result.rows
+        self.rejected += len(result.rejected)
+        self.counts.update(result.counts)
+        for row in result.rejected[: _REJECT_SAMPLES - len(self.rejected_samples)]:
+            self.rejected_samples.append(row._asdict())
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "file": str(self.path),
+            "rows": self.rows,
+            "resumed": self.resumed,
+            "rejected": self.rejected,
+            **dict(self.counts),
+            "seconds": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "rejected_samples": self.rejected_samples,
+        }
+
+
+###
+# Import
+###
+class BulkImport:
+    def __init__(
+        self,
+        executor: Executor,
+        checkpoint: Checkpoint,
+        batch_size: int,
+        max_in_flight: int,
+        progress_interval: float = 10,
+        rejects: TextIO | None = None,
+    ) -> None:
+        self.executor = executor
+        self.checkpoint = checkpoint
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+        self.progress_interval = progress_interval
+        self.rejects = rejects
+        self._last_progress = time.monotonic()
+
+    def run(self, inputs: list[tuple[str, Path]]) -> list[InputStats]:
+        order = list(KINDS)
+        return [
+            self.import_file(kind, path)
+            for kind, path in sorted(inputs, key=lambda item: order.index(item[0]))
+        ]
+
+    def import_file(self, kind: str, path: Path) -> InputStats:
+        stats = InputStats(kind, path)
+        if self.checkpoint.is_complete(kind, path):
+            print(f"{kind} {path}: already imported, skipping", file=sys.stderr)
+            stats.finished_at = time.monotonic()
+            return stats
+
+        done = self.checkpoint.done_batches(kind, path)
+        pending: dict[Future[BatchResult], int] = {}
+        try:
+            # Only `max_in_flight` batches are read ahead of the workers, the file is never held in memory
+            for index, batch in enumerate(batched(read_rows(path), self.batch_size)):
+                if index in done:
+                    stats.resumed += len(batch)
+                    continue
+                pending[self.executor.submit(import_batch, kind, list(batch))] = index
+                if len(pending) >= self.max_in_flight:
+                    self._collect(kind, path, stats, pending, FIRST_COMPLETED)
+            self._collect(kind, path, stats, pending)
+        finally:
+            for future in pending:
+                future.cancel()
+
+        self.checkpoint.mark_complete(kind, path)
+        stats.finished_at = time.monotonic()
+        return stats
+
+    def _collect(
+        self,
+        kind: str,
+        path: Path,
+        stats: InputStats,
+        pending: dict[Future[BatchResult], int],
+        return_when: str = ALL_COMPLETED,
+    ) -> None:
+        finished, _ = wait(pending, return_when=return_when)
+        for future in finished:
+            index = pending.pop(future)
+            # a failed batch stops the import, the batches recorded so far are kept for the next run
+            result = future.result()
+            stats.add(result)
+            self._write_rejects(kind, path, result.rejected)
+            self.checkpoint.mark_done(kind, path, index)
+        self._report_progress(stats)
+
+    def _write_rejects(
+        self, kind: str, path: Path, rejected: list[RejectedRow]
+    ) -> None:
+        if self.rejects is None:
+            return
+        for row in rejected:
+            self.rejects.write(
+                json.dumps({"kind": kind, "file": str(path), **row._asdict()}) + "\n"
+            )
+
+    def _report_progress(self, stats: InputStats) -> None:
+        if time.monotonic() - self._last_progress < self.progress_interval:
+            return
+        self._last_progress = time.monotonic()
+        print(
+            f"{stats.kind} {stats.path}: {stats.rows} rows ({stats.rows_per_second:.0f}/s), "
+            f"{stats.rejected} rejected, {dict(stats.counts)}",
+            file=sys.stderr,
+        )
+
+
+def create_executor(kind: str, workers: int) -> Executor:
+    if kind == "process":
+        # spawned, so no worker inherits a Neo4j connection pool through fork
+        return ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk-import")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Import nodes and links from CSV/JSONL files with resumable batches."
+    )
+    for kind in KINDS:
+        parser.add_argument(
+            f"--{kind}",
+            action="append",
+            type=Path,
+            default=[],
+            metavar="PATH",
+            help=f"{kind} file (.csv, .jsonl, .ndjson, optionally .gz), repeatable",
+        )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="number of concurrent batches"
+    )
+    parser.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default="thread",
+        help="kind of worker pool",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=db_settings.bulk_batch_size,
+        help="rows per batch",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=Path("bulk_import.checkpoint.json"),
+        help="file recording the finished batches",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="ignore an existing checkpoint and import everything",
+    )
+    parser.add_argument(
+        "--rejects", type=Path, help="JSONL file receiving the rejected rows"
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=10,
+        help="seconds between progress lines",
+    )
+    args = parser.parse_args(argv)
+
+    inputs = [(kind, path) for kind in KINDS for path in getattr(args, kind)]
+    if not inputs:
+        parser.error("no input file given")
+    if args.workers < 1 or args.batch_size < 1:
+        parser.error("--workers and --batch-size must be positive")
+
+    try:
+        checkpoint = Checkpoint.load(
+            args.checkpoint, args.batch_size, restart=args.restart
+        )
+        for kind, path in inputs:
+            input_format(path)
+            checkpoint.done_batches(kind, path)
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+
+    started_at = time.monotonic()
+    rejects = args.rejects.open("a", encoding="utf-8") if args.rejects else None
+    executor = create_executor(args.executor, args.workers)
+    try:
+        importer = BulkImport(
+            executor,
+            checkpoint,
+            batch_size=args.batch_size,
+            max_in_flight=args.workers * 2,
+            progress_interval=args.progress_interval,
+            rejects=rejects,
+        )
+        results = importer.run(inputs)
+    except _RESUMABLE_ERRORS as exc:
+        print(
+            f"Import stopped: {exc!r}. Rerun the same command to resume from {args.checkpoint}",
+            file=sys.stderr,
+        )
+        return 1
+    finally:
+        executor.shutdown(cancel_futures=True)
+        if rejects is not None:
+            rejects.close()
+        close_driver()
+
+    checkpoint.remove()
+    elapsed = time.monotonic() - started_at
+    rows = sum(stats.rows for stats in results)
+    summary = {
+        "inputs": [stats.summary() for stats in results],
+        "rows": rows,
+        "rejected": sum(stats.rejected for stats in results),
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed, 1) if elapsed else 0.0,
+    }
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+"""Export persons, companies, claims, documents and their links to files `commands.bulk_import` loads back.
+
+Usage:
+    PYTHONPATH="./app" python -m commands.export --output export/ [--format jsonl|csv] [--gzip] \
+        [--kind person --kind links] [--page-size 1000]
+
+Every kind is written to `<output>/<kind>.<format>[.gz]`, read one page of `--page-size` nodes (or links) per
+transaction and encoded as it is read, so memory stays bounded whatever the size of the graph. Files are written
+under a temporary name and renamed once complete. Re-import them with:
+
+    PYTHONPATH="./app" python -m commands.bulk_import --person export/person.jsonl --company export/company.jsonl \
+        --claim export/claim.jsonl --document export/document.jsonl --links export/links.jsonl
+"""
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from core.settings import get_settings
+from external.neo4j import operations
+from external.neo4j.driver import close_driver
+from external.neo4j.export import (
+    EXPORT_FORMATS,
+    EXPORT_KINDS,
+    RowEncoder,
+    encode_rows,
+    export_columns,
+)
+
+settings = get_settings()
+db_settings = settings.db_settings
+
+
+def export_kind(kind: str, path: Path, fmt: str, compress: bool, page_size: int) -> int:
+    """Write every row of `kind` to `path`, returning the number of rows."""
+    rows = 0
+
+    def counted():
+        nonlocal rows
+        for row in operations.export_rows(kind, page_size=page_size):
+            rows += 1
+            yield row
+
+    partial = path.with_name(path.name + ".partial")
+    encoder = RowEncoder(fmt, export_columns(kind), compress=compress)
+    try:
+        with partial.open("wb") as file:
+            for data in encode_rows(counted(), encoder):
+                file.write(data)
+        os.replace(partial, path)
+    finally:
+        partial.unlink(missing_ok=True)
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Export nodes and links page by page to CSV/JSONL files."
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        required=True,
+        help="directory receiving one file per kind",
+    )
+    parser.add_argument(
+        "--format", choices=EXPORT_FORMATS, default="jsonl", help="file format"
+    )
+    parser.add_argument("--gzip", action="store_true", help="gzip compress the files")
+    parser.add_argument(
+        "--kind",
+        action="append",
+        choices=list(EXPORT_KINDS),
+        dest="kinds",
+        help="kind to export, repeatable (default: all of them)",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=db_settings.export_page_size,
+        help="nodes or links read per transaction",
+    )
+    args = parser.parse_args(argv)
+
+    if args.page_size < 1:
+        parser.error("--page-size must be positive")
+    args.output.mkdir(parents=True, exist_ok=True)
+
+    kinds = [kind for kind in EXPORT_KINDS if kind in (args.kinds or EXPORT_KINDS)]
+    outputs: list[dict[str, Any]] = []
+    started_at = time.monotonic()
+    try:
+        for kind in kinds:
+            path = args.output / (
+                f"{kind}.{args.format}" + (".gz" if args.gzip else "")
+            )
+            kind_started_at = time.monotonic()
+            rows = export_kind(kind, path, args.format, args.gzip, args.page_size)
+            outputs.append(
+                {
+                    "kind": kind,
+                    "path": str(path),
+                    "rows": rows,
+                    "bytes": path.stat().st_size,
+                    "seconds": round(time.monotonic() - kind_started_at, 3),
+                }
+            )
+    finally:
+        close_driver()
+
+    print(
+        json.dumps(
+            {
+                "outputs": outputs,
+                "rows": sum(output["rows"] for output in outputs),
+                "seconds": round(time.monotonic() - started_at, 3),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
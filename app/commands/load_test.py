@@ -0,0 +1,627 @@
+"""HTTP load test of the API: a weighted mix of routes at a fixed concurrency or a fixed arrival rate.
+
+Usage:
+    DB_BACKEND=memory PYTHONPATH="./app" python -m commands.load_test [--target asgi|uvicorn|URL] \
+        [--backend memory|neo4j] \
+        [--concurrency 16 | --rate 500] [--duration 30] [--warmup 5] [--mix get_person=5,create_claim=1] \
+        [--seed-size 1000] [--output report.json] [--save-baseline PATH | --baseline PATH [--tolerance 0.1]]
+
+The target is `main.app` served in-process through the ASGI transport (no network, the default), a uvicorn
+subprocess on a local port, or the base URL of a running service. The in-process app runs on the configured
+`DB_BACKEND`, the uvicorn one on `--backend` (the configured one by default), passed in its environment; with the
+in-memory backend the HTTP, validation, serialization and logging layers are measured without a database. Before the run the target is seeded through the bulk endpoints with persons, companies, claims,
+documents and their links, which the read routes then pick at random.
+
+`--concurrency` runs a closed loop: that many clients send their next request as soon as the previous one completed.
+`--rate` runs an open loop: requests start on a fixed schedule whatever the response times, and their latency is
+measured from their scheduled start, so a stalled service shows up as latency instead of fewer requests. Requests
+that would exceed `--max-in-flight` are dropped and counted.
+
+The report (JSON, on stdout and in `--output`) holds the throughput, errors and p50/p95/p99 latencies per route and
+overall. `--baseline` compares it with a report saved by `--save-baseline`: routes whose latency grew, or whose
+throughput fell, by more than `--tolerance` are listed under `regressions` and the command exits with 1.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from itertools import count
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import httpx
+
+from core.settings import get_settings
+from views.serializers import ClaimStatus
+
+settings = get_settings()
+
+# latency metrics compared with the baseline, in milliseconds
+_LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    body: Any = None
+    params: dict[str, Any] | None = None
+
+
+class Dataset:
+    """Pids of the seeded entities, shared by the route builders."""
+
+    def __init__(self, size: int, run_id: str) -> None:
+        self.run_id = run_id
+        self.persons = [f"lt-{run_id}-person-{i}" for i in range(size)]
+        self.companies = [f"lt-{run_id}-company-{i}" for i in range(max(1, size // 10))]
+        self.claims = [f"lt-{run_id}-claim-{i}" for i in range(size * 2)]
+        self.documents = [f"lt-{run_id}-document-{i}" for i in range(size)]
+
+    def links(self) -> list[dict[str, str]]:
+        companies, persons = self.companies, self.persons
+        links = [
+            {
+                "from_id": pid,
+                "to_id": companies[i % len(companies)],
+                "type": "WORKS_FOR",
+            }
+            for i, pid in enumerate(persons)
+        ]
+        for i, pid in enumerate(self.claims):
+            links.append(
+                {
+                    "from_id": persons[i % len(persons)],
+                    "to_id": pid,
+                    "type": "SUBMITTED",
+                }
+            )
+            links.append(
+                {
+                    "from_id": pid,
+                    "to_id": companies[i % len(companies)],
+                    "type": "HAS_CLAIMANT",
+                }
+            )
+        links += [
+            {"from_id": persons[i % len(persons)], "to_id": pid, "type": "SENT"}
+            for i, pid in enumerate(self.documents)
+        ]
+        return links
+
+
+def person_body(pid: str) -> dict[str, Any]:
+    return {
+        "pid": pid,
+        "name": f"Load Test {pid}",
+        "role": "tester",
+        "email": f"{pid}@example.com",
+    }
+
+
+def company_body(pid: str) -> dict[str, Any]:
+    return {
+        "pid": pid,
+        "name": f"Company {pid}",
+        "type": "Insurance",
+        "registration_number": pid,
+    }
+
+
+def claim_body(pid: str, rng: random.Random) -> dict[str, Any]:
+    return {
+        "pid": pid,
+        "claim_number": f"#{rng.randrange(1, 10**6)}",
+        "amount": round(rng.uniform(10, 10000), 2),
+        "status": rng.choice(list(ClaimStatus)).value,
+        "submission_date": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T12:00:00",
+    }
+
+
+def document_body(pid: str, rng: random.Random) -> dict[str, Any]:
+    return {
+        "pid": pid,
+        "doc_number": f"DOC{rng.randrange(1, 10**6)}",
+        "title": f"Document {pid}",
+        "submission_date": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T12:00:00",
+    }
+
+
+def _new_pid(dataset: Dataset, kind: str) -> str:
+    return f"lt-{dataset.run_id}-{kind}-{uuid.uuid4()}"
+
+
+# route -> builder of its next request
+ROUTES: dict[str, Callable[[Dataset, random.Random], Request]] = {
+    "get_person": lambda d, rng: Request("GET", f"/v1/person/{rng.choice(d.persons)}"),
+    "get_company": lambda d, rng: Request(
+        "GET", f"/v1/company/{rng.choice(d.companies)}"
+    ),
+    "get_claim": lambda d, rng: Request("GET", f"/v1/claim/{rng.choice(d.claims)}"),
+    "get_document": lambda d, rng: Request(
+        "GET", f"/v1/document/{rng.choice(d.documents)}"
+    ),
+    "create_person": lambda d, rng: Request(
+        "POST", "/v1/person", person_body(_new_pid(d, "person"))
+    ),
+    "create_company": lambda d, rng: Request(
+        "POST", "/v1/company", company_body(_new_pid(d, "company"))
+    ),
+    "create_claim": lambda d, rng: Request(
+        "POST", "/v1/claim", claim_body(_new_pid(d, "claim"), rng)
+    ),
+    "create_document": lambda d, rng: Request(
+        "POST", "/v1/document", document_body(_new_pid(d, "document"), rng)
+    ),
+    "update_claim_status": lambda d, rng: Request(
+        "PATCH",
+        f"/v1/claim/{rng.choice(d.claims)}/status",
+        {"status": rng.choice(list(ClaimStatus)).value},
+    ),
+    "claims_by_person": lambda d, rng: Request(
+        "GET", f"/v1/person/{rng.choice(d.persons)}/claims"
+    ),
+    "claims_by_company": lambda d, rng: Request(
+        "GET", f"/v1/claims/company/{rng.choice(d.companies)}"
+    ),
+    "company_by_person": lambda d, rng: Request(
+        "GET", f"/v1/company/person/{rng.choice(d.persons)}"
+    ),
+    "list_claims": lambda d, rng: Request("GET", "/v1/claims", params={"limit": 50}),
+    "link_person_company": lambda d, rng: Request(
+        "POST", f"/v1/person/{rng.choice(d.persons)}/company/{rng.choice(d.companies)}"
+    ),
+}
+
+# mostly entity reads, like the production traffic
+DEFAULT_MIX: dict[str, float] = {
+    "get_person": 20,
+    "get_company": 10,
+    "get_claim": 15,
+    "get_document": 10,
+    "claims_by_person": 10,
+    "claims_by_company": 5,
+    "company_by_person": 5,
+    "list_claims": 5,
+    "create_person": 5,
+    "create_company": 2,
+    "create_claim": 5,
+    "create_document": 3,
+    "update_claim_status": 3,
+    "link_person_company": 2,
+}
+
+
+def parse_mix(spec: str | None) -> dict[str, float]:
+    """Route weights from `route=weight,...`, the default mix when empty."""
+    if not spec:
+        return dict(DEFAULT_MIX)
+
+    mix = {}
+    for item in spec.split(","):
+        route, _, weight = item.partition("=")
+        route = route.strip()
+        if route not in ROUTES:
+            raise ValueError(
+                f"Unknown route {route!r}, expected one of {', '.join(ROUTES)}"
+            )
+        try:
+            mix[route] = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Invalid weight {weight!r} for route {route}") from None
+        if mix[route] < 0:
+            raise ValueError(f"Negative weight for route {route}")
+    if not any(mix.values()):
+        raise ValueError("The mix needs at least one route with a positive weight")
+    return mix
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile `q` (0-100) of sorted `values`."""
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+
+class Recorder:
+    """Latencies and errors per route of the requests started after the warmup."""
+
+    def __init__(self, measure_from: float) -> None:
+        self.measure_from = measure_from
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.dropped = 0
+        self.error_samples: list[str] = []
+
+    def record(
+        self, route: str, started_at: float, latency: float, error: str | None
+    ) -> None:
+        if started_at < self.measure_from:
+            return
+        self.latencies[route].append(latency)
+        if error is not None:
+            self.errors[route] += 1
+            if len(self.error_samples) < 10:
+                self.error_samples.append(f"{route}: {error}")
+
+    def report(self, duration: float) -> dict[str, Any]:
+        routes = {
+            route: _route_stats(latencies, self.errors[route], duration)
+            for route, latencies in self.latencies.items()
+        }
+        overall = [
+            latency for latencies in self.latencies.values() for latency in latencies
+        ]
+        return {
+            "overall": _route_stats(overall, sum(self.errors.values()), duration),
+            "routes": dict(sorted(routes.items())),
+            "dropped": self.dropped,
+            "error_samples": self.error_samples,
+        }
+
+
+def _route_stats(
+    latencies: list[float], errors: int, duration: float
+) -> dict[str, Any]:
+    values = sorted(latency * 1000 for latency in latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "throughput": round(len(values) / duration, 2),
+        "mean_ms": round(sum(values) / len(values), 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "max_ms": round(values[-1], 3) if values else 0.0,
+    }
+
+
+def compare(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float,
+    min_delta_ms: float,
+) -> list[dict]:
+    """Routes (and `overall`) whose latency grew, or throughput fell, by more than `tolerance` since `baseline`.
+
+    Latency changes below `min_delta_ms` are noise on sub-millisecond routes and never flagged.
+    """
+    current = {"overall": report["overall"], **report["routes"]}
+    previous = {"overall": baseline["overall"], **baseline["routes"]}
+    regressions = []
+    for route in current.keys() & previous.keys():
+        now, before = current[route], previous[route]
+        for metric in _LATENCY_METRICS:
+            if (
+                now[metric] > before[metric] * (1 + tolerance)
+                and now[metric] - before[metric] >= min_delta_ms
+            ):
+                regressions.append(
+                    _regression(route, metric, before[metric], now[metric])
+                )
+        if now["throughput"] < before["throughput"] * (1 - tolerance):
+            regressions.append(
+                _regression(
+                    route, "throughput", before["throughput"], now["throughput"]
+                )
+            )
+    return sorted(regressions, key=lambda item: (item["route"], item["metric"]))
+
+
+def _regression(
+    route: str, metric: str, baseline: float, current: float
+) -> dict[str, Any]:
+    change = (current - baseline) / baseline if baseline else math.inf
+    return {
+        "route": route,
+        "metric": metric,
+        "baseline": baseline,
+        "current": current,
+        "change": round(change, 4),
+    }
+
+
+###
+# Running the load
+###
+class LoadTest:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        dataset: Dataset,
+        mix: dict[str, float],
+        seed: int,
+    ) -> None:
+        self.client = client
+        self.dataset = dataset
+        self.routes = [route for route, weight in mix.items() if weight > 0]
+        self.weights = [mix[route] for route in self.routes]
+        self.rng = random.Random(seed)
+
+    async def send(self, recorder: Recorder, started_at: float) -> None:
+        route = self.rng.choices(self.routes, self.weights)[0]
+        request = ROUTES[route](self.dataset, self.rng)
+        error = None
+        try:
+            response = await self.client.request(
+                request.method, request.path, json=request.body, params=request.params
+            )
+            if response.status_code >= 400:
+                error = f"HTTP {response.status_code}"
+        except httpx.HTTPError as exc:
+            error = repr(exc)
+        recorder.record(route, started_at, time.perf_counter() - started_at, error)
+
+    async def run_closed(
+        self, recorder: Recorder, concurrency: int, deadline: float
+    ) -> None:
+        async def client_loop() -> None:
+            while time.perf_counter() < deadline:
+                await self.send(recorder, time.perf_counter())
+
+        await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+
+    async def run_open(
+        self, recorder: Recorder, rate: float, deadline: float, max_in_flight: int
+    ) -> None:
+        in_flight: set[asyncio.Task] = set()
+        start = time.perf_counter()
+        for i in count():
+            scheduled = start + i / rate
+            if scheduled >= deadline:
+                break
+            if (delay := scheduled - time.perf_counter()) > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= max_in_flight:
+                recorder.dropped += scheduled >= recorder.measure_from
+                continue
+            task = asyncio.create_task(self.send(recorder, scheduled))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        await asyncio.gather(*in_flight)
+
+
+async def seed(client: httpx.AsyncClient, dataset: Dataset, rng: random.Random) -> None:
+    """Create the dataset through the bulk endpoints."""
+    batch = settings.bulk_max_items
+    payloads = [
+        ("/v1/person/bulk", [person_body(pid) for pid in dataset.persons]),
+        ("/v1/company/bulk", [company_body(pid) for pid in dataset.companies]),
+        ("/v1/claim/bulk", [claim_body(pid, rng) for pid in dataset.claims]),
+        ("/v1/document/bulk", [document_body(pid, rng) for pid in dataset.documents]),
+        ("/v1/relationships/bulk", dataset.links()),
+    ]
+    for path, items in payloads:
+        for start in range(0, len(items), batch):
+            response = await client.post(path, json=items[start : start + batch])
+            response.raise_for_status()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def open_client(
+    target: str, auth: tuple[str, str], backend: str
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Client of the target: `main.app` in-process (asgi), under a local uvicorn, or a running service URL."""
+    if target not in ("asgi", "uvicorn"):
+        async with httpx.AsyncClient(base_url=target, auth=auth, timeout=30) as client:
+            yield client
+        return
+
+    if target == "asgi":
+        # the app reads the settings of this process, `main` checks `backend` matches them
+        from main import app
+
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://load-test", auth=auth
+            ) as client:
+                yield client
+        return
+
+    port = _free_port()
+    # a process of its own, so the load generator does not compete with the service for the GIL
+    server = await asyncio.create_subprocess_exec(
+        *[
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+        ],
+        cwd=Path(__file__).resolve().parents[1],
+        env={**os.environ, "DB_BACKEND": backend},
+        # the request logs are still rendered and written, only not mixed with the report
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", auth=auth, limits=limits
+        ) as client:
+            await _wait_until_up(client, server)
+            yield client
+    finally:
+        if server.returncode is None:
+            server.terminate()
+        await asyncio.wait_for(server.wait(), timeout=10)
+
+
+async def _wait_until_up(
+    client: httpx.AsyncClient, server: asyncio.subprocess.Process, timeout: float = 30
+) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.returncode is not None:
+            raise RuntimeError(f"uvicorn exited with {server.returncode}")
+        try:
+            await client.get("/docs")
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"uvicorn did not start within {timeout} seconds")
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    mix = parse_mix(args.mix)
+    rng = random.Random(args.random_seed)
+    dataset = Dataset(args.seed_size, run_id=uuid.uuid4().hex[:8])
+    auth = (
+        args.username or settings.auth_username,
+        args.password or settings.auth_password.get_secret_value(),
+    )
+
+    async with open_client(args.target, auth, args.backend) as client:
+        await seed(client, dataset, rng)
+        load = LoadTest(client, dataset, mix, seed=args.random_seed)
+        start = time.perf_counter()
+        recorder = Recorder(measure_from=start + args.warmup)
+        deadline = start + args.warmup + args.duration
+        if args.rate:
+            await load.run_open(recorder, args.rate, deadline, args.max_in_flight)
+        else:
+            await load.run_closed(recorder, args.concurrency, deadline)
+
+    return {
+        "target": args.target,
+        "backend": args.backend if args.target in ("asgi", "uvicorn") else None,
+        "load": {"rate": args.rate} if args.rate else {"concurrency": args.concurrency},
+        "duration": args.duration,
+        "warmup": args.warmup,
+        "seed_size": args.seed_size,
+        "mix": mix,
+        # requests started in the measured window, over its length
+        **recorder.report(args.duration),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Load test the API with a weighted mix of routes."
+    )
+    parser.add_argument(
+        "--target",
+        default="asgi",
+        help="asgi, uvicorn or the base URL of a running service",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["memory", "neo4j"],
+        default=settings.db_settings.backend,
+        help="data layer of uvicorn (default: DB_BACKEND), asgi runs on DB_BACKEND",
+    )
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument(
+        "--concurrency", type=int, default=16, help="clients of the closed loop"
+    )
+    load.add_argument(
+        "--rate", type=float, help="requests started per second (open loop)"
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=1000,
+        help="open loop: requests beyond this are dropped",
+    )
+    parser.add_argument("--duration", type=float, default=30, help="seconds measured")
+    parser.add_argument(
+        "--warmup", type=float, default=5, help="seconds of load before measuring"
+    )
+    parser.add_argument(
+        "--mix", help="route=weight,... (default: a read-heavy mix of every route)"
+    )
+    parser.add_argument(
+        "--seed-size",
+        type=int,
+        default=1000,
+        help="persons seeded (and as many documents)",
+    )
+    parser.add_argument(
+        "--random-seed",
+        type=int,
+        default=0,
+        help="seed of the route and entity choices",
+    )
+    parser.add_argument("--username", help="basic auth user (default: AUTH_USERNAME)")
+    parser.add_argument(
+        "--password", help="basic auth password (default: AUTH_PASSWORD)"
+    )
+    parser.add_argument("--output", type=Path, help="file receiving the JSON report")
+    baseline = parser.add_mutually_exclusive_group()
+    baseline.add_argument(
+        "--save-baseline", type=Path, help="save the report as the baseline"
+    )
+    baseline.add_argument(
+        "--baseline", type=Path, help="baseline report to compare with"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="relative change flagged as a regression",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=1.0,
+        help="smallest latency change flagged",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        parse_mix(args.mix)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if (
+        args.duration <= 0
+        or args.warmup < 0
+        or args.seed_size < 1
+        or (args.rate is not None and args.rate <= 0)
+    ):
+        parser.error(
+            "--duration, --seed-size and --rate must be positive and --warmup not negative"
+        )
+    if args.concurrency < 1 or args.max_in_flight < 1:
+        parser.error("--concurrency and --max-in-flight must be positive")
+    if args.target == "asgi" and args.backend != settings.db_settings.backend:
+        parser.error(
+            f"the asgi target runs on DB_BACKEND={settings.db_settings.backend}, set DB_BACKEND={args.backend}"
+        )
+    baseline_report = json.loads(args.baseline.read_text()) if args.baseline else None
+
+    report = asyncio.run(run(args))
+
+    if baseline_report is not None:
+        report["regressions"] = compare(
+            report, baseline_report, args.tolerance, args.min_delta_ms
+        )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    if args.save_baseline:
+        args.save_baseline.write_text(text + "\n")
+    print(text)
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,30 @@
+"""Repair the claim counters materialized on the Company and Person nodes.
+
+Usage:
+    PYTHONPATH="./app" python -m commands.reconcile_counters
+"""
+
+import argparse
+import json
+
+from external.neo4j.counters import reconcile_claim_counters
+from external.neo4j.driver import close_driver
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Recompute the claim counters and repair the ones that drifted."
+    )
+    parser.parse_args(argv)
+
+    try:
+        repaired = reconcile_claim_counters()
+    finally:
+        close_driver()
+
+    print(json.dumps({"repaired": repaired}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
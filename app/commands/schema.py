@@ -0,0 +1,35 @@
+"""Create the Neo4j constraints and indexes ahead of a deployment.
+
+Usage:
+    PYTHONPATH="./app" python -m commands.schema [--check]
+"""
+
+import argparse
+import json
+
+from external.neo4j.driver import close_driver
+from external.neo4j.schema import bootstrap_schema, check_schema
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Create and verify the Neo4j schema used by the application."
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only report missing, populating or failed items",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        report = check_schema() if args.check else bootstrap_schema()
+    finally:
+        close_driver()
+
+    print(json.dumps({**report._asdict(), "ready": report.is_ready}, indent=2))
+    return 0 if report.is_ready else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
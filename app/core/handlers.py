@@ -1,20 +1,32 @@
+import math
+
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
-from core.logging.logger import get_logger
+from core.exceptions import AuthorizationErrorException
 from core.logging.context import (
     set_request_ctx_error_data_from_exception,
     set_request_ctx_http_data,
     set_request_ctx_log_data,
 )
-from core.exceptions import AuthorizationErrorException
+from core.logging.logger import get_logger
 from core.logging.serializers import ErrorContext
-from core.responses import BadRequestResponse, EntityNotFoundResponse, AuthorizationErrorResponse
-from external.neo4j.exceptions import EntityNotFoundError
-
+from core.responses import (
+    AuthorizationErrorResponse,
+    BadRequestResponse,
+    EntityNotFoundResponse,
+    ServiceUnavailableResponse,
+)
+from core.settings import get_settings
+from external.neo4j.exceptions import (
+    DatabaseUnavailableError,
+    EntityNotFoundError,
+    InvalidCursorError,
+)
 
 logger = get_logger()
+settings = get_settings()
 
 
 def catch_auth_exception(request: Request, exc: AuthorizationErrorException):
@@ -29,12 +41,16 @@ def catch_auth_exception(request: Request, exc: AuthorizationErrorException):
         401, UNAUTHORIZED
     """
     error_msg = AuthorizationErrorResponse(response_message=exc.detail)
-    error_context = ErrorContext(message=error_msg.response_message, kind=error_msg.response_code)
+    error_context = ErrorContext(
+        message=error_msg.response_message, kind=error_msg.response_code
+    )
 
     set_request_ctx_http_data(status_code=exc.status_code)
     set_request_ctx_log_data(error=error_context)
     logger.warning("Authorization fail.")
-    return JSONResponse(status_code=exc.status_code, content=error_msg.model_dump(by_alias=True))
+    return JSONResponse(
+        status_code=exc.status_code, content=error_msg.model_dump(by_alias=True)
+    )
 
 
 def catch_entity_not_found(request: Request, exc: EntityNotFoundError):
@@ -55,7 +71,10 @@ def catch_entity_not_found(request: Request, exc: EntityNotFoundError):
     set_request_ctx_http_data(status_code=status.HTTP_404_NOT_FOUND)
     set_request_ctx_log_data(error=error_context)
     logger.warning(f"{error_context.kind}. Detail: {error_context.message}")
-    return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=error_msg.model_dump(by_alias=True))
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content=error_msg.model_dump(by_alias=True),
+    )
 
 
 def catch_request_validation_exception(request: Request, exc: RequestValidationError):
@@ -73,9 +92,66 @@ def catch_request_validation_exception(request: Request, exc: RequestValidationE
     first_error_msg = f"Invalid request ({first_error.get('loc', 'base')}): {first_error.get('msg', 'none')}"
 
     error_msg = BadRequestResponse(response_message=first_error_msg)
-    error_context = ErrorContext(stack="None", message=first_error_msg, kind=exc.errors()[0].get("type", "none"))
+    error_context = ErrorContext(
+        stack="None", message=first_error_msg, kind=exc.errors()[0].get("type", "none")
+    )
 
     set_request_ctx_http_data(status_code=status.HTTP_400_BAD_REQUEST)
     set_request_ctx_log_data(error=error_context)
     logger.error("Request Validation Error")
-    return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=error_msg.model_dump(by_alias=True))
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content=error_msg.model_dump(by_alias=True),
+    )
+
+
+def catch_invalid_cursor(request: Request, exc: InvalidCursorError):
+    """
+    This is an exception handler which intercepts exceptions of type InvalidCursorError, raised when a pagination
+    cursor was not issued by this service.
+
+    Args:
+        request => the actual request
+        exc => the actual exception
+    Return:
+        400, BAD_REQUEST
+    """
+    error_context = set_request_ctx_error_data_from_exception(exc)
+    error_msg = BadRequestResponse(response_message=error_context.message)
+
+    set_request_ctx_http_data(status_code=status.HTTP_400_BAD_REQUEST)
+    set_request_ctx_log_data(error=error_context)
+    logger.warning(f"{error_context.kind}. Detail: {error_context.message}")
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content=error_msg.model_dump(by_alias=True),
+    )
+
+
+def catch_database_unavailable(request: Request, exc: DatabaseUnavailableError):
+    """
+    This is an exception handler which intercepts exceptions of type DatabaseUnavailableError, raised when a
+    transaction kept failing with transient errors until its retries were exhausted.
+
+    Args:
+        request => the actual request
+        exc => the actual exception
+    Return:
+        503, SERVICE_UNAVAILABLE
+    """
+    error_context = set_request_ctx_error_data_from_exception(exc)
+    error_msg = ServiceUnavailableResponse()
+
+    set_request_ctx_http_data(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    set_request_ctx_log_data(error=error_context)
+    logger.error(f"{error_context.kind}. Detail: {error_context.message}")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=error_msg.model_dump(by_alias=True),
+        # the retries already covered the deadline, ask clients to back off at least as long
+        headers={
+            "Retry-After": str(
+                math.ceil(settings.db_settings.transaction_retry_deadline)
+            )
+        },
+    )
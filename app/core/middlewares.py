@@ -0,0 +1,51 @@
+from collections.abc import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from core.settings import get_settings
+from external.neo4j import retry, routing
+
+settings = get_settings()
+
+
+async def propagate_bookmarks(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """
+    This is a middleware which binds the Neo4j bookmarks echoed by the client to the request, so its reads wait for
+    the writes the client has already seen, and returns the bookmarks of the request's writes.
+
+    Args:
+        request => the actual request
+        call_next => the next handler of the request
+    Return:
+        the response, with the X-Neo4j-Bookmarks header when the client has bookmarks
+    """
+    holder = routing.bind_bookmarks(
+        routing.parse_bookmarks_header(request.headers.get(routing.BOOKMARKS_HEADER))
+    )
+
+    response = await call_next(request)
+
+    if holder.values:
+        response.headers[routing.BOOKMARKS_HEADER] = routing.format_bookmarks_header(
+            holder.values
+        )
+    return response
+
+
+async def bind_retry_deadline(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """
+    This is a middleware which starts the transaction retry deadline of the request, shared by all its operations, so
+    the retries of a request stop after DB_TRANSACTION_RETRY_DEADLINE seconds whatever the number of operations.
+
+    Args:
+        request => the actual request
+        call_next => the next handler of the request
+    Return:
+        the response
+    """
+    retry.bind_request_deadline(settings.db_settings.transaction_retry_deadline)
+    return await call_next(request)
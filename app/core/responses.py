@@ -23,6 +23,15 @@ class EntityNotFoundResponse(BaseResponse):
     response_message: str = Field(alias="responseMessage", default="Entity not found")
 
 
+class ServiceUnavailableResponse(BaseResponse):
+    """Response model for HTTP status code 503."""
+
+    response_code: str = Field(alias="responseCode", default="SERVICE_UNAVAILABLE")
+    response_message: str = Field(
+        alias="responseMessage", default="Service temporarily unavailable"
+    )
+
+
 class BadRequestResponse(BaseResponse):
     """Response model for HTTP status code 400."""
 
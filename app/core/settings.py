@@ -1,14 +1,16 @@
 import logging
-from dotenv import find_dotenv
 from functools import lru_cache
-from typing import cast
+from typing import Any, Literal, cast
 
-from pydantic import SecretStr
+from dotenv import find_dotenv
+from pydantic import SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class DotEnvSupportSettings(BaseSettings):
-    model_config = SettingsConfigDict(env_file=find_dotenv(".env"), env_file_encoding="utf-8", extra="ignore")
+    model_config = SettingsConfigDict(
+        env_file=find_dotenv(".env"), env_file_encoding="utf-8", extra="ignore"
+    )
 
 
 class DB(DotEnvSupportSettings):
@@ -20,6 +22,93 @@ class DB(DotEnvSupportSettings):
     username: str
     password: SecretStr
 
+    ###
+    # Data path used by the views:
+    # - sync: blocking neomodel operations run in the threadpool
+    # - async: native asyncio operations on the async Neo4j driver
+    ###
+    driver_mode: Literal["sync", "async"] = "sync"
+    # where the graph lives: Neo4j, or the process memory (`external.memory`) to run the API without a database
+    backend: Literal["neo4j", "memory"] = "neo4j"
+
+    ###
+    # Connection pool of the shared driver
+    ###
+    max_connection_pool_size: int = 100
+    # seconds
+    max_connection_lifetime: float = 3600
+    # seconds to wait for a free connection before failing
+    connection_acquisition_timeout: float = 60
+    keep_alive: bool = True
+    # connections opened at startup so the first requests after a deploy don't pay connect latency
+    pool_warmup_connections: int = 0
+
+    # rows written per UNWIND statement (and transaction) by the bulk operations
+    bulk_batch_size: int = 1000
+    # nodes or links read per query (and transaction) by the export
+    export_page_size: int = 1000
+
+    ###
+    # Read-through cache of entities looked up by pid (per process)
+    ###
+    entity_cache_enabled: bool = False
+    entity_cache_max_size: int = 10000
+    # seconds
+    entity_cache_ttl: float = 60
+
+    ###
+    # Bloom filters of the known pids per label (per process), see `external.neo4j.existence`
+    ###
+    existence_filter_enabled: bool = False
+    existence_filter_false_positive_rate: float = 0.01
+    # memory budget of each label's filter
+    existence_filter_max_bytes: int = 64 * 1024 * 1024
+    # seconds between rebuilds, required: a pid created by another process (worker, replica, bulk import) is reported
+    # as missing until the next rebuild
+    existence_filter_refresh_interval: float = 60
+
+    # share one query between concurrent identical reads, see `external.neo4j.coalescing`
+    single_flight_enabled: bool = True
+
+    ###
+    # Retries of transactions failing with transient errors, see `external.neo4j.retry`
+    ###
+    transaction_retry_max_attempts: int = 5
+    # seconds, the backoff doubles from the initial delay up to the max delay, with full jitter
+    transaction_retry_initial_delay: float = 0.1
+    transaction_retry_max_delay: float = 2
+    # seconds an operation may spend retrying
+    transaction_retry_deadline: float = 10
+
+    # seconds between repairs of the claim counters on Company/Person, 0 disables them
+    claim_counters_reconcile_interval: float = 0
+
+    # create the constraints and indexes from `external.neo4j.schema` at startup
+    schema_bootstrap: bool = True
+
+    @model_validator(mode="after")
+    def check_existence_filter_refresh(self) -> "DB":
+        # the filters only see the pids created by this process, a filter never rebuilt 404s the others forever
+        if (
+            self.existence_filter_enabled
+            and self.existence_filter_refresh_interval <= 0
+        ):
+            raise ValueError(
+                "DB_EXISTENCE_FILTER_REFRESH_INTERVAL must be positive when the existence filter is on"
+            )
+        return self
+
+    @property
+    def pool_config(self) -> dict[str, Any]:
+        return {
+            "max_connection_pool_size": self.max_connection_pool_size,
+            "max_connection_lifetime": self.max_connection_lifetime,
+            "connection_acquisition_timeout": self.connection_acquisition_timeout,
+            "keep_alive": self.keep_alive,
+            # transactions are retried by `external.neo4j.retry` instead
+            "max_transaction_retry_time": 0,
+        }
+
     @property
     def auth(self) -> tuple[str, str]:
         return self.username, self.password.get_secret_value()
@@ -51,6 +140,26 @@ class Settings(DotEnvSupportSettings):
     # value to use when redacting info
     redacted_value: str = "***redacted***"
 
+    # maximum number of items accepted by the bulk endpoints
+    bulk_max_items: int = 10000
+    # maximum number of ids accepted by the batch-get endpoints
+    batch_get_max_ids: int = 1000
+
+    ###
+    # Pagination of the listing endpoints
+    ###
+    page_default_limit: int = 100
+    page_max_limit: int = 1000
+    # records written per chunk when streaming a listing as NDJSON
+    stream_chunk_size: int = 500
+
+    ###
+    # Bounds of the subgraph endpoint
+    ###
+    subgraph_max_depth: int = 4
+    subgraph_max_nodes: int = 1000
+    subgraph_max_edges: int = 5000
+
     auth_username: str
     auth_password: SecretStr
 
@@ -0,0 +1,707 @@
+"""In-memory graph backend, selected with `DB_BACKEND=memory`.
+
+Nodes are kept per label in dicts keyed by pid, as the rows Neo4j would store (dates as timestamps, claim counters
+included, unset properties left out), and relationships in adjacency sets per type, in both directions. The
+operations follow the Cypher of `external.neo4j.query`: MERGE by pid, claim counters updated with the relationship
+that creates them, the same keyset cursors and errors. That lets the HTTP, serialization and logging layers be
+benchmarked and load tested without a database.
+
+Data lives in the process, so every worker has its own graph and it is gone on restart. Search ranks nodes by the
+number of matched terms, not by Lucene scores.
+"""
+
+import re
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from neomodel import StructuredNode
+from neomodel.exceptions import UniqueProperty
+
+from external.neo4j.bulk import (
+    RELATIONSHIP_ENDPOINTS,
+    BulkItemResult,
+    BulkLinkResult,
+    group_links,
+    merge_results,
+    prepare_rows,
+    summarize_links,
+)
+from external.neo4j.counters import STATUS_COUNTERS
+from external.neo4j.exceptions import EntityNotFoundError
+from external.neo4j.export import EXPORT_KINDS, node_row
+from external.neo4j.pagination import (
+    UNDATED,
+    Page,
+    build_page,
+    claim_cursor_key,
+    decode_cursor,
+    keyset_fields,
+    search_cursor_key,
+)
+from external.neo4j.query import (
+    ClaimStats,
+    MissingLink,
+    SearchHit,
+    Subgraph,
+    SubgraphEdge,
+    submission_timestamp,
+)
+from external.neo4j.schema import FULLTEXT_PROPERTIES
+from external.neo4j.serializers import MODELS
+
+# relationship type -> whether the claim holder is the start node, for the relationships counted on the holder
+_CLAIM_HOLDER_IS_START = {"SUBMITTED": True, "HAS_CLAIMANT": False}
+
+_SEARCH_TERM = re.compile(r"\w+")
+
+# (label, pid) of a node
+NodeKey = tuple[str, str]
+
+
+def _project(row: dict[str, Any], fields: Iterable[str] | None) -> dict[str, Any]:
+    """Copy of a stored row, or its map projection on `fields` (absent properties are null, like in Cypher)."""
+    return dict(row) if fields is None else {field: row.get(field) for field in fields}
+
+
+def _submitted_key(row: dict[str, Any]) -> tuple[bool, float, str]:
+    # ORDER BY submission_date, pid: nulls last
+    date = row.get("submission_date")
+    return date is None, date or 0.0, row["pid"]
+
+
+def _after_keyset(
+    row: dict[str, Any], after_date: float | None, after_pid: str | None
+) -> bool:
+    if after_pid is None:
+        return True
+    # undated rows are listed last, keyed by the `UNDATED` sentinel like in the cursor
+    date = row.get("submission_date")
+    date = UNDATED if date is None else date
+    return date > after_date or (date == after_date and row["pid"] > after_pid)
+
+
+def _claim_filter(
+    since: datetime | None, until: datetime | None, status: str | None
+) -> Callable[[dict[str, Any]], bool]:
+    """Predicate of the claims submitted in [since, until) with `status`, like the Cypher of the holder listings."""
+    since_ts, until_ts = submission_timestamp(since), submission_timestamp(until)
+
+    def matches(row: dict[str, Any]) -> bool:
+        date = row.get("submission_date")
+        if (since_ts is not None or until_ts is not None) and date is None:
+            return False
+        return (
+            (since_ts is None or date >= since_ts)
+            and (until_ts is None or date < until_ts)
+            and (status is None or row.get("status") == status)
+        )
+
+    return matches
+
+
+def _stats_ends(linked: set[str], pid: str | None, grouped: bool) -> list[str | None]:
+    """Companies or persons of a claim in the stats rows: only `pid` when filtered on (MATCH), the linked ones or null
+    when grouped on (OPTIONAL MATCH), a single null row otherwise."""
+    if pid is not None:
+        return [pid] if pid in linked else []
+    if grouped:
+        return list(linked) or [None]
+    return [None]
+
+
+def _stats_key(value: Any) -> tuple[bool, Any]:
+    # ORDER BY of the grouping columns: nulls last
+    return value is None, value if value is not None else ""
+
+
+class InMemoryRepository:
+    """`external.repository.Repository` over dicts and adjacency sets, safe to share between threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self.clear_db()
+
+    def check_db_connection(self) -> None:
+        return None
+
+    def clear_db(self) -> None:
+        with self._lock:
+            # label -> pid -> stored properties
+            self._nodes: dict[str, dict[str, dict[str, Any]]] = {
+                label: {} for label in MODELS
+            }
+            # relationship type -> start pid -> end pids, and the reverse
+            self._out: dict[str, defaultdict[str, set[str]]] = {
+                rel: defaultdict(set) for rel in RELATIONSHIP_ENDPOINTS
+            }
+            self._in: dict[str, defaultdict[str, set[str]]] = {
+                rel: defaultdict(set) for rel in RELATIONSHIP_ENDPOINTS
+            }
+
+    ###
+    # Entities
+    ###
+    def _entity(self, label: str, row: dict[str, Any]) -> StructuredNode:
+        model = MODELS[label]
+        properties = model.defined_properties(aliases=False, rels=False)
+        return model(
+            **{name: properties[name].inflate(value) for name, value in row.items()}
+        )
+
+    def _get_node(
+        self, label: str, pid: str, fields: tuple[str, ...] | None = None
+    ) -> StructuredNode | dict[str, Any]:
+        with self._lock:
+            if (row := self._nodes[label].get(pid)) is None:
+                raise EntityNotFoundError(f"{label} with id:{pid} not found")
+            return self._entity(label, row) if fields is None else _project(row, fields)
+
+    def _create_node(self, label: str, **kwargs) -> StructuredNode:
+        # deflated the way `StructuredNode.save()` would, without the nulls Neo4j does not store
+        row = {
+            key: value
+            for key, value in prepare_rows(MODELS[label], [kwargs]).rows[0].items()
+            if value is not None
+        }
+        with self._lock:
+            if row["pid"] in self._nodes[label]:
+                raise UniqueProperty(
+                    f"Node({label}) already exists with property `pid` = '{row['pid']}'"
+                )
+            self._nodes[label][row["pid"]] = row
+            return self._entity(label, row)
+
+    def batch_get(
+        self, label: str, pids: tuple[str, ...]
+    ) -> list[StructuredNode | None]:
+        with self._lock:
+            nodes = self._nodes[label]
+            return [
+                self._entity(label, nodes[pid]) if pid in nodes else None
+                for pid in pids
+            ]
+
+    def get_person(
+        self, person_id: str, fields: tuple[str, ...] | None = None
+    ) -> StructuredNode | dict[str, Any]:
+        return self._get_node("Person", person_id, fields)
+
+    def create_person(self, **kwargs) -> StructuredNode:
+        return self._create_node("Person", **kwargs)
+
+    def get_company(
+        self, company_id: str, fields: tuple[str, ...] | None = None
+    ) -> StructuredNode | dict[str, Any]:
+        return self._get_node("Company", company_id, fields)
+
+    def create_company(self, **kwargs) -> StructuredNode:
+        return self._create_node("Company", **kwargs)
+
+    def get_claim(
+        self, claim_id: str, fields: tuple[str, ...] | None = None
+    ) -> StructuredNode | dict[str, Any]:
+        return self._get_node("Claim", claim_id, fields)
+
+    def create_claim(self, **kwargs) -> StructuredNode:
+        return self._create_node("Claim", **kwargs)
+
+    def update_claim_status(self, claim_id: str, status: str) -> StructuredNode:
+        with self._lock:
+            if (claim := self._nodes["Claim"].get(claim_id)) is None:
+                raise EntityNotFoundError(f"Claim with id:{claim_id} not found")
+
+            previous, claim["status"] = claim.get("status"), status
+            if previous != status:
+                for holder in self._claim_holders(claim_id):
+                    for counted, prop in STATUS_COUNTERS.items():
+                        holder[prop] = (
+                            holder.get(prop, 0)
+                            + (counted == status)
+                            - (counted == previous)
+                        )
+            return self._entity("Claim", claim)
+
+    def get_document(
+        self, document_id: str, fields: tuple[str, ...] | None = None
+    ) -> StructuredNode | dict[str, Any]:
+        return self._get_node("Document", document_id, fields)
+
+    def create_document(self, **kwargs) -> StructuredNode:
+        return self._create_node("Document", **kwargs)
+
+    ###
+    # Bulk
+    ###
+    def _bulk_create(
+        self, label: str, items: list[dict[str, Any]]
+    ) -> list[BulkItemResult]:
+        prepared = prepare_rows(MODELS[label], items)
+        created_by_pid = {}
+        with self._lock:
+            nodes = self._nodes[label]
+            for row in prepared.rows:
+                created_by_pid[row["pid"]] = created = row["pid"] not in nodes
+                if created:
+                    nodes[row["pid"]] = {
+                        key: value for key, value in row.items() if value is not None
+                    }
+        return merge_results(created_by_pid, prepared)
+
+    def bulk_create_persons(self, items: list[dict[str, Any]]) -> list[BulkItemResult]:
+        return self._bulk_create("Person", items)
+
+    def bulk_create_companies(
+        self, items: list[dict[str, Any]]
+    ) -> list[BulkItemResult]:
+        return self._bulk_create("Company", items)
+
+    def bulk_create_claims(self, items: list[dict[str, Any]]) -> list[BulkItemResult]:
+        return self._bulk_create("Claim", items)
+
+    def bulk_create_documents(
+        self, items: list[dict[str, Any]]
+    ) -> list[BulkItemResult]:
+        return self._bulk_create("Document", items)
+
+    def bulk_create_relationships(self, links: list[dict[str, str]]) -> BulkLinkResult:
+        missing = []
+        with self._lock:
+            for relationship, group in group_links(links).items():
+                from_model, to_model = RELATIONSHIP_ENDPOINTS[relationship]
+                for link in group:
+                    from_found, to_found, _ = self._merge_relationship(
+                        relationship, link["from_id"], link["to_id"]
+                    )
+                    if not (from_found and to_found):
+                        link = MissingLink(
+                            link["from_id"], link["to_id"], from_found, to_found
+                        )
+                        missing.append((from_model.__label__, to_model.__label__, link))
+        return summarize_links(total=len(links), missing=missing)
+
+    ###
+    # Relationships
+    ###
+    def _merge_relationship(
+        self, relationship: str, from_id: str, to_id: str
+    ) -> tuple[bool, bool, bool]:
+        """MERGE the relationship when both ends exist, counting a new claim on its holder; returns which ends exist
+        and whether the relationship was created."""
+        from_model, to_model = RELATIONSHIP_ENDPOINTS[relationship]
+        from_found = from_id in self._nodes[from_model.__label__]
+        to_found = to_id in self._nodes[to_model.__label__]
+        created = (
+            from_found and to_found and to_id not in self._out[relationship][from_id]
+        )
+        if created:
+            self._out[relationship][from_id].add(to_id)
+            self._in[relationship][to_id].add(from_id)
+            self._count_claim(relationship, from_id, to_id)
+        return from_found, to_found, created
+
+    def _count_claim(self, relationship: str, from_id: str, to_id: str) -> None:
+        if relationship not in _CLAIM_HOLDER_IS_START:
+            return
+        from_model, to_model = RELATIONSHIP_ENDPOINTS[relationship]
+        if _CLAIM_HOLDER_IS_START[relationship]:
+            holder, claim = (
+                self._nodes[from_model.__label__][from_id],
+                self._nodes[to_model.__label__][to_id],
+            )
+        else:
+            holder, claim = (
+                self._nodes[to_model.__label__][to_id],
+                self._nodes[from_model.__label__][from_id],
+            )
+
+        holder["claim_count"] = holder.get("claim_count", 0) + 1
+        holder["claim_amount"] = holder.get("claim_amount", 0) + claim.get("amount", 0)
+        for status, prop in STATUS_COUNTERS.items():
+            holder[prop] = holder.get(prop, 0) + (claim.get("status") == status)
+
+    def _claim_holders(self, claim_id: str) -> list[dict[str, Any]]:
+        persons = [
+            self._nodes["Person"][pid]
+            for pid in self._in["SUBMITTED"].get(claim_id, ())
+        ]
+        return persons + [
+            self._nodes["Company"][pid]
+            for pid in self._out["HAS_CLAIMANT"].get(claim_id, ())
+        ]
+
+    def _create_relationship(self, relationship: str, from_id: str, to_id: str) -> bool:
+        from_model, to_model = RELATIONSHIP_ENDPOINTS[relationship]
+        with self._lock:
+            from_found, to_found, created = self._merge_relationship(
+                relationship, from_id, to_id
+            )
+        if not from_found:
+            raise EntityNotFoundError(
+                f"{from_model.__label__} with id:{from_id} not found"
+            )
+        if not to_found:
+            raise EntityNotFoundError(f"{to_model.__label__} with id:{to_id} not found")
+        return created
+
+    def create_person_company_relationship(
+        self, person_id: str, company_id: str
+    ) -> bool:
+        return self._create_relationship("WORKS_FOR", person_id, company_id)
+
+    def create_person_claim_relationship(self, person_id: str, claim_id: str) -> bool:
+        return self._create_relationship("SUBMITTED", person_id, claim_id)
+
+    def create_person_document_relationship(
+        self, person_id: str, document_id: str
+    ) -> bool:
+        return self._create_relationship("SENT", person_id, document_id)
+
+    def create_claim_company_relationship(self, claim_id: str, company_id: str) -> bool:
+        return self._create_relationship("HAS_CLAIMANT", claim_id, company_id)
+
+    ###
+    # Listings, search and aggregates
+    ###
+    def _person_claims(self, person_id: str) -> list[dict[str, Any]]:
+        return [
+            self._nodes["Claim"][pid]
+            for pid in self._out["SUBMITTED"].get(person_id, ())
+        ]
+
+    def _company_claims(self, company_id: str) -> list[dict[str, Any]]:
+        return [
+            self._nodes["Claim"][pid]
+            for pid in self._in["HAS_CLAIMANT"].get(company_id, ())
+        ]
+
+    def _page(
+        self,
+        rows: Iterable[dict[str, Any]],
+        limit: int,
+        cursor: str | None,
+        fields: tuple[str, ...] | None,
+    ) -> Page:
+        after_date, after_pid = (
+            decode_cursor(cursor, size=2) if cursor else (None, None)
+        )
+        rows = sorted(
+            (row for row in rows if _after_keyset(row, after_date, after_pid)),
+            key=_submitted_key,
+        )
+        items = [_project(row, keyset_fields(fields)) for row in rows[: limit + 1]]
+        return build_page(items, limit, cursor_key=claim_cursor_key)
+
+    def get_claims_by_person(
+        self,
+        person_id: str,
+        limit: int,
+        cursor: str | None = None,
+        fields: tuple[str, ...] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        status: str | None = None,
+    ) -> Page:
+        matches = _claim_filter(since, until, status)
+        with self._lock:
+            page = self._page(
+                filter(matches, self._person_claims(person_id)), limit, cursor, fields
+            )
+        if (
+            not page.items
+            and cursor is None
+            and since is None
+            and until is None
+            and status is None
+        ):
+            raise EntityNotFoundError(f"No claims for person with id:{person_id} found")
+        return page
+
+    def get_claims_by_company(
+        self,
+        company_id: str,
+        limit: int,
+        cursor: str | None = None,
+        fields: tuple[str, ...] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        status: str | None = None,
+    ) -> Page:
+        matches = _claim_filter(since, until, status)
+        with self._lock:
+            page = self._page(
+                filter(matches, self._company_claims(company_id)), limit, cursor, fields
+            )
+        if (
+            not page.items
+            and cursor is None
+            and since is None
+            and until is None
+            and status is None
+        ):
+            raise EntityNotFoundError(
+                f"No claims associated to Company with id:{company_id} found"
+            )
+        return page
+
+    def _get_submitted(
+        self,
+        label: str,
+        limit: int,
+        cursor: str | None,
+        fields: tuple[str, ...] | None,
+        since: datetime | None,
+        until: datetime | None,
+        status: str | None = None,
+    ) -> Page:
+        since_ts, until_ts = submission_timestamp(since), submission_timestamp(until)
+
+        def in_window(row: dict[str, Any]) -> bool:
+            date = row.get("submission_date")
+            return (
+                date is not None
+                and (since_ts is None or date >= since_ts)
+                and (until_ts is None or date < until_ts)
+                and (status is None or row.get("status") == status)
+            )
+
+        with self._lock:
+            return self._page(
+                filter(in_window, self._nodes[label].values()), limit, cursor, fields
+            )
+
+    def get_claims(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        status: str | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> Page:
+        return self._get_submitted(
+            "Claim", limit, cursor, fields, since=since, until=until, status=status
+        )
+
+    def get_documents(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> Page:
+        return self._get_submitted(
+            "Document", limit, cursor, fields, since=since, until=until
+        )
+
+    def stream_claims_by_person(
+        self,
+        person_id: str,
+        fields: tuple[str, ...] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        status: str | None = None,
+    ) -> Iterator[Any]:
+        matches = _claim_filter(since, until, status)
+        with self._lock:
+            claims = [
+                _project(row, fields)
+                for row in self._person_claims(person_id)
+                if matches(row)
+            ]
+        if not claims and since is None and until is None and status is None:
+            raise EntityNotFoundError(f"No claims for person with id:{person_id} found")
+        return iter(claims)
+
+    def stream_claims_by_company(
+        self,
+        company_id: str,
+        fields: tuple[str, ...] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        status: str | None = None,
+    ) -> Iterator[Any]:
+        matches = _claim_filter(since, until, status)
+        with self._lock:
+            claims = [
+                _project(row, fields)
+                for row in self._company_claims(company_id)
+                if matches(row)
+            ]
+        if not claims and since is None and until is None and status is None:
+            raise EntityNotFoundError(
+                f"No claims associated to Company with id:{company_id} found"
+            )
+        return iter(claims)
+
+    def get_company_by_person(self, person_id: str) -> Any:
+        with self._lock:
+            if companies := self._out["WORKS_FOR"].get(person_id):
+                return dict(self._nodes["Company"][next(iter(companies))])
+        raise EntityNotFoundError(
+            f"Person with id:{person_id} is not assiociated with any Company"
+        )
+
+    def search(
+        self, label: str, text: str, limit: int, cursor: str | None = None
+    ) -> Page:
+        after_score, after_pid = (
+            decode_cursor(cursor, size=2) if cursor else (None, None)
+        )
+        terms = set(_SEARCH_TERM.findall(text.lower()))
+        hits = []
+        with self._lock:
+            for row in self._nodes[label].values():
+                words = _SEARCH_TERM.findall(
+                    " ".join(
+                        str(row.get(prop, "")) for prop in FULLTEXT_PROPERTIES[label]
+                    )
+                )
+                score = float(sum(word.lower() in terms for word in words))
+                if score and (
+                    after_score is None
+                    or score < after_score
+                    or (score == after_score and row["pid"] > after_pid)
+                ):
+                    hits.append(SearchHit(node=dict(row), score=score))
+        hits.sort(key=lambda hit: (-hit.score, hit.node["pid"]))
+        return build_page(hits[: limit + 1], limit, cursor_key=search_cursor_key)
+
+    def get_claim_stats(
+        self,
+        group_by: tuple[str, ...],
+        company_id: str | None = None,
+        person_id: str | None = None,
+    ) -> list[ClaimStats]:
+        # one row per matched (claim, company, person), like the MATCH/OPTIONAL MATCH rows of `claim_stats_query`
+        groups: dict[tuple, list[float | None]] = defaultdict(list)
+        with self._lock:
+            for claim_id, claim in self._nodes["Claim"].items():
+                companies = self._out["HAS_CLAIMANT"].get(claim_id, set())
+                persons = self._in["SUBMITTED"].get(claim_id, set())
+                companies = _stats_ends(
+                    companies, company_id, grouped="company" in group_by
+                )
+                persons = _stats_ends(persons, person_id, grouped="person" in group_by)
+                for company in companies:
+                    for person in persons:
+                        values = {
+                            "status": claim.get("status"),
+                            "company": company,
+                            "person": person,
+                        }
+                        groups[tuple(values[group] for group in group_by)].append(
+                            claim.get("amount")
+                        )
+
+        if not group_by and not groups:
+            groups[()] = []
+        stats = []
+        for key in sorted(groups, key=lambda key: [_stats_key(value) for value in key]):
+            amounts = [amount for amount in groups[key] if amount is not None]
+            stats.append(
+                ClaimStats(
+                    group=dict(zip(group_by, key)),
+                    count=len(groups[key]),
+                    sum=float(sum(amounts)),
+                    min=min(amounts, default=None),
+                    max=max(amounts, default=None),
+                    avg=sum(amounts) / len(amounts) if amounts else None,
+                )
+            )
+        return stats
+
+    def _neighbours(
+        self, node: NodeKey, relationships: tuple[str, ...]
+    ) -> Iterator[NodeKey]:
+        label, pid = node
+        for relationship in relationships:
+            from_model, to_model = RELATIONSHIP_ENDPOINTS[relationship]
+            if label == from_model.__label__:
+                yield from (
+                    (to_model.__label__, end)
+                    for end in self._out[relationship].get(pid, ())
+                )
+            if label == to_model.__label__:
+                yield from (
+                    (from_model.__label__, start)
+                    for start in self._in[relationship].get(pid, ())
+                )
+
+    def _reachable(
+        self, root: NodeKey, relationships: tuple[str, ...], depth: int
+    ) -> Iterator[NodeKey]:
+        """Distinct nodes up to `depth` hops from `root` in either direction, breadth first, without the root."""
+        seen, frontier = {root}, [root]
+        for _ in range(depth):
+            next_frontier = []
+            for node in frontier:
+                for neighbour in self._neighbours(node, relationships):
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        next_frontier.append(neighbour)
+                        yield neighbour
+            frontier = next_frontier
+
+    def get_subgraph(
+        self,
+        label: str,
+        pid: str,
+        relationships: tuple[str, ...],
+        depth: int,
+        max_nodes: int,
+        max_edges: int,
+    ) -> Subgraph:
+        with self._lock:
+            if pid not in self._nodes[label]:
+                raise EntityNotFoundError(f"{label} with id:{pid} not found")
+
+            neighbours = list(
+                islice(self._reachable((label, pid), relationships, depth), max_nodes)
+            )
+            keys = [(label, pid), *neighbours[: max_nodes - 1]]
+            included = set(keys)
+            edges: list[SubgraphEdge] = []
+            for node_label, node_pid in keys:
+                for relationship in relationships:
+                    from_model, to_model = RELATIONSHIP_ENDPOINTS[relationship]
+                    if node_label != from_model.__label__:
+                        continue
+                    for end in self._out[relationship].get(node_pid, ()):
+                        if (to_model.__label__, end) in included and len(
+                            edges
+                        ) <= max_edges:
+                            edges.append(SubgraphEdge(node_pid, relationship, end))
+
+            return Subgraph(
+                nodes=[
+                    dict(self._nodes[node_label][node_pid])
+                    for node_label, node_pid in keys
+                ],
+                edges=edges[:max_edges],
+                truncated=len(neighbours) >= max_nodes or len(edges) > max_edges,
+            )
+
+    def export_rows(
+        self, kind: str, page_size: int | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Rows of `kind` in pid order, copied at once: everything is in memory already, there is nothing to page."""
+        with self._lock:
+            if (model := EXPORT_KINDS[kind]) is not None:
+                nodes = self._nodes[model.__label__]
+                return iter([node_row(model, nodes[pid]) for pid in sorted(nodes)])
+            return iter(
+                [
+                    {"from_id": from_id, "to_id": to_id, "type": relationship}
+                    for relationship in RELATIONSHIP_ENDPOINTS
+                    for from_id, ends in sorted(self._out[relationship].items())
+                    for to_id in sorted(ends)
+                ]
+            )
+
+
+memory_repository = InMemoryRepository()
@@ -0,0 +1,624 @@
+"""Native asyncio counterparts of `external.neo4j.operations` built on the async Neo4j driver.
+
+Every public function mirrors the sync operation with the same name and signature so the views can switch between the
+two data paths through the `DB_DRIVER_MODE` setting.
+"""
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any
+
+from neo4j import AsyncResult, AsyncSession, Record
+from neo4j.graph import Node
+from neomodel import StructuredNode
+
+from core.settings import get_settings
+from external.neo4j import async_query as aq
+from external.neo4j import query as q
+from external.neo4j.bulk import (
+    RELATIONSHIP_ENDPOINTS,
+    BulkItemResult,
+    BulkLinkResult,
+    group_links,
+    iter_batches,
+    merge_results,
+    prepare_rows,
+    summarize_links,
+)
+from external.neo4j.cache import entity_cache
+from external.neo4j.coalescing import single_flight
+from external.neo4j.driver import get_async_driver
+from external.neo4j.exceptions import EntityNotFoundError
+from external.neo4j.existence import existence_filter
+from external.neo4j.export import EXPORT_KINDS, node_row
+from external.neo4j.pagination import (
+    Page,
+    build_page,
+    claim_cursor_key,
+    decode_cursor,
+    keyset_fields,
+    search_cursor_key,
+)
+from external.neo4j.query import ClaimStats, Subgraph
+from external.neo4j.retry import transaction_retry
+from external.neo4j.routing import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    record_bookmarks,
+    session_config,
+)
+from external.neo4j.schema import fulltext_index_name
+from external.neo4j.serializers import MODELS, Claim, Company, Document, Person
+
+settings = get_settings()
+db_settings = settings.db_settings
+
+
+@asynccontextmanager
+async def get_session(access_mode: str) -> AsyncIterator[AsyncSession]:
+    async with get_async_driver().session(**session_config(access_mode)) as session:
+        yield session
+
+
+async def _read(tx_function: Callable[..., Awaitable[Any]], **kwargs) -> Any:
+    async def attempt() -> Any:
+        async with get_session(READ_ACCESS) as session:
+            return await session.execute_read(tx_function, **kwargs)
+
+    return await transaction_retry.arun(attempt)
+
+
+async def _write(tx_function: Callable[..., Awaitable[Any]], **kwargs) -> Any:
+    async def attempt() -> Any:
+        async with get_session(WRITE_ACCESS) as session:
+            result = await session.execute_write(tx_function, **kwargs)
+            record_bookmarks(await session.last_bookmarks())
+        return result
+
+    return await transaction_retry.arun(attempt)
+
+
+async def check_db_connection() -> None:
+    await get_async_driver().verify_connectivity()
+
+
+async def clear_db() -> None:
+    # CALL IN TRANSACTIONS needs an auto-commit transaction
+    async with get_session(WRITE_ACCESS) as session:
+        result = await session.run(q.CLEAR_DB_QUERY)
+        await result.consume()
+
+
+async def _get_node(
+    model: type[StructuredNode], pid: str, fields: tuple[str, ...] | None = None
+) -> StructuredNode | dict[str, Any]:
+    label = model.__label__
+    # a miss only means the node was not created through this process since the last filter build
+    known = existence_filter.might_contain(label, pid)
+    if fields is not None and not entity_cache.enabled:
+        node = await _read(aq.get_node_by_pid, label=label, pid=pid, fields=fields)
+    else:
+        node = await entity_cache.aget_or_load(
+            label, pid, lambda: _load_node(model, pid)
+        )
+    if node:
+        if not known:
+            existence_filter.add_missed(label, pid)
+        return node
+    raise EntityNotFoundError(f"{label} with id:{pid} not found")
+
+
+async def _load_node(model: type[StructuredNode], pid: str) -> StructuredNode | None:
+    node = await _read(aq.get_node_by_pid, label=model.__label__, pid=pid)
+    return model.inflate(node) if node else None
+
+
+async def _load_nodes(
+    model: type[StructuredNode], pids: list[str]
+) -> dict[str, StructuredNode]:
+    nodes = await _read(aq.get_nodes_by_pids, label=model.__label__, pids=pids)
+    return {node["pid"]: model.inflate(node) for node in nodes}
+
+
+@single_flight.acoalesce
+async def batch_get(label: str, pids: tuple[str, ...]) -> list[StructuredNode | None]:
+    model = MODELS[label]
+    unknown = [pid for pid in pids if not existence_filter.might_contain(label, pid)]
+    found = await entity_cache.aget_many_or_load(
+        label, pids, lambda missing: _load_nodes(model, missing)
+    )
+    existence_filter.add_missed(label, *(pid for pid in unknown if pid in found))
+    return [found.get(pid) for pid in pids]
+
+
+async def _create_node(model: type[StructuredNode], **kwargs) -> StructuredNode:
+    # Build the neomodel instance first so defaults, validation and property deflation match `save()`.
+    instance = model(**kwargs)
+    properties = model.deflate(instance.__properties__, instance)
+
+    node = await _write(aq.create_node, label=model.__label__, properties=properties)
+    entity_cache.invalidate(model.__label__, properties["pid"])
+    existence_filter.add(model.__label__, properties["pid"])
+    return model.inflate(node)
+
+
+@single_flight.acoalesce
+async def get_person(
+    person_id: str, fields: tuple[str, ...] | None = None
+) -> StructuredNode | dict[str, Any]:
+    return await _get_node(Person, person_id, fields)
+
+
+async def create_person(**kwargs) -> StructuredNode:
+    return await _create_node(Person, **kwargs)
+
+
+@single_flight.acoalesce
+async def get_company(
+    company_id: str, fields: tuple[str, ...] | None = None
+) -> StructuredNode | dict[str, Any]:
+    return await _get_node(Company, company_id, fields)
+
+
+async def create_company(**kwargs) -> StructuredNode:
+    return await _create_node(Company, **kwargs)
+
+
+@single_flight.acoalesce
+async def get_claim(
+    claim_id: str, fields: tuple[str, ...] | None = None
+) -> StructuredNode | dict[str, Any]:
+    return await _get_node(Claim, claim_id, fields)
+
+
+async def create_claim(**kwargs) -> StructuredNode:
+    return await _create_node(Claim, **kwargs)
+
+
+async def update_claim_status(claim_id: str, status: str) -> StructuredNode:
+    result = await _write(aq.update_claim_status, claim_id=claim_id, status=status)
+    if result is None:
+        raise EntityNotFoundError(f"Claim with id:{claim_id} not found")
+
+    entity_cache.invalidate(Claim.__label__, claim_id)
+    for label, pid in result.holders:
+        entity_cache.invalidate(label, pid)
+    return Claim.inflate(result.claim)
+
+
+@single_flight.acoalesce
+async def get_document(
+    document_id: str, fields: tuple[str, ...] | None = None
+) -> StructuredNode | dict[str, Any]:
+    return await _get_node(Document, document_id, fields)
+
+
+async def create_document(**kwargs) -> StructuredNode:
+    return await _create_node(Document, **kwargs)
+
+
+###
+# Bulk Operations
+###
+
+
+async def bulk_create_persons(items: list[dict[str, Any]]) -> list[BulkItemResult]:
+    return await _bulk_create(Person, items)
+
+
+async def bulk_create_companies(items: list[dict[str, Any]]) -> list[BulkItemResult]:
+    return await _bulk_create(Company, items)
+
+
+async def bulk_create_claims(items: list[dict[str, Any]]) -> list[BulkItemResult]:
+    return await _bulk_create(Claim, items)
+
+
+async def bulk_create_documents(items: list[dict[str, Any]]) -> list[BulkItemResult]:
+    return await _bulk_create(Document, items)
+
+
+async def _bulk_create(
+    model: type[StructuredNode], items: list[dict[str, Any]]
+) -> list[BulkItemResult]:
+    prepared = prepare_rows(model, items)
+
+    # One transaction per UNWIND batch
+    created_by_pid: dict[str, bool] = {}
+    for batch in iter_batches(prepared.rows, db_settings.bulk_batch_size):
+        created_by_pid.update(
+            await _write(aq.bulk_merge_nodes, label=model.__label__, rows=batch)
+        )
+    entity_cache.invalidate(model.__label__, *created_by_pid)
+    existence_filter.add(model.__label__, *created_by_pid)
+    return merge_results(created_by_pid, prepared)
+
+
+async def bulk_create_relationships(links: list[dict[str, str]]) -> BulkLinkResult:
+    missing = []
+    for relationship, group in group_links(links).items():
+        from_model, to_model = RELATIONSHIP_ENDPOINTS[relationship]
+        for batch in iter_batches(group, db_settings.bulk_batch_size):
+            skipped = await _write(
+                aq.bulk_merge_relationships,
+                from_label=from_model.__label__,
+                to_label=to_model.__label__,
+                relationship=relationship,
+                links=batch,
+            )
+            missing.extend(
+                (from_model.__label__, to_model.__label__, link) for link in skipped
+            )
+            entity_cache.invalidate(
+                from_model.__label__, *(link["from_id"] for link in batch)
+            )
+            entity_cache.invalidate(
+                to_model.__label__, *(link["to_id"] for link in batch)
+            )
+    return summarize_links(total=len(links), missing=missing)
+
+
+###
+# Relationship Operations
+###
+
+
+async def create_person_company_relationship(person_id: str, company_id: str) -> bool:
+    return await _create_relationship(
+        Person, person_id, Company, company_id, relationship="WORKS_FOR"
+    )
+
+
+async def create_person_claim_relationship(person_id: str, claim_id: str) -> bool:
+    return await _create_relationship(
+        Person, person_id, Claim, claim_id, relationship="SUBMITTED"
+    )
+
+
+async def create_person_document_relationship(person_id: str, document_id: str) -> bool:
+    return await _create_relationship(
+        Person, person_id, Document, document_id, relationship="SENT"
+    )
+
+
+async def create_claim_company_relationship(claim_id: str, company_id: str) -> bool:
+    return await _create_relationship(
+        Claim, claim_id, Company, company_id, relationship="HAS_CLAIMANT"
+    )
+
+
+async def _create_relationship(
+    from_model: type[StructuredNode],
+    from_id: str,
+    to_model: type[StructuredNode],
+    to_id: str,
+    relationship: str,
+) -> bool:
+    result = await _write(
+        aq.create_relationship_by_pid,
+        from_label=from_model.__label__,
+        from_id=from_id,
+        to_label=to_model.__label__,
+        to_id=to_id,
+        relationship=relationship,
+    )
+    entity_cache.invalidate(from_model.__label__, from_id)
+    entity_cache.invalidate(to_model.__label__, to_id)
+
+    if not result.from_found:
+        raise EntityNotFoundError(f"{from_model.__label__} with id:{from_id} not found")
+    if not result.to_found:
+        raise EntityNotFoundError(f"{to_model.__label__} with id:{to_id} not found")
+    return result.created
+
+
+@single_flight.acoalesce
+async def get_claims_by_person(
+    person_id: str,
+    limit: int,
+    cursor: str | None = None,
+    fields: tuple[str, ...] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    status: str | None = None,
+) -> Page:
+    """Claims of the person submitted in [since, until), optionally with `status`, oldest first.
+
+    An unfiltered listing without claims reports the person as not found, a filtered one is an empty page.
+    """
+    after_date, after_pid = decode_cursor(cursor, size=2) if cursor else (None, None)
+    result = await _read(
+        aq.get_claims_by_person,
+        person_id=person_id,
+        limit=limit + 1,
+        after_date=after_date,
+        after_pid=after_pid,
+        fields=keyset_fields(fields),
+        since=since,
+        until=until,
+        status=status,
+    )
+    if (
+        not result
+        and cursor is None
+        and since is None
+        and until is None
+        and status is None
+    ):
+        raise EntityNotFoundError(f"No claims for person with id:{person_id} found")
+    return build_page(result or [], limit, cursor_key=claim_cursor_key)
+
+
+@single_flight.acoalesce
+async def get_claims_by_company(
+    company_id: str,
+    limit: int,
+    cursor: str | None = None,
+    fields: tuple[str, ...] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    status: str | None = None,
+) -> Page:
+    after_date, after_pid = decode_cursor(cursor, size=2) if cursor else (None, None)
+    result = await _read(
+        aq.get_claims_by_company,
+        company_id=company_id,
+        limit=limit + 1,
+        after_date=after_date,
+        after_pid=after_pid,
+        fields=keyset_fields(fields),
+        since=since,
+        until=until,
+        status=status,
+    )
+    if (
+        not result
+        and cursor is None
+        and since is None
+        and until is None
+        and status is None
+    ):
+        raise EntityNotFoundError(
+            f"No claims associated to Company with id:{company_id} found"
+        )
+    return build_page(result or [], limit, cursor_key=claim_cursor_key)
+
+
+@single_flight.acoalesce
+async def get_claims(
+    limit: int,
+    cursor: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    status: str | None = None,
+    fields: tuple[str, ...] | None = None,
+) -> Page:
+    return await _get_submitted(
+        Claim, limit, cursor, since=since, until=until, status=status, fields=fields
+    )
+
+
+@single_flight.acoalesce
+async def get_documents(
+    limit: int,
+    cursor: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    fields: tuple[str, ...] | None = None,
+) -> Page:
+    return await _get_submitted(
+        Document, limit, cursor, since=since, until=until, fields=fields
+    )
+
+
+async def _get_submitted(
+    model: type[StructuredNode],
+    limit: int,
+    cursor: str | None,
+    fields: tuple[str, ...] | None,
+    **filters: Any,
+) -> Page:
+    after_date, after_pid = decode_cursor(cursor, size=2) if cursor else (None, None)
+    result = await _read(
+        aq.get_submitted_nodes,
+        label=model.__label__,
+        limit=limit + 1,
+        after_date=after_date,
+        after_pid=after_pid,
+        fields=keyset_fields(fields),
+        **filters,
+    )
+    return build_page(result, limit, cursor_key=claim_cursor_key)
+
+
+async def stream_claims_by_person(
+    person_id: str,
+    fields: tuple[str, ...] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    status: str | None = None,
+) -> AsyncIterator[Node]:
+    not_found = (
+        f"No claims for person with id:{person_id} found"
+        if since is None and until is None and status is None
+        else None
+    )
+    query, params = q.claims_by_holder_statement(
+        "person",
+        person_id,
+        since=since,
+        until=until,
+        status=status,
+        fields=fields,
+        stream=True,
+    )
+    return await _stream_nodes(query, not_found_message=not_found, **params)
+
+
+async def stream_claims_by_company(
+    company_id: str,
+    fields: tuple[str, ...] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    status: str | None = None,
+) -> AsyncIterator[Node]:
+    not_found = (
+        f"No claims associated to Company with id:{company_id} found"
+        if since is None and until is None and status is None
+        else None
+    )
+    query, params = q.claims_by_holder_statement(
+        "company",
+        company_id,
+        since=since,
+        until=until,
+        status=status,
+        fields=fields,
+        stream=True,
+    )
+    return await _stream_nodes(query, not_found_message=not_found, **params)
+
+
+async def _stream_nodes(
+    query: str, not_found_message: str | None, **params
+) -> AsyncIterator[Node]:
+    """Async counterpart of `operations._stream_nodes`."""
+    session, result, first = await transaction_retry.arun(
+        lambda: _open_stream(query, params)
+    )
+    if first is None and not_found_message is not None:
+        await session.close()
+        raise EntityNotFoundError(not_found_message)
+    nodes = _iter_nodes(session, result)
+    await anext(nodes)
+    return nodes
+
+
+async def _open_stream(
+    query: str, params: dict[str, Any]
+) -> tuple[AsyncSession, AsyncResult, Record | None]:
+    session = get_async_driver().session(**session_config(READ_ACCESS))
+    try:
+        result = await session.run(query, params)
+        return session, result, await result.peek()
+    except BaseException:
+        await session.close()
+        raise
+
+
+async def _iter_nodes(
+    session: AsyncSession, result: AsyncResult
+) -> AsyncIterator[Node | None]:
+    """Async counterpart of `operations._iter_nodes`, primed by `_stream_nodes` the same way."""
+    try:
+        yield None
+        async for record in result:
+            yield record[0]
+    finally:
+        await session.close()
+
+
+async def export_rows(
+    kind: str, page_size: int | None = None
+) -> AsyncIterator[dict[str, Any]]:
+    page_size = page_size or db_settings.export_page_size
+    if (model := EXPORT_KINDS[kind]) is None:
+        return _export_links(page_size)
+    return _export_nodes(model, page_size)
+
+
+async def _export_nodes(
+    model: type[StructuredNode], page_size: int
+) -> AsyncIterator[dict[str, Any]]:
+    after = ""
+    while True:
+        nodes = await _read(
+            aq.get_nodes_page, label=model.__label__, after=after, limit=page_size
+        )
+        for node in nodes:
+            yield node_row(model, node)
+        if len(nodes) < page_size:
+            return
+        after = nodes[-1]["pid"]
+
+
+async def _export_links(page_size: int) -> AsyncIterator[dict[str, Any]]:
+    for relationship, (from_model, to_model) in RELATIONSHIP_ENDPOINTS.items():
+        after_from = after_to = ""
+        while True:
+            links = await _read(
+                aq.get_links_page,
+                from_label=from_model.__label__,
+                to_label=to_model.__label__,
+                relationship=relationship,
+                after_from=after_from,
+                after_to=after_to,
+                limit=page_size,
+            )
+            for from_id, to_id in links:
+                yield {"from_id": from_id, "to_id": to_id, "type": relationship}
+            if len(links) < page_size:
+                break
+            after_from, after_to = links[-1]
+
+
+@single_flight.acoalesce
+async def get_company_by_person(person_id: str) -> StructuredNode:
+    result = await _read(aq.get_company_by_person, person_id=person_id)
+    if not result:
+        raise EntityNotFoundError(
+            f"Person with id:{person_id} is not assiociated with any Company"
+        )
+    return result
+
+
+@single_flight.acoalesce
+async def search(label: str, text: str, limit: int, cursor: str | None = None) -> Page:
+    after_score, after_pid = decode_cursor(cursor, size=2) if cursor else (None, None)
+    hits = await _read(
+        aq.search_nodes,
+        index=fulltext_index_name(label),
+        text=text,
+        limit=limit + 1,
+        after_score=after_score,
+        after_pid=after_pid,
+    )
+    return build_page(hits, limit, cursor_key=search_cursor_key)
+
+
+@single_flight.acoalesce
+async def get_claim_stats(
+    group_by: tuple[str, ...],
+    company_id: str | None = None,
+    person_id: str | None = None,
+) -> list[ClaimStats]:
+    return await _read(
+        aq.get_claim_stats,
+        group_by=group_by,
+        company_id=company_id,
+        person_id=person_id,
+    )
+
+
+@single_flight.acoalesce
+async def get_subgraph(
+    label: str,
+    pid: str,
+    relationships: tuple[str, ...],
+    depth: int,
+    max_nodes: int,
+    max_edges: int,
+) -> Subgraph:
+    subgraph = await _read(
+        aq.get_subgraph,
+        label=label,
+        pid=pid,
+        relationships=relationships,
+        depth=depth,
+        max_nodes=max_nodes,
+        max_edges=max_edges,
+    )
+    if subgraph is None:
+        raise EntityNotFoundError(f"{label} with id:{pid} not found")
+    return subgraph
@@ -0,0 +1,219 @@
+from collections.abc import Iterable
+from typing import Any
+
+from neo4j import AsyncManagedTransaction
+from neo4j.graph import Node
+
+from external.neo4j import query as q
+from external.neo4j.counters import UPDATE_CLAIM_STATUS_QUERY
+from external.neo4j.query import (
+    ClaimStats,
+    ClaimStatusUpdate,
+    MissingLink,
+    RelationshipWriteResult,
+    SearchHit,
+    Subgraph,
+)
+
+
+async def get_node_by_pid(
+    tx: AsyncManagedTransaction,
+    label: str,
+    pid: str,
+    fields: Iterable[str] | None = None,
+) -> Node | dict[str, Any] | None:
+    result = await tx.run(q.node_by_pid_query(label, fields), pid=pid)
+    record = await result.single()
+    return record[0] if record else None
+
+
+async def get_nodes_by_pids(
+    tx: AsyncManagedTransaction, label: str, pids: list[str]
+) -> list[Node]:
+    result = await tx.run(q.nodes_by_pids_query(label), pids=pids)
+    return await result.value()
+
+
+async def get_nodes_page(
+    tx: AsyncManagedTransaction, label: str, after: str, limit: int
+) -> list[Node]:
+    result = await tx.run(q.nodes_page_query(label), after=after, limit=limit)
+    return await result.value()
+
+
+async def get_links_page(
+    tx: AsyncManagedTransaction,
+    from_label: str,
+    to_label: str,
+    relationship: str,
+    after_from: str,
+    after_to: str,
+    limit: int,
+) -> list[tuple[str, str]]:
+    result = await tx.run(
+        q.links_page_query(
+            from_label=from_label, to_label=to_label, relationship=relationship
+        ),
+        after_from=after_from,
+        after_to=after_to,
+        limit=limit,
+    )
+    return [(record[0], record[1]) async for record in result]
+
+
+async def create_node(
+    tx: AsyncManagedTransaction, label: str, properties: dict[str, Any]
+) -> Node:
+    result = await tx.run(q.create_node_query(label), properties=properties)
+    record = await result.single(strict=True)
+    return record[0]
+
+
+async def get_claims_by_holder(
+    tx: AsyncManagedTransaction, holder: str, holder_id: str, limit: int, **filters: Any
+) -> list[Node]:
+    claims: list[Node] = []
+    for query, params in q.claims_by_holder_statements(
+        holder, holder_id, limit, **filters
+    ):
+        result = await tx.run(query, {**params, "limit": limit - len(claims)})
+        claims += await result.value()
+        if len(claims) >= limit:
+            break
+    return claims
+
+
+async def get_claims_by_person(
+    tx: AsyncManagedTransaction, person_id: str, limit: int, **filters: Any
+) -> list[Node]:
+    return await get_claims_by_holder(tx, "person", person_id, limit, **filters)
+
+
+async def get_claims_by_company(
+    tx: AsyncManagedTransaction, company_id: str, limit: int, **filters: Any
+) -> list[Node]:
+    return await get_claims_by_holder(tx, "company", company_id, limit, **filters)
+
+
+async def get_submitted_nodes(
+    tx: AsyncManagedTransaction, label: str, limit: int, **filters: Any
+) -> list[Node]:
+    result = await tx.run(*q.submitted_nodes_statement(label, limit, **filters))
+    return await result.value()
+
+
+async def get_company_by_person(
+    tx: AsyncManagedTransaction, person_id: str
+) -> Node | None:
+    result = await tx.run(q.COMPANY_BY_PERSON_QUERY, person_id=person_id)
+    record = await result.fetch(1)
+    return record[0][0] if record else None
+
+
+async def search_nodes(
+    tx: AsyncManagedTransaction,
+    index: str,
+    text: str,
+    limit: int,
+    after_score: float | None = None,
+    after_pid: str | None = None,
+) -> list[SearchHit]:
+    result = await tx.run(
+        q.SEARCH_QUERY,
+        index=index,
+        text=q.search_text(text),
+        limit=limit,
+        after_score=after_score,
+        after_pid=after_pid,
+    )
+    return [SearchHit(*record.values()) async for record in result]
+
+
+async def get_subgraph(
+    tx: AsyncManagedTransaction,
+    label: str,
+    pid: str,
+    relationships: Iterable[str],
+    depth: int,
+    max_nodes: int,
+    max_edges: int,
+) -> Subgraph | None:
+    result = await tx.run(
+        q.subgraph_query(label=label, relationships=relationships, depth=depth),
+        pid=pid,
+        max_nodes=max_nodes,
+        max_edges=max_edges,
+    )
+    record = await result.single()
+    return Subgraph.from_record(*record.values()) if record else None
+
+
+async def get_claim_stats(
+    tx: AsyncManagedTransaction,
+    group_by: Iterable[str],
+    company_id: str | None = None,
+    person_id: str | None = None,
+) -> list[ClaimStats]:
+    group_by = list(group_by)
+    result = await tx.run(
+        q.claim_stats_query(
+            group_by, by_company=company_id is not None, by_person=person_id is not None
+        ),
+        company_id=company_id,
+        person_id=person_id,
+    )
+    return [ClaimStats.from_row(group_by, record.values()) async for record in result]
+
+
+async def create_relationship_by_pid(
+    tx: AsyncManagedTransaction,
+    from_label: str,
+    from_id: str,
+    to_label: str,
+    to_id: str,
+    relationship: str,
+) -> RelationshipWriteResult:
+    result = await tx.run(
+        q.create_relationship_by_pid_query(
+            from_label=from_label, to_label=to_label, relationship=relationship
+        ),
+        from_id=from_id,
+        to_id=to_id,
+    )
+    record = await result.single(strict=True)
+    return RelationshipWriteResult(*record.values())
+
+
+async def update_claim_status(
+    tx: AsyncManagedTransaction, claim_id: str, status: str
+) -> ClaimStatusUpdate | None:
+    result = await tx.run(UPDATE_CLAIM_STATUS_QUERY, claim_id=claim_id, status=status)
+    record = await result.single()
+    return (
+        ClaimStatusUpdate(record["cl"], [tuple(holder) for holder in record["holders"]])
+        if record
+        else None
+    )
+
+
+async def bulk_merge_nodes(
+    tx: AsyncManagedTransaction, label: str, rows: list[dict[str, Any]]
+) -> dict[str, bool]:
+    result = await tx.run(q.bulk_merge_nodes_query(label), rows=rows)
+    return {record["pid"]: record["created"] async for record in result}
+
+
+async def bulk_merge_relationships(
+    tx: AsyncManagedTransaction,
+    from_label: str,
+    to_label: str,
+    relationship: str,
+    links: list[dict[str, str]],
+) -> list[MissingLink]:
+    result = await tx.run(
+        q.bulk_merge_relationships_query(
+            from_label=from_label, to_label=to_label, relationship=relationship
+        ),
+        links=links,
+    )
+    return [MissingLink(*record.values()) async for record in result]
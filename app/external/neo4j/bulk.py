@@ -0,0 +1,116 @@
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from enum import StrEnum
+from itertools import batched
+from typing import Any, NamedTuple
+
+from neomodel import StructuredNode
+
+from external.neo4j.query import MissingLink
+from external.neo4j.serializers import Claim, Company, Document, Person
+
+# relationship type -> (start node model, end node model)
+RELATIONSHIP_ENDPOINTS: dict[str, tuple[type[StructuredNode], type[StructuredNode]]] = {
+    "WORKS_FOR": (Person, Company),
+    "SUBMITTED": (Person, Claim),
+    "SENT": (Person, Document),
+    "HAS_CLAIMANT": (Claim, Company),
+}
+
+
+class BulkItemStatus(StrEnum):
+    CREATED = "created"
+    EXISTS = "exists"
+    DUPLICATE = "duplicate"
+
+
+class BulkItemResult(NamedTuple):
+    pid: str
+    status: BulkItemStatus
+
+
+class BulkLinkResult(NamedTuple):
+    # links that exist after the call, including the ones that were already there
+    linked: int
+    skipped: int
+    # label -> pids that were not found
+    not_found: dict[str, list[str]]
+
+
+class PreparedRows(NamedTuple):
+    rows: list[dict[str, Any]]
+    # pids of every item in request order, including the repeated ones
+    pids: list[str]
+    # positions in `pids` repeating an earlier pid, only the first occurrence is written
+    duplicates: set[int]
+
+
+def prepare_rows(
+    model: type[StructuredNode], items: Iterable[dict[str, Any]]
+) -> PreparedRows:
+    """Deflate request items into DB rows the same way `StructuredNode.save()` would, dropping repeated pids."""
+    rows, pids, duplicates, seen = [], [], set(), set()
+    for position, item in enumerate(items):
+        instance = model(**item)
+        row = model.deflate(instance.__properties__, instance)
+        pids.append(row["pid"])
+        if row["pid"] in seen:
+            duplicates.add(position)
+            continue
+        seen.add(row["pid"])
+        rows.append(row)
+    return PreparedRows(rows=rows, pids=pids, duplicates=duplicates)
+
+
+def iter_batches(
+    rows: list[dict[str, Any]], batch_size: int
+) -> Iterator[list[dict[str, Any]]]:
+    for batch in batched(rows, batch_size):
+        yield list(batch)
+
+
+def merge_results(
+    created_by_pid: dict[str, bool], prepared: PreparedRows
+) -> list[BulkItemResult]:
+    """Build the per-item results in request order."""
+    results = []
+    for position, pid in enumerate(prepared.pids):
+        if position in prepared.duplicates:
+            status = BulkItemStatus.DUPLICATE
+        elif created_by_pid[pid]:
+            status = BulkItemStatus.CREATED
+        else:
+            status = BulkItemStatus.EXISTS
+        results.append(BulkItemResult(pid, status))
+    return results
+
+
+def group_links(links: Iterable[dict[str, str]]) -> dict[str, list[dict[str, str]]]:
+    """Group `{from_id, to_id, type}` links by relationship type."""
+    grouped: dict[str, list[dict[str, str]]] = defaultdict(list)
+    for link in links:
+        grouped[link["type"]].append(
+            {"from_id": link["from_id"], "to_id": link["to_id"]}
+        )
+    return grouped
+
+
+def summarize_links(
+    total: int, missing: Iterable[tuple[str, str, MissingLink]]
+) -> BulkLinkResult:
+    """Summarize the skipped links, given as `(from_label, to_label, link)`, into the not found pids per label."""
+    skipped = 0
+    # dict keys keep the first-seen order while dropping repeated pids
+    not_found: dict[str, dict[str, None]] = defaultdict(dict)
+    for from_label, to_label, link in missing:
+        skipped += 1
+        if not link.from_found:
+            not_found[from_label][link.from_id] = None
+        if not link.to_found:
+            not_found[to_label][link.to_id] = None
+
+    return BulkLinkResult(
+        linked=total - skipped,
+        skipped=skipped,
+        not_found={label: list(pids) for label, pids in not_found.items()},
+    )
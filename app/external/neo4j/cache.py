@@ -0,0 +1,182 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+from core.settings import get_settings
+
+settings = get_settings()
+db_settings = settings.db_settings
+
+
+class EntityCache:
+    """Bounded in-process LRU cache of entities keyed by (label, pid), with a time to live per entry.
+
+    It is local to the process, so with several workers a write only invalidates the worker that handled it; the TTL
+    bounds how long the other workers can serve the stale entity.
+
+    A read-through load racing with a write may return the entity as it was before the write; every invalidation bumps
+    a generation, and a load that started before it is not cached, so the stale entity is not served for the TTL.
+    """
+
+    def __init__(self, max_size: int, ttl: float, enabled: bool = True) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.enabled = enabled
+
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, label: str, pid: str) -> Any | None:
+        key = (label, pid)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self, label: str, pid: str, value: Any, generation: int | None = None
+    ) -> None:
+        """Cache `value`, unless `generation` is given and an invalidation happened since it was read."""
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[(label, pid)] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end((label, pid))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, label: str, *pids: str) -> None:
+        with self._lock:
+            self._generation += 1
+            for pid in pids:
+                if self._entries.pop((label, pid), None) is not None:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def get_or_load(
+        self, label: str, pid: str, loader: Callable[[], Any]
+    ) -> Any | None:
+        """Read-through lookup, only found entities are cached."""
+        if not self.enabled:
+            return loader()
+
+        generation = self._generation
+        if (value := self.get(label, pid)) is not None:
+            return value
+
+        value = loader()
+        if value is not None:
+            self.set(label, pid, value, generation)
+        return value
+
+    def get_many_or_load(
+        self,
+        label: str,
+        pids: Iterable[str],
+        loader: Callable[[list[str]], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Read-through lookup of several pids, `loader` gets the uncached ones at once and returns those it found."""
+        if not self.enabled:
+            return loader(list(pids))
+
+        generation = self._generation
+        found, missing = self._get_many(label, pids)
+        if missing:
+            found.update(self._set_many(label, loader(missing), generation))
+        return found
+
+    async def aget_many_or_load(
+        self,
+        label: str,
+        pids: Iterable[str],
+        loader: Callable[[list[str]], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Async counterpart of `get_many_or_load`, `loader` returns an awaitable."""
+        if not self.enabled:
+            return await loader(list(pids))
+
+        generation = self._generation
+        found, missing = self._get_many(label, pids)
+        if missing:
+            found.update(self._set_many(label, await loader(missing), generation))
+        return found
+
+    def _get_many(
+        self, label: str, pids: Iterable[str]
+    ) -> tuple[dict[str, Any], list[str]]:
+        found, missing = {}, []
+        for pid in pids:
+            if (value := self.get(label, pid)) is not None:
+                found[pid] = value
+            else:
+                missing.append(pid)
+        return found, missing
+
+    def _set_many(
+        self, label: str, values: dict[str, Any], generation: int
+    ) -> dict[str, Any]:
+        for pid, value in values.items():
+            self.set(label, pid, value, generation)
+        return values
+
+    async def aget_or_load(
+        self, label: str, pid: str, loader: Callable[[], Any]
+    ) -> Any | None:
+        """Async counterpart of `get_or_load`, `loader` returns an awaitable."""
+        if not self.enabled:
+            return await loader()
+
+        generation = self._generation
+        if (value := self.get(label, pid)) is not None:
+            return value
+
+        value = await loader()
+        if value is not None:
+            self.set(label, pid, value, generation)
+        return value
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+entity_cache = EntityCache(
+    max_size=db_settings.entity_cache_max_size,
+    ttl=db_settings.entity_cache_ttl,
+    enabled=db_settings.entity_cache_enabled,
+)
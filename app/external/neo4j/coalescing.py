@@ -0,0 +1,140 @@
+"""Single-flight coalescing of concurrent identical reads.
+
+While a read operation is in flight, other callers of the same operation with the same arguments wait for it and
+share its result (or exception) instead of sending their own query. Nothing is kept once the call completes, so this
+never serves data older than the in-flight query; it only removes duplicate work from bursts.
+
+Callers share the returned objects, like they do with `external.neo4j.cache`, so results must not be mutated.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from functools import wraps
+from typing import Any
+
+from core.settings import get_settings
+from external.neo4j.routing import current_bookmarks
+
+settings = get_settings()
+db_settings = settings.db_settings
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run `fn`, or wait for the in-flight call with the same `key` and return its result."""
+        if not self.enabled:
+            return fn()
+
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of `do`, `fn` returns an awaitable.
+
+        The shared call runs in its own task, so a cancelled caller does not cancel the query for the others.
+        """
+        if not self.enabled:
+            return await fn()
+
+        with self._lock:
+            self.calls += 1
+            task = self._tasks.get(key)
+            if task is not None:
+                self.coalesced += 1
+            else:
+                task = self._tasks[key] = asyncio.ensure_future(fn())
+                task.add_done_callback(lambda _: self._tasks.pop(key, None))
+                self.executions += 1
+
+        return await asyncio.shield(task)
+
+    def coalesce(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Decorate a sync read operation so identical concurrent calls share one execution."""
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.do(_call_key(func, args, kwargs), lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    def acoalesce(
+        self, func: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """Decorate an async read operation so identical concurrent calls share one execution."""
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await self.ado(
+                _call_key(func, args, kwargs), lambda: func(*args, **kwargs)
+            )
+
+        return wrapper
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "calls": self.calls,
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls) + len(self._tasks),
+            }
+
+
+def _call_key(
+    func: Callable[..., Any], args: tuple, kwargs: dict[str, Any]
+) -> Hashable:
+    # A read waiting for bookmarks must not reuse a query started without them, it could miss the caller's own writes
+    bookmarks = current_bookmarks()
+    return (
+        func.__qualname__,
+        args,
+        tuple(sorted(kwargs.items())),
+        bookmarks.raw_values if bookmarks else None,
+    )
+
+
+single_flight = SingleFlight(enabled=db_settings.single_flight_enabled)
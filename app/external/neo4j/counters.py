@@ -0,0 +1,135 @@
+"""Claim counters materialized on the Company and Person nodes holding the claims.
+
+Every holder keeps `claim_count`, `claim_amount` and one `claim_count_<status>` per claim status. They are updated in
+the transaction creating a SUBMITTED/HAS_CLAIMANT relationship (in the MERGE's ON CREATE, so a relationship that
+already existed is never counted twice) and in the one changing a claim status, so reading them is a property lookup.
+Writes that bypass the API (imports, manual Cypher, deleted edges) make them drift; `reconcile_claim_counters`
+recomputes them from the relationships and repairs the holders that differ.
+"""
+
+import asyncio
+
+from fastapi.concurrency import run_in_threadpool
+from neo4j.exceptions import DriverError, Neo4jError
+
+from core.logging.logger import get_logger
+from core.settings import get_settings
+from external.neo4j.cache import entity_cache
+from external.neo4j.driver import get_driver
+from external.neo4j.exceptions import DatabaseUnavailableError
+from external.neo4j.routing import WRITE_ACCESS, session_config
+from views.serializers import ClaimStatus
+
+logger = get_logger()
+settings = get_settings()
+db_settings = settings.db_settings
+
+STATUS_COUNTERS = {
+    status.value: f"claim_count_{status.value.lower()}" for status in ClaimStatus
+}
+
+# relationship type -> (holder, claim) of `(a)-[:TYPE]->(b)`
+_CLAIM_HOLDER_ENDS = {"SUBMITTED": ("a", "b"), "HAS_CLAIMANT": ("b", "a")}
+
+# holder label -> pattern from the holder `h` to its claims `cl`
+HOLDER_CLAIMS = {
+    "Person": "(h)-[:SUBMITTED]->(cl:Claim)",
+    "Company": "(cl:Claim)-[:HAS_CLAIMANT]->(h)",
+}
+
+
+def on_create_counters(relationship: str) -> str:
+    """`ON CREATE SET` clause for `MERGE (a)-[:relationship]->(b)` counting the claim on its holder ('' if none)."""
+    if relationship not in _CLAIM_HOLDER_ENDS:
+        return ""
+
+    holder, claim = _CLAIM_HOLDER_ENDS[relationship]
+    items = [
+        f"{holder}.claim_count = coalesce({holder}.claim_count, 0) + 1",
+        f"{holder}.claim_amount = coalesce({holder}.claim_amount, 0) + coalesce({claim}.amount, 0)",
+    ]
+    items += [
+        f"{holder}.{prop} = coalesce({holder}.{prop}, 0) + CASE {claim}.status WHEN '{status}' THEN 1 ELSE 0 END"
+        for status, prop in STATUS_COUNTERS.items()
+    ]
+    return "ON CREATE SET " + ", ".join(items)
+
+
+_STATUS_MOVES = ", ".join(
+    f"h.{prop} = coalesce(h.{prop}, 0)"
+    f" + CASE $status WHEN '{status}' THEN 1 ELSE 0 END - CASE previous WHEN '{status}' THEN 1 ELSE 0 END"
+    for status, prop in STATUS_COUNTERS.items()
+)
+
+# Returns nothing when the claim does not exist. The first SET takes the write lock of the claim before its status is
+# read, so concurrent updates of the same claim are serialized and each one moves the counters from the status the
+# previous one wrote.
+UPDATE_CLAIM_STATUS_QUERY = f"""
+    MATCH (cl:Claim {{pid: $claim_id}})
+    SET cl._lock = true
+    WITH cl, cl.status AS previous
+    SET cl.status = $status
+    REMOVE cl._lock
+    WITH cl, previous, [(h:Person)-[:SUBMITTED]->(cl) | h] + [(cl)-[:HAS_CLAIMANT]->(h:Company) | h] AS holders
+    FOREACH (h IN CASE WHEN previous = $status THEN [] ELSE holders END | SET {_STATUS_MOVES})
+    RETURN cl, [h IN holders | [labels(h)[0], h.pid]] AS holders
+"""
+
+
+def reconcile_counters_query(label: str) -> str:
+    """Recompute the counters of every `label` holder and repair the ones that drifted, returning their pids."""
+    status_sums = "".join(
+        f",\n                sum(CASE cl.status WHEN '{status}' THEN 1 ELSE 0 END) AS {prop}"
+        for status, prop in STATUS_COUNTERS.items()
+    )
+    drift = " OR ".join(
+        [
+            "h.claim_amount IS NULL OR abs(h.claim_amount - claim_amount) > 0.000001",
+            *(
+                f"h.{prop} IS NULL OR h.{prop} <> {prop}"
+                for prop in ["claim_count", *STATUS_COUNTERS.values()]
+            ),
+        ]
+    )
+    updates = ", ".join(
+        f"h.{prop} = {prop}"
+        for prop in ["claim_count", "claim_amount", *STATUS_COUNTERS.values()]
+    )
+    return f"""
+        MATCH (h:{label})
+        CALL {{
+            WITH h
+            OPTIONAL MATCH {HOLDER_CLAIMS[label]}
+            WITH h,
+                count(cl) AS claim_count,
+                sum(coalesce(cl.amount, 0.0)) AS claim_amount{status_sums}
+            WHERE {drift}
+            SET {updates}
+            RETURN h.pid AS pid
+        }} IN TRANSACTIONS OF $batch_size ROWS
+        RETURN pid
+    """
+
+
+def reconcile_claim_counters() -> dict[str, int]:
+    """Repair the counters of every holder, returning the number of repaired holders per label."""
+    repaired = {}
+    with get_driver().session(**session_config(WRITE_ACCESS)) as session:
+        for label in HOLDER_CLAIMS:
+            pids = session.run(
+                reconcile_counters_query(label), batch_size=db_settings.bulk_batch_size
+            ).value()
+            entity_cache.invalidate(label, *pids)
+            repaired[label] = len(pids)
+
+    logger.info(f"Reconciled claim counters, repaired: {repaired}")
+    return repaired
+
+
+async def reconcile_claim_counters_periodically(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(reconcile_claim_counters)
+        except (Neo4jError, DriverError, DatabaseUnavailableError) as exc:
+            logger.error(f"Failed to reconcile claim counters: {exc}")
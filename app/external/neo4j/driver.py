@@ -0,0 +1,112 @@
+from contextlib import ExitStack
+
+from neo4j import AsyncDriver, AsyncGraphDatabase, Driver, GraphDatabase
+from neomodel import config
+
+from core.logging.logger import get_logger
+from core.settings import get_settings
+
+logger = get_logger()
+settings = get_settings()
+db_settings = settings.db_settings
+
+db_url = f"{db_settings.prefix}://{db_settings.host_name}"
+
+_driver: Driver | None = None
+_async_driver: AsyncDriver | None = None
+
+# Trivial statement used to force a pooled connection to be opened (and authenticated).
+_WARMUP_QUERY = "RETURN 1"
+
+
+###
+# Sync driver
+###
+def init_driver() -> Driver:
+    """Create the process-wide pooled driver and register it with neomodel.
+
+    neomodel keeps its connection in a thread local, so without a shared driver every threadpool worker would build
+    its own driver and pool from `config.DATABASE_URL`.
+    """
+    global _driver
+
+    if _driver is None:
+        _driver = GraphDatabase.driver(
+            db_url, auth=db_settings.auth, **db_settings.pool_config
+        )
+        config.DRIVER = _driver
+        config.DATABASE_NAME = db_settings.name
+    return _driver
+
+
+def get_driver() -> Driver:
+    """Return the process-wide pooled driver, creating it on first use outside the app lifespan."""
+    return _driver or init_driver()
+
+
+def warm_up_pool(connections: int) -> None:
+    """Open `connections` pooled connections by holding that many transactions open at the same time."""
+    if connections <= 0:
+        return
+
+    driver = get_driver()
+    with ExitStack() as stack:
+        for _ in range(connections):
+            session = stack.enter_context(driver.session(database=db_settings.name))
+            tx = stack.enter_context(session.begin_transaction())
+            tx.run(_WARMUP_QUERY).consume()
+
+    logger.info(f"Warmed up Neo4j connection pool with {connections} connections")
+
+
+def close_driver() -> None:
+    global _driver
+
+    if _driver is not None:
+        _driver.close()
+        _driver = None
+        config.DRIVER = None
+
+
+###
+# Async driver
+###
+def get_async_driver() -> AsyncDriver:
+    """Return the process-wide async driver, creating it on first use."""
+    global _async_driver
+
+    if _async_driver is None:
+        _async_driver = AsyncGraphDatabase.driver(
+            db_url, auth=db_settings.auth, **db_settings.pool_config
+        )
+    return _async_driver
+
+
+async def warm_up_async_pool(connections: int) -> None:
+    """Async counterpart of `warm_up_pool`."""
+    if connections <= 0:
+        return
+
+    driver = get_async_driver()
+    sessions = [driver.session(database=db_settings.name) for _ in range(connections)]
+    transactions = []
+    try:
+        for session in sessions:
+            tx = await session.begin_transaction()
+            transactions.append(tx)
+            await (await tx.run(_WARMUP_QUERY)).consume()
+    finally:
+        for tx in transactions:
+            await tx.close()
+        for session in sessions:
+            await session.close()
+
+    logger.info(f"Warmed up async Neo4j connection pool with {connections} connections")
+
+
+async def close_async_driver() -> None:
+    global _async_driver
+
+    if _async_driver is not None:
+        await _async_driver.close()
+        _async_driver = None
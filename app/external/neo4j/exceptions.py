@@ -1,2 +1,10 @@
 class EntityNotFoundError(Exception):
     pass
+
+
+class InvalidCursorError(Exception):
+    pass
+
+
+class DatabaseUnavailableError(Exception):
+    pass
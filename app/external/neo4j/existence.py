@@ -0,0 +1,231 @@
+"""Per-label Bloom filters of the known pids, telling which lookups are of ids the process has never seen.
+
+The filters only learn about nodes created through this process (plus what the last scan saw), so a miss is not
+proof of absence: a node created by another process (other workers or replicas, bulk imports) is missing from them
+until the next rebuild. Lookups therefore still read the database on a miss, and a node found that way is added to
+the filter and counted as a false negative; the rebuilds every `DB_EXISTENCE_FILTER_REFRESH_INTERVAL` seconds keep
+those rare. The filters are built from the sync or the async driver, whichever mode the application runs in.
+"""
+
+import asyncio
+import hashlib
+import math
+import threading
+from collections.abc import AsyncIterable, Iterable
+from typing import Any
+
+from fastapi.concurrency import run_in_threadpool
+from neo4j.exceptions import DriverError, Neo4jError
+
+from core.logging.logger import get_logger
+from core.settings import get_settings
+from external.neo4j import query as q
+from external.neo4j.driver import get_async_driver, get_driver
+from external.neo4j.exceptions import DatabaseUnavailableError
+from external.neo4j.routing import READ_ACCESS, session_config
+from external.neo4j.serializers import MODELS
+
+logger = get_logger()
+settings = get_settings()
+db_settings = settings.db_settings
+
+# Room left for nodes created after the scan before the false positive rate starts to degrade
+_CAPACITY_HEADROOM = 2
+_MIN_CAPACITY = 1024
+
+
+class BloomFilter:
+    def __init__(
+        self, capacity: int, false_positive_rate: float, max_bytes: int
+    ) -> None:
+        capacity = max(capacity, 1)
+        bits = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        self.size = max(8, min(bits, max_bytes * 8))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.capacity = capacity
+        self.count = 0
+
+        self._bits = bytearray(math.ceil(self.size / 8))
+        self._lock = threading.Lock()
+
+    def _positions(self, key: str) -> list[int]:
+        # Kirsch-Mitzenmacher double hashing over one 128 bit digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key: str) -> None:
+        positions = self._positions(key)
+        # Setting bits is a read-modify-write of whole bytes, a race could drop a bit and cause a false negative
+        with self._lock:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    @property
+    def estimated_false_positive_rate(self) -> float:
+        return (
+            1 - math.exp(-self.hash_count * self.count / self.size)
+        ) ** self.hash_count
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "capacity": self.capacity,
+            "size_bytes": len(self._bits),
+            "hash_count": self.hash_count,
+            "estimated_false_positive_rate": self.estimated_false_positive_rate,
+        }
+
+
+class ExistenceFilter:
+    """Bloom filters of the pids per label. Labels without a built filter report every pid as possibly present.
+
+    A miss is a hint, not an answer: callers confirm it against the database and report the pids they found anyway
+    with `add_missed`.
+    """
+
+    def __init__(
+        self, false_positive_rate: float, max_bytes: int, enabled: bool = True
+    ) -> None:
+        self.false_positive_rate = false_positive_rate
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+        self._filters: dict[str, BloomFilter] = {}
+        # filters being rebuilt, they receive the pids created during the scan as well
+        self._building: dict[str, BloomFilter] = {}
+        self._lock = threading.Lock()
+        self.misses = 0
+        self.false_negatives = 0
+
+    def might_contain(self, label: str, pid: str) -> bool:
+        if not self.enabled or (bloom := self._filters.get(label)) is None:
+            return True
+        if pid in bloom:
+            return True
+        with self._lock:
+            self.misses += 1
+        return False
+
+    def add_missed(self, label: str, *pids: str) -> None:
+        """Learn pids the filter missed but the database has, created by another process since the last build."""
+        if not pids:
+            return
+        with self._lock:
+            self.false_negatives += len(pids)
+        self.add(label, *pids)
+
+    def add(self, label: str, *pids: str) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            targets = [
+                bloom
+                for bloom in (self._filters.get(label), self._building.get(label))
+                if bloom
+            ]
+        for bloom in targets:
+            for pid in pids:
+                bloom.add(pid)
+
+    def build(self, label: str, count: int, pids: Iterable[str]) -> None:
+        """Build the filter of `label` from a scan of its `count` pids and swap it in once complete."""
+        bloom = self._start_build(label, count)
+        try:
+            for pid in pids:
+                bloom.add(pid)
+            self._swap_in(label, bloom)
+        finally:
+            self._end_build(label)
+
+    async def abuild(self, label: str, count: int, pids: AsyncIterable[str]) -> None:
+        """Async counterpart of `build`, for a scan streamed by the async driver."""
+        bloom = self._start_build(label, count)
+        try:
+            async for pid in pids:
+                bloom.add(pid)
+            self._swap_in(label, bloom)
+        finally:
+            self._end_build(label)
+
+    def _start_build(self, label: str, count: int) -> BloomFilter:
+        bloom = BloomFilter(
+            capacity=max(count * _CAPACITY_HEADROOM, _MIN_CAPACITY),
+            false_positive_rate=self.false_positive_rate,
+            max_bytes=self.max_bytes,
+        )
+        with self._lock:
+            self._building[label] = bloom
+        return bloom
+
+    def _swap_in(self, label: str, bloom: BloomFilter) -> None:
+        with self._lock:
+            self._filters[label] = bloom
+
+    def _end_build(self, label: str) -> None:
+        with self._lock:
+            self._building.pop(label, None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "misses": self.misses,
+            "false_negatives": self.false_negatives,
+            "labels": {label: bloom.stats() for label, bloom in self._filters.items()},
+        }
+
+
+existence_filter = ExistenceFilter(
+    false_positive_rate=db_settings.existence_filter_false_positive_rate,
+    max_bytes=db_settings.existence_filter_max_bytes,
+    enabled=db_settings.existence_filter_enabled,
+)
+
+
+def build_existence_filter() -> None:
+    """Build the filter of every label from a streaming scan of its pids."""
+    with get_driver().session(**session_config(READ_ACCESS)) as session:
+        for label in MODELS:
+            count = session.run(q.count_nodes_query(label)).single(strict=True)[0]
+            pids = (record[0] for record in session.run(q.pids_by_label_query(label)))
+            existence_filter.build(label, count=count, pids=pids)
+
+    logger.info(f"Built existence filters: {existence_filter.stats()['labels']}")
+
+
+async def abuild_existence_filter() -> None:
+    """Async counterpart of `build_existence_filter`, scanning through the async driver."""
+    async with get_async_driver().session(**session_config(READ_ACCESS)) as session:
+        for label in MODELS:
+            count = (
+                await (await session.run(q.count_nodes_query(label))).single(
+                    strict=True
+                )
+            )[0]
+            result = await session.run(q.pids_by_label_query(label))
+            await existence_filter.abuild(
+                label, count=count, pids=(record[0] async for record in result)
+            )
+
+    logger.info(f"Built existence filters: {existence_filter.stats()['labels']}")
+
+
+async def refresh_existence_filter(interval: float, async_driver: bool = False) -> None:
+    """Rebuild the filters every `interval` seconds so nodes created by other processes become known."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if async_driver:
+                await abuild_existence_filter()
+            else:
+                await run_in_threadpool(build_existence_filter)
+        except (Neo4jError, DriverError, DatabaseUnavailableError) as exc:
+            logger.error(f"Failed to refresh existence filters: {exc}")
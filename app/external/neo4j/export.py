@@ -0,0 +1,137 @@
+"""Paged export of the graph into the files `commands.bulk_import` loads.
+
+Every label is read in pid order and every relationship type in (from pid, to pid) order, one page per query and
+transaction, so memory stays bounded by `DB_EXPORT_PAGE_SIZE` whatever the size of the graph. The pages are separate
+read-committed transactions: an export running next to writes is not a point-in-time snapshot, but every node and
+link that exists for the whole export is written exactly once.
+
+Rows hold the properties the API accepts, dates as ISO 8601 strings; the claim counters are left out since importing
+the links recomputes them.
+"""
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator, Iterable, Iterator
+from datetime import UTC, datetime
+from itertools import batched
+from typing import Any
+
+from neomodel import DateTimeProperty, StructuredNode
+
+from core.settings import get_settings
+from external.neo4j.counters import STATUS_COUNTERS
+from external.neo4j.serializers import Claim, Company, Document, Person
+
+settings = get_settings()
+
+EXPORT_FORMATS = ("jsonl", "csv")
+
+# export kind -> node model, None for the links; named and ordered like the inputs of `commands.bulk_import`
+EXPORT_KINDS: dict[str, type[StructuredNode] | None] = {
+    "person": Person,
+    "company": Company,
+    "claim": Claim,
+    "document": Document,
+    "links": None,
+}
+
+LINK_COLUMNS = ("from_id", "to_id", "type")
+
+_DERIVED_PROPERTIES = {"claim_count", "claim_amount", *STATUS_COUNTERS.values()}
+
+
+def export_columns(kind: str) -> tuple[str, ...]:
+    if (model := EXPORT_KINDS[kind]) is None:
+        return LINK_COLUMNS
+    return _node_columns(model)
+
+
+def _node_columns(model: type[StructuredNode]) -> tuple[str, ...]:
+    properties = model.defined_properties(aliases=False, rels=False)
+    return tuple(name for name in properties if name not in _DERIVED_PROPERTIES)
+
+
+def node_row(model: type[StructuredNode], node: Any) -> dict[str, Any]:
+    """Importable row of a raw `model` node, without its unset properties."""
+    properties = model.defined_properties(aliases=False, rels=False)
+    row = {}
+    for name in _node_columns(model):
+        if (value := node.get(name)) is None:
+            continue
+        if isinstance(properties[name], DateTimeProperty):
+            value = datetime.fromtimestamp(value, UTC).isoformat()
+        row[name] = value
+    return row
+
+
+class RowEncoder:
+    """Encode rows as JSON lines or as CSV with a header line, optionally gzip compressed."""
+
+    def __init__(
+        self, fmt: str, columns: Iterable[str], compress: bool = False
+    ) -> None:
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(
+                f"Unsupported export format {fmt}, expected one of {', '.join(EXPORT_FORMATS)}"
+            )
+        self.fmt = fmt
+        self.columns = tuple(columns)
+        # wbits=31 writes the gzip header and trailer, the output is a regular .gz file
+        self._compressor = zlib.compressobj(wbits=31) if compress else None
+        self._header = fmt == "csv"
+
+    def encode(self, rows: Iterable[dict[str, Any]]) -> bytes:
+        if self.fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.DictWriter(
+                buffer,
+                fieldnames=self.columns,
+                extrasaction="ignore",
+                lineterminator="\n",
+            )
+            if self._header:
+                writer.writeheader()
+                self._header = False
+            writer.writerows(rows)
+            text = buffer.getvalue()
+        else:
+            text = "".join(json.dumps(row, default=str) + "\n" for row in rows)
+
+        data = text.encode()
+        return self._compressor.compress(data) if self._compressor else data
+
+    def finish(self) -> bytes:
+        """Bytes ending the output: the header of an empty CSV export and the gzip trailer."""
+        data = self.encode([]) if self._header else b""
+        if self._compressor:
+            data += self._compressor.flush()
+            self._compressor = None
+        return data
+
+
+def encode_rows(rows: Iterable[dict[str, Any]], encoder: RowEncoder) -> Iterator[bytes]:
+    # Chunked, since starlette moves to the threadpool for every item of a sync iterator
+    for chunk in batched(rows, settings.stream_chunk_size):
+        if data := encoder.encode(chunk):
+            yield data
+    if data := encoder.finish():
+        yield data
+
+
+async def aencode_rows(
+    rows: AsyncIterator[dict[str, Any]], encoder: RowEncoder
+) -> AsyncIterator[bytes]:
+    """Async counterpart of `encode_rows`."""
+    chunk = []
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) >= settings.stream_chunk_size:
+            if data := encoder.encode(chunk):
+                yield data
+            chunk = []
+    if chunk and (data := encoder.encode(chunk)):
+        yield data
+    if data := encoder.finish():
+        yield data
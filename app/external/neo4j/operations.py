@@ -1,62 +1,258 @@
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from functools import partial
+from typing import Any
 from warnings import deprecated
-from pydantic import BaseModel
 
-from neo4j import GraphDatabase
-from neomodel import StructuredNode, clear_neo4j_database, config, db
+from neo4j import Record, Result, Session
+from neo4j.graph import Node
+from neomodel import StructuredNode, clear_neo4j_database, db
+from pydantic import BaseModel
 
+from core.settings import get_settings
 from external.neo4j import query as q
+from external.neo4j.bulk import (
+    RELATIONSHIP_ENDPOINTS,
+    BulkItemResult,
+    BulkLinkResult,
+    group_links,
+    iter_batches,
+    merge_results,
+    prepare_rows,
+    summarize_links,
+)
+from external.neo4j.cache import entity_cache
+from external.neo4j.coalescing import single_flight
+from external.neo4j.driver import get_driver
 from external.neo4j.exceptions import EntityNotFoundError
-from external.neo4j.serializers import Claim, Company, Document, Person
-from core.settings import get_settings
+from external.neo4j.existence import existence_filter
+from external.neo4j.export import EXPORT_KINDS, node_row
+from external.neo4j.pagination import (
+    Page,
+    build_page,
+    claim_cursor_key,
+    decode_cursor,
+    keyset_fields,
+    search_cursor_key,
+)
+from external.neo4j.query import ClaimStats, Subgraph
+from external.neo4j.retry import transaction_retry
+from external.neo4j.routing import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    record_bookmarks,
+    session_config,
+    transaction,
+)
+from external.neo4j.schema import fulltext_index_name
+from external.neo4j.serializers import MODELS, Claim, Company, Document, Person
 
 settings = get_settings()
 db_settings = settings.db_settings
 
-db_url = f"{db_settings.prefix}://{db_settings.host_name}"
-config.DATABASE_URL = (
-    f"{db_settings.prefix}://{db_settings.username}:{db_settings.password.get_secret_value()}@{db_settings.host_name}"
-)
+
+def _write(tx_function: Callable[..., Any], **kwargs) -> Any:
+    def attempt() -> Any:
+        with get_driver().session(**session_config(WRITE_ACCESS)) as session:
+            result = session.execute_write(tx_function, **kwargs)
+            record_bookmarks(session.last_bookmarks())
+        return result
+
+    return transaction_retry.run(attempt)
+
+
+def _read(tx_function: Callable[..., Any], **kwargs) -> Any:
+    def attempt() -> Any:
+        with get_driver().session(**session_config(READ_ACCESS)) as session:
+            return session.execute_read(tx_function, **kwargs)
+
+    return transaction_retry.run(attempt)
+
+
+def _transact[T](access_mode: str, fn: Callable[[], T]) -> T:
+    """Run the neomodel calls of `fn` in one transaction, retried on transient errors."""
+
+    def attempt() -> T:
+        with transaction(access_mode):
+            return fn()
+
+    return transaction_retry.run(attempt)
+
+
+def _load_node(model: type[StructuredNode], pid: str) -> StructuredNode | None:
+    return _transact(READ_ACCESS, lambda: model.nodes.get_or_none(pid=pid))
 
 
 def check_db_connection() -> None:
-    with GraphDatabase.driver(db_url, auth=db_settings.auth) as driver:
-        driver.verify_connectivity()
+    get_driver().verify_connectivity()
 
 
 def clear_db() -> None:
     clear_neo4j_database(db, clear_constraints=False, clear_indexes=False)
 
 
-def get_person(person_id: str) -> StructuredNode | None:
-    return Person.nodes.get_or_none(pid=person_id)
+def _get_node(
+    model: type[StructuredNode], pid: str, fields: tuple[str, ...] | None = None
+) -> StructuredNode | dict[str, Any]:
+    """The node, or the map projection of its `fields` when there is no entity cache to serve the whole node from."""
+    label = model.__label__
+    # a miss only means the node was not created through this process since the last filter build
+    known = existence_filter.might_contain(label, pid)
+    if fields is not None and not entity_cache.enabled:
+        node = _transact(READ_ACCESS, lambda: q.get_node_by_pid(label, pid, fields))
+    else:
+        node = entity_cache.get_or_load(label, pid, lambda: _load_node(model, pid))
+    if node:
+        if not known:
+            existence_filter.add_missed(label, pid)
+        return node
+    raise EntityNotFoundError(f"{label} with id:{pid} not found")
+
+
+def _load_nodes(
+    model: type[StructuredNode], pids: list[str]
+) -> dict[str, StructuredNode]:
+    nodes = _transact(READ_ACCESS, lambda: q.get_nodes_by_pids(model.__label__, pids))
+    return {node["pid"]: model.inflate(node) for node in nodes}
+
+
+@single_flight.coalesce
+def batch_get(label: str, pids: tuple[str, ...]) -> list[StructuredNode | None]:
+    """Entities of `label` in the order of `pids`, None for the missing ones.
+
+    Cached entities are served from the cache and the others are read with one query.
+    """
+    model = MODELS[label]
+    unknown = [pid for pid in pids if not existence_filter.might_contain(label, pid)]
+    found = entity_cache.get_many_or_load(
+        label, pids, lambda missing: _load_nodes(model, missing)
+    )
+    existence_filter.add_missed(label, *(pid for pid in unknown if pid in found))
+    return [found.get(pid) for pid in pids]
+
+
+def _create_node(model: type[StructuredNode], **kwargs) -> StructuredNode:
+    node = _transact(WRITE_ACCESS, lambda: model(**kwargs).save())
+    entity_cache.invalidate(model.__label__, node.pid)
+    existence_filter.add(model.__label__, node.pid)
+    return node
+
+
+@single_flight.coalesce
+def get_person(
+    person_id: str, fields: tuple[str, ...] | None = None
+) -> StructuredNode | dict[str, Any]:
+    return _get_node(Person, person_id, fields)
 
 
 def create_person(**kwargs) -> StructuredNode:
-    return Person(**kwargs).save()
+    return _create_node(Person, **kwargs)
 
 
-def get_company(company_id: str) -> StructuredNode | None:
-    return Company.nodes.get_or_none(pid=company_id)
+@single_flight.coalesce
+def get_company(
+    company_id: str, fields: tuple[str, ...] | None = None
+) -> StructuredNode | dict[str, Any]:
+    return _get_node(Company, company_id, fields)
 
 
 def create_company(**kwargs) -> StructuredNode:
-    return Company(**kwargs).save()
+    return _create_node(Company, **kwargs)
 
 
-def get_claim(claim_id: str) -> StructuredNode | None:
-    return Claim.nodes.get_or_none(pid=claim_id)
+@single_flight.coalesce
+def get_claim(
+    claim_id: str, fields: tuple[str, ...] | None = None
+) -> StructuredNode | dict[str, Any]:
+    return _get_node(Claim, claim_id, fields)
 
 
 def create_claim(**kwargs) -> StructuredNode:
-    return Claim(**kwargs).save()
+    return _create_node(Claim, **kwargs)
+
+
+def update_claim_status(claim_id: str, status: str) -> StructuredNode:
+    """Change the status of a claim, moving it between the status counters of its holders in the same transaction."""
+    result = _write(q.update_claim_status, claim_id=claim_id, status=status)
+    if result is None:
+        raise EntityNotFoundError(f"Claim with id:{claim_id} not found")
 
+    entity_cache.invalidate(Claim.__label__, claim_id)
+    for label, pid in result.holders:
+        entity_cache.invalidate(label, pid)
+    return Claim.inflate(result.claim)
 
-def get_document(document_id: str) -> StructuredNode | None:
-    return Document.nodes.get_or_none(pid=document_id)
+
+@single_flight.coalesce
+def get_document(
+    document_id: str, fields: tuple[str, ...] | None = None
+) -> StructuredNode | dict[str, Any]:
+    return _get_node(Document, document_id, fields)
 
 
 def create_document(**kwargs) -> StructuredNode:
-    return Document(**kwargs).save()
+    return _create_node(Document, **kwargs)
+
+
+###
+# Bulk Operations
+###
+
+
+def bulk_create_persons(items: list[dict[str, Any]]) -> list[BulkItemResult]:
+    return _bulk_create(Person, items)
+
+
+def bulk_create_companies(items: list[dict[str, Any]]) -> list[BulkItemResult]:
+    return _bulk_create(Company, items)
+
+
+def bulk_create_claims(items: list[dict[str, Any]]) -> list[BulkItemResult]:
+    return _bulk_create(Claim, items)
+
+
+def bulk_create_documents(items: list[dict[str, Any]]) -> list[BulkItemResult]:
+    return _bulk_create(Document, items)
+
+
+def _bulk_create(
+    model: type[StructuredNode], items: list[dict[str, Any]]
+) -> list[BulkItemResult]:
+    prepared = prepare_rows(model, items)
+
+    # One transaction per UNWIND batch
+    created_by_pid: dict[str, bool] = {}
+    for batch in iter_batches(prepared.rows, db_settings.bulk_batch_size):
+        created_by_pid.update(
+            _write(q.bulk_merge_nodes, label=model.__label__, rows=batch)
+        )
+    entity_cache.invalidate(model.__label__, *created_by_pid)
+    existence_filter.add(model.__label__, *created_by_pid)
+    return merge_results(created_by_pid, prepared)
+
+
+def bulk_create_relationships(links: list[dict[str, str]]) -> BulkLinkResult:
+    missing = []
+    for relationship, group in group_links(links).items():
+        from_model, to_model = RELATIONSHIP_ENDPOINTS[relationship]
+        for batch in iter_batches(group, db_settings.bulk_batch_size):
+            skipped = _write(
+                q.bulk_merge_relationships,
+                from_label=from_model.__label__,
+                to_label=to_model.__label__,
+                relationship=relationship,
+                links=batch,
+            )
+            missing.extend(
+                (from_model.__label__, to_model.__label__, link) for link in skipped
+            )
+            entity_cache.invalidate(
+                from_model.__label__, *(link["from_id"] for link in batch)
+            )
+            entity_cache.invalidate(
+                to_model.__label__, *(link["to_id"] for link in batch)
+            )
+    return summarize_links(total=len(links), missing=missing)
 
 
 ###
@@ -65,60 +261,388 @@ def create_document(**kwargs) -> StructuredNode:
 
 
 def create_person_company_relationship(person_id: str, company_id: str) -> bool:
-    if person := get_person(person_id=person_id):
-        if company := get_company(company_id=company_id):
-            person.company.connect(company)
-            return person.company.is_connected(company)
-        raise EntityNotFoundError(f"Company with id:{company_id} not found")
-    raise EntityNotFoundError(f"Person with id:{person_id} not found")
+    return _create_relationship(
+        Person, person_id, Company, company_id, relationship="WORKS_FOR"
+    )
 
 
 def create_person_claim_relationship(person_id: str, claim_id: str) -> bool:
-    if person := get_person(person_id=person_id):
-        if claim := get_claim(claim_id=claim_id):
-            person.claim.connect(claim)
-            return person.claim.is_connected(claim)
-        raise EntityNotFoundError(f"Claim with id:{claim_id} not found")
-    raise EntityNotFoundError(f"Person with id:{person_id} not found")
+    return _create_relationship(
+        Person, person_id, Claim, claim_id, relationship="SUBMITTED"
+    )
 
 
 def create_person_document_relationship(person_id: str, document_id: str) -> bool:
-    if person := get_person(person_id=person_id):
-        if document := get_document(document_id=document_id):
-            person.document.connect(document)
-            return person.document.is_connected(document)
-        raise EntityNotFoundError(f"Document with id:{document_id} not found")
-    raise EntityNotFoundError(f"Person with id:{person_id} not found")
+    return _create_relationship(
+        Person, person_id, Document, document_id, relationship="SENT"
+    )
 
 
 def create_claim_company_relationship(claim_id: str, company_id: str) -> bool:
-    if claim := get_claim(claim_id=claim_id):
-        if company := get_company(company_id=company_id):
-            claim.company.connect(company)
-            return claim.company.is_connected(company)
-        raise EntityNotFoundError(f"Company with id:{company_id} not found")
-    raise EntityNotFoundError(f"Claim with id:{claim_id} not found")
-
-
-def get_claims_by_person(person_id: str) -> list[StructuredNode]:
-    result = q.get_claims_by_person(person_id=person_id)
-    if not result:
+    return _create_relationship(
+        Claim, claim_id, Company, company_id, relationship="HAS_CLAIMANT"
+    )
+
+
+def _create_relationship(
+    from_model: type[StructuredNode],
+    from_id: str,
+    to_model: type[StructuredNode],
+    to_id: str,
+    relationship: str,
+) -> bool:
+    result = _transact(
+        WRITE_ACCESS,
+        lambda: q.create_relationship_by_pid(
+            from_label=from_model.__label__,
+            from_id=from_id,
+            to_label=to_model.__label__,
+            to_id=to_id,
+            relationship=relationship,
+        ),
+    )
+    entity_cache.invalidate(from_model.__label__, from_id)
+    entity_cache.invalidate(to_model.__label__, to_id)
+
+    if not result.from_found:
+        raise EntityNotFoundError(f"{from_model.__label__} with id:{from_id} not found")
+    if not result.to_found:
+        raise EntityNotFoundError(f"{to_model.__label__} with id:{to_id} not found")
+    return result.created
+
+
+@single_flight.coalesce
+def get_claims_by_person(
+    person_id: str,
+    limit: int,
+    cursor: str | None = None,
+    fields: tuple[str, ...] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    status: str | None = None,
+) -> Page:
+    """Claims of the person submitted in [since, until), optionally with `status`, oldest first.
+
+    An unfiltered listing without claims reports the person as not found, a filtered one is an empty page.
+    """
+    after_date, after_pid = decode_cursor(cursor, size=2) if cursor else (None, None)
+    result = _transact(
+        READ_ACCESS,
+        lambda: q.get_claims_by_person(
+            person_id=person_id,
+            limit=limit + 1,
+            after_date=after_date,
+            after_pid=after_pid,
+            fields=keyset_fields(fields),
+            since=since,
+            until=until,
+            status=status,
+        ),
+    )
+    if (
+        not result
+        and cursor is None
+        and since is None
+        and until is None
+        and status is None
+    ):
         raise EntityNotFoundError(f"No claims for person with id:{person_id} found")
-    return result
+    return build_page(result or [], limit, cursor_key=claim_cursor_key)
+
+
+@single_flight.coalesce
+def get_claims_by_company(
+    company_id: str,
+    limit: int,
+    cursor: str | None = None,
+    fields: tuple[str, ...] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    status: str | None = None,
+) -> Page:
+    after_date, after_pid = decode_cursor(cursor, size=2) if cursor else (None, None)
+    result = _transact(
+        READ_ACCESS,
+        lambda: q.get_claims_by_company(
+            company_id=company_id,
+            limit=limit + 1,
+            after_date=after_date,
+            after_pid=after_pid,
+            fields=keyset_fields(fields),
+            since=since,
+            until=until,
+            status=status,
+        ),
+    )
+    if (
+        not result
+        and cursor is None
+        and since is None
+        and until is None
+        and status is None
+    ):
+        raise EntityNotFoundError(
+            f"No claims associated to Company with id:{company_id} found"
+        )
+    return build_page(result or [], limit, cursor_key=claim_cursor_key)
+
+
+@single_flight.coalesce
+def get_claims(
+    limit: int,
+    cursor: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    status: str | None = None,
+    fields: tuple[str, ...] | None = None,
+) -> Page:
+    """Claims submitted in [since, until), optionally with `status`, oldest first."""
+    return _get_submitted(
+        Claim, limit, cursor, since=since, until=until, status=status, fields=fields
+    )
+
+
+@single_flight.coalesce
+def get_documents(
+    limit: int,
+    cursor: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    fields: tuple[str, ...] | None = None,
+) -> Page:
+    """Documents submitted in [since, until), oldest first."""
+    return _get_submitted(
+        Document, limit, cursor, since=since, until=until, fields=fields
+    )
+
+
+def _get_submitted(
+    model: type[StructuredNode],
+    limit: int,
+    cursor: str | None,
+    fields: tuple[str, ...] | None,
+    **filters: Any,
+) -> Page:
+    after_date, after_pid = decode_cursor(cursor, size=2) if cursor else (None, None)
+    result = _transact(
+        READ_ACCESS,
+        lambda: q.get_submitted_nodes(
+            model.__label__,
+            limit=limit + 1,
+            after_date=after_date,
+            after_pid=after_pid,
+            fields=keyset_fields(fields),
+            **filters,
+        ),
+    )
+    return build_page(result, limit, cursor_key=claim_cursor_key)
+
+
+def stream_claims_by_person(
+    person_id: str,
+    fields: tuple[str, ...] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    status: str | None = None,
+) -> Iterator[Node]:
+    not_found = (
+        f"No claims for person with id:{person_id} found"
+        if since is None and until is None and status is None
+        else None
+    )
+    query, params = q.claims_by_holder_statement(
+        "person",
+        person_id,
+        since=since,
+        until=until,
+        status=status,
+        fields=fields,
+        stream=True,
+    )
+    return _stream_nodes(query, not_found_message=not_found, **params)
+
+
+def stream_claims_by_company(
+    company_id: str,
+    fields: tuple[str, ...] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    status: str | None = None,
+) -> Iterator[Node]:
+    not_found = (
+        f"No claims associated to Company with id:{company_id} found"
+        if since is None and until is None and status is None
+        else None
+    )
+    query, params = q.claims_by_holder_statement(
+        "company",
+        company_id,
+        since=since,
+        until=until,
+        status=status,
+        fields=fields,
+        stream=True,
+    )
+    return _stream_nodes(query, not_found_message=not_found, **params)
+
+
+def _stream_nodes(
+    query: str, not_found_message: str | None, **params
+) -> Iterator[Node]:
+    """Run `query` and lazily iterate the nodes it returns, keeping the session open until the iterator is exhausted
+    or closed; consumers that stop early (a client disconnecting from a stream) must call its `close()`.
+
+    The first record is fetched eagerly so that an empty result can still be reported as EntityNotFoundError, unless
+    `not_found_message` is None.
+    """
+    session, result, first = transaction_retry.run(lambda: _open_stream(query, params))
+    if first is None and not_found_message is not None:
+        session.close()
+        raise EntityNotFoundError(not_found_message)
+    nodes = _iter_nodes(session, result)
+    next(nodes)
+    return nodes
+
+
+def _open_stream(
+    query: str, params: dict[str, Any]
+) -> tuple[Session, Result, Record | None]:
+    session = get_driver().session(**session_config(READ_ACCESS))
+    try:
+        result = session.run(query, params)
+        return session, result, result.peek()
+    except BaseException:
+        session.close()
+        raise
+
+
+def _iter_nodes(session: Session, result: Result) -> Iterator[Node | None]:
+    """Yield None once, then the nodes of `result`, closing `session` when exhausted or closed.
+
+    `_stream_nodes` consumes the None: a started generator runs its `finally` on `close()`, an unstarted one would
+    never close the session if the response is abandoned before its first item.
+    """
+    try:
+        yield None
+        for record in result:
+            yield record[0]
+    finally:
+        session.close()
+
+
+def export_rows(kind: str, page_size: int | None = None) -> Iterator[dict[str, Any]]:
+    """Importable rows of every `kind` node, or of every link, read one page (and transaction) at a time."""
+    page_size = page_size or db_settings.export_page_size
+    if (model := EXPORT_KINDS[kind]) is None:
+        return _export_links(page_size)
+    return _export_nodes(model, page_size)
+
+
+def _export_nodes(
+    model: type[StructuredNode], page_size: int
+) -> Iterator[dict[str, Any]]:
+    after = ""
+    while True:
+        nodes = _transact(
+            READ_ACCESS,
+            partial(q.get_nodes_page, model.__label__, after=after, limit=page_size),
+        )
+        for node in nodes:
+            yield node_row(model, node)
+        if len(nodes) < page_size:
+            return
+        after = nodes[-1]["pid"]
+
+
+def _export_links(page_size: int) -> Iterator[dict[str, Any]]:
+    for relationship, (from_model, to_model) in RELATIONSHIP_ENDPOINTS.items():
+        after_from = after_to = ""
+        while True:
+            links = _transact(
+                READ_ACCESS,
+                partial(
+                    q.get_links_page,
+                    from_model.__label__,
+                    to_model.__label__,
+                    relationship,
+                    after_from=after_from,
+                    after_to=after_to,
+                    limit=page_size,
+                ),
+            )
+            for from_id, to_id in links:
+                yield {"from_id": from_id, "to_id": to_id, "type": relationship}
+            if len(links) < page_size:
+                break
+            after_from, after_to = links[-1]
 
 
-def get_claims_by_company(company_id: str) -> list[StructuredNode]:
-    result = q.get_claims_by_company(company_id=company_id)
+@single_flight.coalesce
+def get_company_by_person(person_id: str) -> StructuredNode:
+    result = _transact(
+        READ_ACCESS, lambda: q.get_company_by_person(person_id=person_id)
+    )
     if not result:
-        raise EntityNotFoundError(f"No claims associated to Company with id:{company_id} found")
+        raise EntityNotFoundError(
+            f"Person with id:{person_id} is not assiociated with any Company"
+        )
     return result
 
 
-def get_company_by_person(person_id: str) -> StructuredNode:
-    result = q.get_company_by_person(person_id=person_id)
-    if not result:
-        raise EntityNotFoundError(f"Person with id:{person_id} is not assiociated with any Company")
-    return result
+@single_flight.coalesce
+def search(label: str, text: str, limit: int, cursor: str | None = None) -> Page:
+    """Ranked full-text search over the `label` nodes, see `schema.SCHEMA` for the indexed properties."""
+    after_score, after_pid = decode_cursor(cursor, size=2) if cursor else (None, None)
+    hits = _transact(
+        READ_ACCESS,
+        lambda: q.search_nodes(
+            index=fulltext_index_name(label),
+            text=text,
+            limit=limit + 1,
+            after_score=after_score,
+            after_pid=after_pid,
+        ),
+    )
+    return build_page(hits, limit, cursor_key=search_cursor_key)
+
+
+@single_flight.coalesce
+def get_claim_stats(
+    group_by: tuple[str, ...],
+    company_id: str | None = None,
+    person_id: str | None = None,
+) -> list[ClaimStats]:
+    return _transact(
+        READ_ACCESS,
+        lambda: q.get_claim_stats(
+            group_by=group_by, company_id=company_id, person_id=person_id
+        ),
+    )
+
+
+@single_flight.coalesce
+def get_subgraph(
+    label: str,
+    pid: str,
+    relationships: tuple[str, ...],
+    depth: int,
+    max_nodes: int,
+    max_edges: int,
+) -> Subgraph:
+    subgraph = _transact(
+        READ_ACCESS,
+        lambda: q.get_subgraph(
+            label=label,
+            pid=pid,
+            relationships=relationships,
+            depth=depth,
+            max_nodes=max_nodes,
+            max_edges=max_edges,
+        ),
+    )
+    if subgraph is None:
+        raise EntityNotFoundError(f"{label} with id:{pid} not found")
+    return subgraph
 
 
 ###
@@ -128,38 +652,36 @@ def get_company_by_person(person_id: str) -> StructuredNode:
 
 @deprecated("This function has been deprecated")
 def get_all_entities(entity_name: str):
-    with GraphDatabase.driver(db_url, auth=db_settings.auth) as driver:
-        with driver.session(database=db_settings.name) as session:
-            return session.execute_read(q.get_all_entities, entity_name=entity_name)
+    return _read(q.get_all_entities, entity_name=entity_name)
 
 
 @deprecated("This function has been deprecated")
 def get_entity(entity_name: str, entity_id: str):
-    with GraphDatabase.driver(db_url, auth=db_settings.auth) as driver:
-        with driver.session(database=db_settings.name) as session:
-            return session.execute_read(q.get_entity, entity_name=entity_name, entity_id=entity_id)
+    return _read(q.get_entity, entity_name=entity_name, entity_id=entity_id)
 
 
 @deprecated("This function has been deprecated")
 def create_entity(req_data: BaseModel):
-    with GraphDatabase.driver(db_url, auth=db_settings.auth) as driver:
-        with driver.session(database=db_settings.name) as session:
-            return session.execute_write(
-                q.create_entity_tx,
-                entity_name=req_data.__class__.__name__,
-                attributes=req_data.model_dump(exclude_none=True, by_alias=True),
-            )
+    return _write(
+        q.create_entity_tx,
+        entity_name=req_data.__class__.__name__,
+        attributes=req_data.model_dump(exclude_none=True, by_alias=True),
+    )
 
 
 @deprecated("This function has been deprecated")
-def create_relationship(entity_1_name: str, entity_1_id: str, entity_2_name: str, entity_2_id: str, relationship: str):
-    with GraphDatabase.driver(db_url, auth=db_settings.auth) as driver:
-        with driver.session(database=db_settings.name) as session:
-            return session.execute_write(
-                q.create_relationship,
-                entity_1_name=entity_1_name,
-                entity_1_id=entity_1_id,
-                entity_2_name=entity_2_name,
-                entity_2_id=entity_2_id,
-                relationship=relationship,
-            )
+def create_relationship(
+    entity_1_name: str,
+    entity_1_id: str,
+    entity_2_name: str,
+    entity_2_id: str,
+    relationship: str,
+):
+    return _write(
+        q.create_relationship,
+        entity_1_name=entity_1_name,
+        entity_1_id=entity_1_id,
+        entity_2_name=entity_2_name,
+        entity_2_id=entity_2_id,
+        relationship=relationship,
+    )
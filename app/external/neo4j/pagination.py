@@ -0,0 +1,66 @@
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from external.neo4j.exceptions import InvalidCursorError
+
+
+class Page(NamedTuple):
+    items: list[Any]
+    # opaque keyset cursor of the last item, None on the last page
+    next_cursor: str | None
+
+
+def encode_cursor(*values: Any) -> str:
+    return base64.urlsafe_b64encode(
+        json.dumps(values, separators=(",", ":")).encode()
+    ).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Decode a cursor made by `encode_cursor` holding `size` values."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from exc
+
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return values
+
+
+def build_page(
+    items: list[Any], limit: int, cursor_key: Callable[[Any], tuple]
+) -> Page:
+    """Build a page from up to `limit + 1` items, the extra item only tells that there is a next page."""
+    if len(items) > limit:
+        items = items[:limit]
+        return Page(items=items, next_cursor=encode_cursor(*cursor_key(items[-1])))
+    return Page(items=items, next_cursor=None)
+
+
+def search_cursor_key(hit: Any) -> tuple[float, str]:
+    """Keyset of the search results, which are ordered by descending `score` then `pid`."""
+    return hit.score, hit.node["pid"]
+
+
+def keyset_fields(fields: tuple[str, ...] | None) -> tuple[str, ...] | None:
+    """Properties to read for a projection of `fields` in the claim and document listings, with their keyset."""
+    return (
+        None
+        if fields is None
+        else tuple(dict.fromkeys((*fields, "submission_date", "pid")))
+    )
+
+
+# `submission_date` of the cursor after an item without one: undated items come after every dated one, this
+# timestamp (10000-01-01T00:00:00Z) is later than any date the models accept
+UNDATED = 253402300800.0
+
+
+def claim_cursor_key(claim: Any) -> tuple[float, str]:
+    """Keyset of the claim and document listings, which are ordered by `submission_date` (undated last) then `pid`."""
+    date = claim.get("submission_date")
+    return UNDATED if date is None else date, claim["pid"]
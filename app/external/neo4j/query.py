@@ -1,63 +1,704 @@
-from typing import Any
+import re
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import Any, NamedTuple
 from warnings import deprecated
 
 from neomodel import db
 
+from external.neo4j.counters import UPDATE_CLAIM_STATUS_QUERY, on_create_counters
+from external.neo4j.pagination import UNDATED
+from external.neo4j.serializers import Claim
 
-def get_claims_by_person(person_id: str):
+###
+# Cypher statements shared by the sync (neomodel) and async (driver) data paths
+###
+# holder of the claims -> (pattern from the holder to its claims `cl`, parameter of the holder pid)
+_CLAIM_HOLDERS = {
+    "person": ("(:Person {pid: $person_id})-[:SUBMITTED]->(cl:Claim)", "person_id"),
+    "company": (
+        "(cl:Claim)-[:HAS_CLAIMANT]->(:Company {pid: $company_id})",
+        "company_id",
+    ),
+}
+
+
+def node_projection(var: str, fields: Iterable[str] | None) -> str:
+    """RETURN item of the node `var`: the node, or a map projection of only `fields`.
+
+    The fields are interpolated, so they must be validated by the caller.
+    """
+    if fields is None:
+        return var
+    return f"{var} {{{', '.join(f'.{field}' for field in fields)}}} AS {var}_fields"
+
+
+def claims_by_holder_query(
+    holder: str,
+    fields: Iterable[str] | None = None,
+    stream: bool = False,
+    undated: bool = False,
+    after: bool = False,
+    since: bool = False,
+    until: bool = False,
+    by_status: bool = False,
+) -> str:
+    """Claims of a person or a company: a page of the dated ones, a page of the undated ones, or the whole stream.
+
+    Pages of dated claims are read from the Claim (submission_date, pid) range index, in order and up to the LIMIT,
+    the holder being an EXISTS filter of each claim, so their cost follows the page size (and the share of the
+    holder's claims in the window) rather than the number of claims of the holder. Claims without a `submission_date`
+    come after every dated claim: `undated` pages them by pid from the holder. The stream reads every claim of the
+    holder, unordered. Only the predicates in use are written.
+    """
+    pattern, _ = _CLAIM_HOLDERS[holder]
+    claim = node_projection("cl", fields)
+    predicates = []
+    if stream:
+        if since:
+            predicates.append("cl.submission_date >= $since")
+        if until:
+            predicates.append("cl.submission_date < $until")
+    elif undated:
+        predicates.append("cl.submission_date IS NULL")
+        if after:
+            predicates.append("cl.pid > $after_pid")
+    else:
+        predicates.append(
+            "cl.submission_date >= $since"
+            if since
+            else "cl.submission_date IS NOT NULL"
+        )
+        if until:
+            predicates.append("cl.submission_date < $until")
+        if after:
+            predicates += [
+                "cl.submission_date >= $after_date",
+                "(cl.submission_date > $after_date OR cl.pid > $after_pid)",
+            ]
+    if by_status:
+        predicates.append("cl.status = $status")
+
+    where = "WHERE " + "\n          AND ".join(predicates) if predicates else ""
+    if stream:
+        return f"""
+        MATCH {pattern}
+        {where}
+        RETURN {claim}
+    """
+    if undated:
+        return f"""
+        MATCH {pattern}
+        {where}
+        RETURN {claim}
+        ORDER BY cl.pid
+        LIMIT $limit
+    """
+    return f"""
+        MATCH (cl:Claim)
+        {where}
+          AND EXISTS {{ {pattern} }}
+        RETURN {claim}
+        ORDER BY cl.submission_date, cl.pid
+        LIMIT $limit
+    """
+
+
+def claims_by_holder_statement(
+    holder: str,
+    holder_id: str,
+    limit: int | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    status: str | None = None,
+    after_date: float | None = None,
+    after_pid: str | None = None,
+    fields: Iterable[str] | None = None,
+    stream: bool = False,
+    undated: bool = False,
+) -> tuple[str, dict[str, Any]]:
+    """Query and parameters of a `claims_by_holder_query`, the filters left to None are not applied."""
+    _, id_param = _CLAIM_HOLDERS[holder]
+    query = claims_by_holder_query(
+        holder,
+        fields,
+        stream=stream,
+        undated=undated,
+        after=after_pid is not None,
+        since=since is not None,
+        until=until is not None,
+        by_status=status is not None,
+    )
+    params = {
+        id_param: holder_id,
+        "limit": limit,
+        "since": submission_timestamp(since),
+        "until": submission_timestamp(until),
+        "status": status,
+        "after_date": after_date,
+        "after_pid": after_pid,
+    }
+    return query, params
+
+
+def claims_by_holder_statements(
+    holder: str,
+    holder_id: str,
+    limit: int,
+    after_date: float | None = None,
+    after_pid: str | None = None,
+    **filters: Any,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Statements of a page of the claims of a holder after the (`after_date`, `after_pid`) cursor.
+
+    The dated claims first, unless the cursor is past them (`UNDATED`), then the undated ones, unless a submission
+    window excludes them. The caller sends the second statement with `limit` lowered to the rows still missing, and
+    stops once the page is full.
+    """
+    if after_date != UNDATED:
+        yield claims_by_holder_statement(
+            holder,
+            holder_id,
+            limit,
+            after_date=after_date,
+            after_pid=after_pid,
+            **filters,
+        )
+    if filters.get("since") is None and filters.get("until") is None:
+        yield claims_by_holder_statement(
+            holder,
+            holder_id,
+            limit,
+            after_pid=after_pid if after_date == UNDATED else None,
+            undated=True,
+            **filters,
+        )
+
+
+COMPANY_BY_PERSON_QUERY = """
+    MATCH (pe:Person)-[r:WORKS_FOR]->(co:Company)
+    WHERE pe.pid = $person_id
+    RETURN co
+"""
+
+
+# Same statement as neomodel's `clear_neo4j_database`, which keeps the constraints and indexes
+CLEAR_DB_QUERY = """
+    MATCH (a)
+    CALL { WITH a DETACH DELETE a }
+    IN TRANSACTIONS OF 5000 ROWS
+"""
+
+
+# claim aggregation dimension -> grouping expression
+CLAIM_STATS_GROUPS = {"status": "cl.status", "company": "co.pid", "person": "pe.pid"}
+
+
+# Ranked full-text search, keyset paged after the ($after_score, $after_pid) cursor
+SEARCH_QUERY = """
+    CALL db.index.fulltext.queryNodes($index, $text) YIELD node, score
+    WHERE $after_score IS NULL
+        OR score < $after_score
+        OR (score = $after_score AND node.pid > $after_pid)
+    RETURN node, score
+    ORDER BY score DESC, node.pid
+    LIMIT $limit
+"""
+
+# Lucene query syntax characters, escaped so the search text is matched literally
+_LUCENE_SPECIAL = re.compile(r'([+\-!(){}\[\]^"~*?:\\/]|&&|\|\|)')
+
+
+_LUCENE_OPERATORS = {"AND", "OR", "NOT"}
+
+
+def search_text(text: str) -> str:
+    """Escape `text` into a Lucene query matching any of its terms."""
+    terms = (
+        term.lower() if term in _LUCENE_OPERATORS else term for term in text.split()
+    )
+    return " ".join(_LUCENE_SPECIAL.sub(r"\\\1", term) for term in terms)
+
+
+def submission_timestamp(value: datetime | None) -> float | None:
+    """`submission_date` as stored by the node models, to compare it in Cypher."""
+    return None if value is None else Claim.submission_date.deflate(value)
+
+
+def node_by_pid_query(label: str, fields: Iterable[str] | None = None) -> str:
+    return (
+        f"MATCH (n:{label} {{pid: $pid}}) RETURN {node_projection('n', fields)} LIMIT 1"
+    )
+
+
+def nodes_by_pids_query(label: str) -> str:
+    return f"MATCH (n:{label}) WHERE n.pid IN $pids RETURN n"
+
+
+def nodes_page_query(label: str) -> str:
+    """Page of the `label` nodes after the `$after` pid, seeking and reading the pid index in order."""
+    return (
+        f"MATCH (n:{label}) WHERE n.pid > $after RETURN n ORDER BY n.pid LIMIT $limit"
+    )
+
+
+def links_page_query(from_label: str, to_label: str, relationship: str) -> str:
+    """Page of the `relationship` links after the ($after_from, $after_to) pids, in (from pid, to pid) order."""
+    return f"""
+        MATCH (a:{from_label})-[:{relationship}]->(b:{to_label})
+        WHERE a.pid >= $after_from AND (a.pid > $after_from OR b.pid > $after_to)
+        RETURN DISTINCT a.pid, b.pid
+        ORDER BY a.pid, b.pid
+        LIMIT $limit
+    """
+
+
+def count_nodes_query(label: str) -> str:
+    return f"MATCH (n:{label}) RETURN count(n)"
+
+
+def pids_by_label_query(label: str) -> str:
+    return f"MATCH (n:{label}) RETURN n.pid"
+
+
+def create_node_query(label: str) -> str:
+    return f"CREATE (n:{label} $properties) RETURN n"
+
+
+def create_relationship_by_pid_query(
+    from_label: str, to_label: str, relationship: str
+) -> str:
+    """Look up both endpoints and MERGE the relationship between them in a single statement, counting a new claim
+    relationship on its holder (see `external.neo4j.counters`).
+
+    Labels and relationship type are interpolated, so they must come from the node models and never from user input.
+    """
+    return f"""
+        OPTIONAL MATCH (a:{from_label} {{pid: $from_id}})
+        OPTIONAL MATCH (b:{to_label} {{pid: $to_id}})
+        WITH a, b, CASE
+            WHEN a IS NULL OR b IS NULL THEN false
+            ELSE EXISTS {{ (a)-[:{relationship}]->(b) }}
+        END AS existed
+        FOREACH (_ IN CASE WHEN a IS NOT NULL AND b IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (a)-[:{relationship}]->(b)
+            {on_create_counters(relationship)}
+        )
+        RETURN a IS NOT NULL, b IS NOT NULL, a IS NOT NULL AND b IS NOT NULL AND NOT existed
+        LIMIT 1
+    """
+
+
+def bulk_merge_nodes_query(label: str) -> str:
+    """Create every row that does not exist yet, keyed by pid, and report which ones were created."""
+    return f"""
+        UNWIND $rows AS row
+        OPTIONAL MATCH (existing:{label} {{pid: row.pid}})
+        WITH row, existing IS NULL AS created
+        MERGE (n:{label} {{pid: row.pid}})
+        ON CREATE SET n = row
+        RETURN row.pid AS pid, created
+    """
+
+
+def bulk_merge_relationships_query(
+    from_label: str, to_label: str, relationship: str
+) -> str:
+    """MERGE every link whose endpoints both exist and return only the links that were skipped."""
+    return f"""
+        UNWIND $links AS link
+        OPTIONAL MATCH (a:{from_label} {{pid: link.from_id}})
+        OPTIONAL MATCH (b:{to_label} {{pid: link.to_id}})
+        FOREACH (_ IN CASE WHEN a IS NOT NULL AND b IS NOT NULL THEN [1] ELSE [] END |
+            MERGE (a)-[:{relationship}]->(b)
+            {on_create_counters(relationship)}
+        )
+        WITH link, a, b
+        WHERE a IS NULL OR b IS NULL
+        RETURN link.from_id, link.to_id, a IS NOT NULL, b IS NOT NULL
+    """
+
+
+def submitted_nodes_query(
+    label: str,
+    since: bool,
+    until: bool,
+    by_status: bool,
+    after: bool,
+    fields: Iterable[str] | None = None,
+) -> str:
+    """Nodes of `label` ordered by `submission_date` then `pid`, paged after the ($after_date, $after_pid) cursor.
+
+    Only the predicates in use are written: the lower bound (or the IS NOT NULL scan without one) and the upper bound
+    are seeks of the (submission_date, pid) range index, read in order, so the cost follows the window and the page
+    size rather than the number of nodes. Nodes without a `submission_date` are never listed.
+    """
+    predicates = [
+        "n.submission_date >= $since" if since else "n.submission_date IS NOT NULL"
+    ]
+    if until:
+        predicates.append("n.submission_date < $until")
+    if after:
+        predicates += [
+            "n.submission_date >= $after_date",
+            "(n.submission_date > $after_date OR n.pid > $after_pid)",
+        ]
+    if by_status:
+        predicates.append("n.status = $status")
+    conditions = "\n          AND ".join(predicates)
+    return f"""
+        MATCH (n:{label})
+        WHERE {conditions}
+        RETURN {node_projection("n", fields)}
+        ORDER BY n.submission_date, n.pid
+        LIMIT $limit
+    """
+
+
+def subgraph_query(label: str, relationships: Iterable[str], depth: int) -> str:
+    """Neighbourhood of the node with pid `$pid` up to `depth` hops over `relationships`, in either direction.
+
+    Nodes are deduplicated before the LIMIT, which lets the planner prune the variable length expansion instead of
+    enumerating every path. Only edges between returned nodes are kept, and one more node/edge than the caps is
+    fetched to tell whether the result was truncated. Label, types and depth are interpolated, so they must be
+    validated by the caller.
+    """
+    types = "|".join(relationships)
+    return f"""
+        MATCH (root:{label} {{pid: $pid}})
+        CALL {{
+            WITH root
+            MATCH (root)-[:{types}*1..{depth}]-(n)
+            WHERE n <> root
+            WITH DISTINCT n
+            LIMIT $max_nodes
+            RETURN collect(n) AS neighbours
+        }}
+        WITH [root] + neighbours[..$max_nodes - 1] AS nodes, size(neighbours) >= $max_nodes AS nodes_truncated
+        CALL {{
+            WITH nodes
+            UNWIND nodes AS a
+            MATCH (a)-[r:{types}]->(b)
+            WHERE b IN nodes
+            WITH r
+            LIMIT $max_edges + 1
+            RETURN collect(r) AS rels
+        }}
+        RETURN
+            nodes,
+            [r IN rels[..$max_edges] | [startNode(r).pid, type(r), endNode(r).pid]] AS edges,
+            nodes_truncated OR size(rels) > $max_edges AS truncated
+    """
+
+
+def claim_stats_query(
+    group_by: Iterable[str], by_company: bool = False, by_person: bool = False
+) -> str:
+    """Count, sum, min, max and average of `Claim.amount` per `group_by` dimension (keys of `CLAIM_STATS_GROUPS`).
+
+    `by_company`/`by_person` restrict the claims to the ones of `$company_id`/`$person_id`. Companies and persons are
+    only matched when filtered or grouped on; a claim without one falls in the null group.
+    """
+    group_by = list(group_by)
+    clauses = ["MATCH (cl:Claim)"]
+    if by_company:
+        clauses.append("MATCH (cl)-[:HAS_CLAIMANT]->(co:Company {pid: $company_id})")
+    elif "company" in group_by:
+        clauses.append("OPTIONAL MATCH (cl)-[:HAS_CLAIMANT]->(co:Company)")
+    if by_person:
+        clauses.append("MATCH (pe:Person {pid: $person_id})-[:SUBMITTED]->(cl)")
+    elif "person" in group_by:
+        clauses.append("OPTIONAL MATCH (pe:Person)-[:SUBMITTED]->(cl)")
+
+    groups = [f"{CLAIM_STATS_GROUPS[group]} AS {group}" for group in group_by]
+    aggregates = [
+        "count(cl) AS count",
+        "sum(cl.amount) AS sum",
+        "min(cl.amount) AS min",
+        "max(cl.amount) AS max",
+        "avg(cl.amount) AS avg",
+    ]
+    clauses.append(f"RETURN {', '.join(groups + aggregates)}")
+    if group_by:
+        clauses.append(f"ORDER BY {', '.join(group_by)}")
+    return "\n".join(clauses)
+
+
+class RelationshipWriteResult(NamedTuple):
+    from_found: bool
+    to_found: bool
+    created: bool
+
+
+class MissingLink(NamedTuple):
+    from_id: str
+    to_id: str
+    from_found: bool
+    to_found: bool
+
+
+class SubgraphEdge(NamedTuple):
+    from_id: str
+    type: str
+    to_id: str
+
+
+class Subgraph(NamedTuple):
+    # the root node first
+    nodes: list[Any]
+    edges: list[SubgraphEdge]
+    # whether the node or edge cap cut the neighbourhood short
+    truncated: bool
+
+    @classmethod
+    def from_record(
+        cls, nodes: list[Any], edges: list[list[str]], truncated: bool
+    ) -> "Subgraph":
+        return cls(
+            nodes=nodes,
+            edges=[SubgraphEdge(*edge) for edge in edges],
+            truncated=truncated,
+        )
+
+
+class SearchHit(NamedTuple):
+    node: Any
+    score: float
+
+
+class ClaimStatusUpdate(NamedTuple):
+    claim: Any
+    # (label, pid) of the companies and persons whose counters were updated
+    holders: list[tuple[str, str]]
+
+
+class ClaimStats(NamedTuple):
+    # grouping dimension -> value
+    group: dict[str, Any]
+    count: int
+    sum: float
+    min: float | None
+    max: float | None
+    avg: float | None
+
+    @classmethod
+    def from_row(cls, group_by: list[str], row: list[Any]) -> "ClaimStats":
+        size = len(group_by)
+        return cls(dict(zip(group_by, row[:size])), *row[size:])
+
+
+def get_claims_by_holder(
+    holder: str, holder_id: str, limit: int, **filters: Any
+) -> list[Any]:
+    claims: list[Any] = []
+    for query, params in claims_by_holder_statements(
+        holder, holder_id, limit, **filters
+    ):
+        results, _ = db.cypher_query(
+            query, params={**params, "limit": limit - len(claims)}
+        )
+        claims += [row[0] for row in results]
+        if len(claims) >= limit:
+            break
+    return claims
+
+
+def get_claims_by_person(person_id: str, limit: int, **filters: Any) -> list[Any]:
+    return get_claims_by_holder("person", person_id, limit, **filters)
+
+
+def get_claims_by_company(company_id: str, limit: int, **filters: Any) -> list[Any]:
+    return get_claims_by_holder("company", company_id, limit, **filters)
+
+
+def submitted_nodes_statement(
+    label: str,
+    limit: int,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    status: str | None = None,
+    after_date: float | None = None,
+    after_pid: str | None = None,
+    fields: Iterable[str] | None = None,
+) -> tuple[str, dict[str, Any]]:
+    """Query and parameters of a `submitted_nodes_query` page, the filters left to None are not applied."""
+    query = submitted_nodes_query(
+        label,
+        since=since is not None,
+        until=until is not None,
+        by_status=status is not None,
+        after=after_pid is not None,
+        fields=fields,
+    )
+    params = {
+        "limit": limit,
+        "since": submission_timestamp(since),
+        "until": submission_timestamp(until),
+        "status": status,
+        "after_date": after_date,
+        "after_pid": after_pid,
+    }
+    return query, params
+
+
+def get_submitted_nodes(label: str, limit: int, **filters: Any) -> list[Any]:
+    results = db.cypher_query(*submitted_nodes_statement(label, limit, **filters))
+    return [row[0] for row in results[0]]
+
+
+def get_node_by_pid(
+    label: str, pid: str, fields: Iterable[str] | None = None
+) -> Any | None:
+    results = db.cypher_query(node_by_pid_query(label, fields), params={"pid": pid})
+    return results[0][0][0] if results[0] else None
+
+
+def get_nodes_by_pids(label: str, pids: list[str]) -> list[Any]:
+    results = db.cypher_query(nodes_by_pids_query(label), params={"pids": pids})
+    return [row[0] for row in results[0]]
+
+
+def get_nodes_page(label: str, after: str, limit: int) -> list[Any]:
     results = db.cypher_query(
-        """
-            MATCH (pe:Person)-[r:SUBMITTED]->(cl:Claim)
-            WHERE pe.pid = $person_id
-            RETURN cl
-        """,
-        params={"person_id": person_id},
+        nodes_page_query(label), params={"after": after, "limit": limit}
     )
-    # only the list of nodes
-    try:
-        return [claim[0] for claim in results[0]]
-    except IndexError:
-        return None
+    return [row[0] for row in results[0]]
 
 
-def get_claims_by_company(company_id: str):
+def get_links_page(
+    from_label: str,
+    to_label: str,
+    relationship: str,
+    after_from: str,
+    after_to: str,
+    limit: int,
+) -> list[tuple[str, str]]:
     results = db.cypher_query(
-        """
-            MATCH (cl:Claim)-[r:HAS_CLAIMANT]->(co:Company)
-            WHERE co.pid = $company_id
-            RETURN cl
-        """,
-        params={"company_id": company_id},
+        links_page_query(
+            from_label=from_label, to_label=to_label, relationship=relationship
+        ),
+        params={"after_from": after_from, "after_to": after_to, "limit": limit},
     )
-    # only the list of nodes
+    return [(from_id, to_id) for from_id, to_id in results[0]]
+
+
+def get_company_by_person(person_id: str):
+    results = db.cypher_query(COMPANY_BY_PERSON_QUERY, params={"person_id": person_id})
+    # only the first node
     try:
-        return [claim[0] for claim in results[0]]
+        return results[0][0][0]
     except IndexError:
         return None
 
 
-def get_company_by_person(person_id: str):
+def search_nodes(
+    index: str,
+    text: str,
+    limit: int,
+    after_score: float | None = None,
+    after_pid: str | None = None,
+) -> list[SearchHit]:
     results = db.cypher_query(
-        """
-            MATCH (pe:Person)-[r:WORKS_FOR]->(co:Company)
-            WHERE pe.pid = $person_id
-            RETURN co
-        """,
-        params={"person_id": person_id},
+        SEARCH_QUERY,
+        params={
+            "index": index,
+            "text": search_text(text),
+            "limit": limit,
+            "after_score": after_score,
+            "after_pid": after_pid,
+        },
     )
-    # only the first node
+    return [SearchHit(*row) for row in results[0]]
+
+
+def get_subgraph(
+    label: str,
+    pid: str,
+    relationships: Iterable[str],
+    depth: int,
+    max_nodes: int,
+    max_edges: int,
+) -> Subgraph | None:
+    results = db.cypher_query(
+        subgraph_query(label=label, relationships=relationships, depth=depth),
+        params={"pid": pid, "max_nodes": max_nodes, "max_edges": max_edges},
+    )
+    # no row when the root node does not exist
     try:
-        return results[0][0][0]
+        return Subgraph.from_record(*results[0][0])
     except IndexError:
         return None
 
 
+def get_claim_stats(
+    group_by: Iterable[str], company_id: str | None = None, person_id: str | None = None
+) -> list[ClaimStats]:
+    group_by = list(group_by)
+    results = db.cypher_query(
+        claim_stats_query(
+            group_by, by_company=company_id is not None, by_person=person_id is not None
+        ),
+        params={"company_id": company_id, "person_id": person_id},
+    )
+    return [ClaimStats.from_row(group_by, row) for row in results[0]]
+
+
+def create_relationship_by_pid(
+    from_label: str,
+    from_id: str,
+    to_label: str,
+    to_id: str,
+    relationship: str,
+) -> RelationshipWriteResult:
+    results = db.cypher_query(
+        create_relationship_by_pid_query(
+            from_label=from_label, to_label=to_label, relationship=relationship
+        ),
+        params={"from_id": from_id, "to_id": to_id},
+    )
+    return RelationshipWriteResult(*results[0][0])
+
+
+def bulk_merge_nodes(tx, label: str, rows: list[dict[str, Any]]) -> dict[str, bool]:
+    result = tx.run(bulk_merge_nodes_query(label), rows=rows)
+    return {record["pid"]: record["created"] for record in result}
+
+
+def update_claim_status(tx, claim_id: str, status: str) -> ClaimStatusUpdate | None:
+    record = tx.run(
+        UPDATE_CLAIM_STATUS_QUERY, claim_id=claim_id, status=status
+    ).single()
+    return (
+        ClaimStatusUpdate(record["cl"], [tuple(holder) for holder in record["holders"]])
+        if record
+        else None
+    )
+
+
+def bulk_merge_relationships(
+    tx,
+    from_label: str,
+    to_label: str,
+    relationship: str,
+    links: list[dict[str, str]],
+) -> list[MissingLink]:
+    result = tx.run(
+        bulk_merge_relationships_query(
+            from_label=from_label, to_label=to_label, relationship=relationship
+        ),
+        links=links,
+    )
+    return [MissingLink(*record.values()) for record in result]
+
+
 ###
 # Deprecated
 ###
 
 
-@deprecated("This function has been deprecated")
+@deprecated(
+    "This function has been deprecated, use `operations.export_rows`, which pages through the label"
+)
 def get_all_entities(tx, entity_name: str):
     entity_alias = entity_name.lower()[:2]
 
@@ -0,0 +1,144 @@
+"""Retries of transactions failing with transient errors (leader switch, deadlock, expired session, lost connection).
+
+The driver's own retries of `execute_read`/`execute_write` are turned off (`max_transaction_retry_time=0` in
+`DB.pool_config`) so every transaction, neomodel ones included, is retried here with the same bounded backoff and
+counted in the same place.
+
+The retries share one deadline per request: `bind_request_deadline` (called by a middleware) starts it, so a request
+running several operations cannot retry each of them for the whole deadline. Outside a request (commands, background
+tasks) every operation gets its own deadline.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from neo4j.exceptions import DriverError, Neo4jError
+
+from core.logging.logger import get_logger
+from core.settings import get_settings
+from external.neo4j.exceptions import DatabaseUnavailableError
+
+logger = get_logger()
+settings = get_settings()
+db_settings = settings.db_settings
+
+T = TypeVar("T")
+
+# monotonic time at which the retries of the current request stop
+_request_deadline: ContextVar[float | None] = ContextVar(
+    "transaction_retry_request_deadline", default=None
+)
+
+
+def bind_request_deadline(budget: float) -> None:
+    _request_deadline.set(time.monotonic() + budget)
+
+
+def is_transient(exc: BaseException) -> bool:
+    return isinstance(exc, (Neo4jError, DriverError)) and exc.is_retryable()
+
+
+class RetryPolicy:
+    """Bounded exponential backoff with full jitter, within the request deadline or else a deadline per operation."""
+
+    def __init__(
+        self,
+        max_attempts: int,
+        initial_delay: float,
+        max_delay: float,
+        deadline: float,
+        multiplier: float = 2,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.multiplier = multiplier
+
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.failures = 0
+
+    def _next_delay(
+        self, attempt: int, expires_at: float, exc: BaseException
+    ) -> float | None:
+        """Delay before the attempt following `attempt`, None when `exc` must be raised."""
+        if not is_transient(exc) or attempt >= self.max_attempts:
+            return None
+
+        backoff = min(
+            self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1)
+        )
+        delay = random.uniform(0, backoff)
+        if time.monotonic() + delay >= expires_at:
+            return None
+        with self._lock:
+            self.retries += 1
+        logger.warning(
+            f"Retrying transaction after transient error (attempt {attempt}): {exc}"
+        )
+        return delay
+
+    def _expires_at(self) -> float:
+        if (expires_at := _request_deadline.get()) is not None:
+            return expires_at
+        return time.monotonic() + self.deadline
+
+    def _give_up(self, attempt: int, exc: BaseException) -> None:
+        if not is_transient(exc):
+            return
+        with self._lock:
+            self.failures += 1
+        raise DatabaseUnavailableError(
+            f"Database unavailable after {attempt} attempts: {exc}"
+        ) from exc
+
+    def run(self, fn: Callable[[], T]) -> T:
+        """Call `fn`, which must run whole transactions, retrying it on transient errors."""
+        expires_at = self._expires_at()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return fn()
+            except Exception as exc:
+                if (delay := self._next_delay(attempt, expires_at, exc)) is None:
+                    self._give_up(attempt, exc)
+                    raise
+            time.sleep(delay)
+
+    async def arun(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async counterpart of `run`, `fn` returns an awaitable."""
+        expires_at = self._expires_at()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await fn()
+            except Exception as exc:
+                if (delay := self._next_delay(attempt, expires_at, exc)) is None:
+                    self._give_up(attempt, exc)
+                    raise
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "max_attempts": self.max_attempts,
+                "deadline": self.deadline,
+                "retries": self.retries,
+                "failures": self.failures,
+            }
+
+
+transaction_retry = RetryPolicy(
+    max_attempts=db_settings.transaction_retry_max_attempts,
+    initial_delay=db_settings.transaction_retry_initial_delay,
+    max_delay=db_settings.transaction_retry_max_delay,
+    deadline=db_settings.transaction_retry_deadline,
+)
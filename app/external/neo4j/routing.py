@@ -0,0 +1,85 @@
+"""Access mode routing and causal bookmarks.
+
+Every data operation runs in a session tagged READ or WRITE, so a routing driver (`DB_PREFIX=neo4j`) sends reads to
+followers/read replicas and writes to the leader. Each request carries the bookmarks the client echoed back in the
+`X-Neo4j-Bookmarks` header; sessions wait for them before running, and a write replaces them with its own bookmarks,
+which are returned in the same header. A client echoing the header after a POST therefore reads its own writes, even
+from another replica or API worker.
+"""
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from neo4j import READ_ACCESS, WRITE_ACCESS, Bookmarks
+from neomodel import db
+
+from core.settings import get_settings
+
+settings = get_settings()
+db_settings = settings.db_settings
+
+BOOKMARKS_HEADER = "X-Neo4j-Bookmarks"
+
+
+class BookmarkHolder:
+    """Bookmarks of one request. It is shared by reference, so writes made in threadpool workers (which run in a copy
+    of the request context) are still seen by the middleware."""
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        self.values = frozenset(values)
+
+
+_bookmarks: ContextVar[BookmarkHolder | None] = ContextVar(
+    "neo4j_bookmarks", default=None
+)
+
+
+def bind_bookmarks(values: Iterable[str]) -> BookmarkHolder:
+    holder = BookmarkHolder(values)
+    _bookmarks.set(holder)
+    return holder
+
+
+def current_bookmarks() -> Bookmarks | None:
+    holder = _bookmarks.get()
+    if holder is None or not holder.values:
+        return None
+    return Bookmarks.from_raw_values(holder.values)
+
+
+def record_bookmarks(bookmarks: Bookmarks | None) -> None:
+    """Keep the bookmarks of a committed write. They causally follow the ones the session started from."""
+    holder = _bookmarks.get()
+    if holder is not None and bookmarks is not None and bookmarks.raw_values:
+        holder.values = bookmarks.raw_values
+
+
+def session_config(access_mode: str) -> dict[str, Any]:
+    return {
+        "database": db_settings.name,
+        "default_access_mode": access_mode,
+        "bookmarks": current_bookmarks(),
+    }
+
+
+@contextmanager
+def transaction(access_mode: str) -> Iterator[None]:
+    """Run the neomodel calls of the block in one transaction with `access_mode`, waiting for the request bookmarks."""
+    proxy = db.read_transaction if access_mode == READ_ACCESS else db.write_transaction
+    proxy.bookmarks = current_bookmarks()
+    with proxy:
+        yield
+    if access_mode == WRITE_ACCESS:
+        record_bookmarks(proxy.last_bookmark)
+
+
+def parse_bookmarks_header(value: str | None) -> list[str]:
+    if not value:
+        return []
+    return [bookmark.strip() for bookmark in value.split(",") if bookmark.strip()]
+
+
+def format_bookmarks_header(values: Iterable[str]) -> str:
+    return ",".join(sorted(values))
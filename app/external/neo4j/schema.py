@@ -0,0 +1,129 @@
+from typing import NamedTuple
+
+from core.logging.logger import get_logger
+from core.settings import get_settings
+from external.neo4j.driver import get_driver
+
+logger = get_logger()
+settings = get_settings()
+db_settings = settings.db_settings
+
+
+class SchemaItem(NamedTuple):
+    name: str
+    statement: str
+
+
+class SchemaReport(NamedTuple):
+    missing: list[str]
+    # index name -> population percentage
+    populating: dict[str, float]
+    failed: list[str]
+
+    @property
+    def is_ready(self) -> bool:
+        return not (self.missing or self.populating or self.failed)
+
+
+def _unique_constraint(label: str, prop: str) -> SchemaItem:
+    # Same naming as neomodel's `install_labels` so both tools recognise the constraint.
+    name = f"constraint_unique_{label}_{prop}"
+    return SchemaItem(
+        name,
+        f"CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE",
+    )
+
+
+def _range_index(label: str, *props: str) -> SchemaItem:
+    name = f"index_{label}_{'_'.join(props)}"
+    properties = ", ".join(f"n.{prop}" for prop in props)
+    return SchemaItem(
+        name,
+        f"CREATE RANGE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON ({properties})",
+    )
+
+
+def fulltext_index_name(label: str) -> str:
+    return f"fulltext_{label}"
+
+
+def _fulltext_index(label: str, *props: str) -> SchemaItem:
+    name = fulltext_index_name(label)
+    properties = ", ".join(f"n.{prop}" for prop in props)
+    return SchemaItem(
+        name,
+        f"CREATE FULLTEXT INDEX {name} IF NOT EXISTS FOR (n:{label}) ON EACH [{properties}]",
+    )
+
+
+# label -> properties of its full-text index, searched by the search endpoint
+FULLTEXT_PROPERTIES: dict[str, tuple[str, ...]] = {
+    "Person": ("name", "email", "phone"),
+    "Company": ("name", "registration_number"),
+    "Document": ("title", "doc_number"),
+}
+
+###
+# Schema required by the node models and the queries in `query.py`.
+# Every lookup is by `pid`; the uniqueness constraints are backed by range indexes on it.
+###
+SCHEMA: list[SchemaItem] = [
+    _unique_constraint("Person", "pid"),
+    _unique_constraint("Company", "pid"),
+    _unique_constraint("Claim", "pid"),
+    _unique_constraint("Document", "pid"),
+    # keyset order and date windows of the claim and document listings
+    _range_index("Claim", "submission_date", "pid"),
+    _range_index("Document", "submission_date", "pid"),
+    # search endpoint
+    *(_fulltext_index(label, *props) for label, props in FULLTEXT_PROPERTIES.items()),
+]
+
+
+def apply_schema() -> None:
+    """Create every constraint and index in `SCHEMA` that does not exist yet."""
+    with get_driver().session(database=db_settings.name) as session:
+        for item in SCHEMA:
+            session.run(item.statement).consume()
+
+
+def check_schema() -> SchemaReport:
+    """Report the items of `SCHEMA` that are missing, still populating or failed."""
+    with get_driver().session(database=db_settings.name) as session:
+        constraints = set(session.run("SHOW CONSTRAINTS YIELD name").value())
+        indexes = {
+            record["name"]: (record["state"], record["populationPercent"])
+            for record in session.run(
+                "SHOW INDEXES YIELD name, state, populationPercent"
+            )
+        }
+
+    missing, populating, failed = [], {}, []
+    for item in SCHEMA:
+        if item.name not in constraints and item.name not in indexes:
+            missing.append(item.name)
+            continue
+
+        # Constraints are backed by an index with the same name
+        state, population_percent = indexes.get(item.name, ("ONLINE", 100.0))
+        if state == "FAILED":
+            failed.append(item.name)
+        elif state != "ONLINE":
+            populating[item.name] = population_percent
+
+    return SchemaReport(missing=missing, populating=populating, failed=failed)
+
+
+def bootstrap_schema() -> SchemaReport:
+    """Apply the schema and log anything that is not usable yet."""
+    apply_schema()
+    report = check_schema()
+
+    if report.is_ready:
+        logger.info("Neo4j schema is online")
+    else:
+        logger.warning(
+            f"Neo4j schema is not ready. Missing: {report.missing}, populating: {report.populating}, "
+            f"failed: {report.failed}"
+        )
+    return report
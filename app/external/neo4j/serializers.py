@@ -1,10 +1,11 @@
 from neomodel import (
-    StructuredNode,
-    StringProperty,
     DateTimeProperty,
     FloatProperty,
-    UniqueIdProperty,
+    IntegerProperty,
     RelationshipTo,
+    StringProperty,
+    StructuredNode,
+    UniqueIdProperty,
 )
 
 
@@ -15,6 +16,14 @@ class Company(StructuredNode):
     registration_number = StringProperty()
     address = StringProperty()
 
+    # claim counters, maintained by `external.neo4j.counters`
+    claim_count = IntegerProperty(default=0)
+    claim_amount = FloatProperty(default=0)
+    claim_count_submitted = IntegerProperty(default=0)
+    claim_count_processing = IntegerProperty(default=0)
+    claim_count_approved = IntegerProperty(default=0)
+    claim_count_rejected = IntegerProperty(default=0)
+
 
 class Claim(StructuredNode):
     pid = UniqueIdProperty()
@@ -43,6 +52,20 @@ class Person(StructuredNode):
     email = StringProperty()
     phone = StringProperty()
 
+    # claim counters, maintained by `external.neo4j.counters`
+    claim_count = IntegerProperty(default=0)
+    claim_amount = FloatProperty(default=0)
+    claim_count_submitted = IntegerProperty(default=0)
+    claim_count_processing = IntegerProperty(default=0)
+    claim_count_approved = IntegerProperty(default=0)
+    claim_count_rejected = IntegerProperty(default=0)
+
     company = RelationshipTo("Company", "WORKS_FOR")
     claim = RelationshipTo("Claim", "SUBMITTED")
     document = RelationshipTo("Document", "SENT")
+
+
+# node models by label
+MODELS: dict[str, type[StructuredNode]] = {
+    model.__label__: model for model in (Person, Company, Claim, Document)
+}
@@ -0,0 +1,189 @@
+"""Data operations run by the views, whatever the backend storing the graph.
+
+`external.neo4j.operations` implements them on Neo4j (`external.neo4j.async_operations` is its native asyncio
+counterpart, with the same signatures) and `external.memory.repository.InMemoryRepository` in the process memory.
+`views.helpers.run_operation` picks the backend from the `DB_BACKEND` setting and calls the operation by name.
+
+Entities are node model instances, listing items are raw nodes or projection dicts; missing entities raise
+`EntityNotFoundError` and bad cursors `InvalidCursorError` on every backend.
+"""
+
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any, Protocol
+
+from neomodel import StructuredNode
+
+from external.neo4j.bulk import BulkItemResult, BulkLinkResult
+from external.neo4j.pagination import Page
+from external.neo4j.query import ClaimStats, Subgraph
+
+
+class Repository(Protocol):
+    def check_db_connection(self) -> None: ...
+
+    def clear_db(self) -> None: ...
+
+    ###
+    # Entities
+    ###
+    def batch_get(
+        self, label: str, pids: tuple[str, ...]
+    ) -> list[StructuredNode | None]: ...
+
+    def get_person(
+        self, person_id: str, fields: tuple[str, ...] | None = None
+    ) -> StructuredNode | dict[str, Any]: ...
+
+    def create_person(self, **kwargs) -> StructuredNode: ...
+
+    def get_company(
+        self, company_id: str, fields: tuple[str, ...] | None = None
+    ) -> StructuredNode | dict[str, Any]: ...
+
+    def create_company(self, **kwargs) -> StructuredNode: ...
+
+    def get_claim(
+        self, claim_id: str, fields: tuple[str, ...] | None = None
+    ) -> StructuredNode | dict[str, Any]: ...
+
+    def create_claim(self, **kwargs) -> StructuredNode: ...
+
+    def update_claim_status(self, claim_id: str, status: str) -> StructuredNode: ...
+
+    def get_document(
+        self, document_id: str, fields: tuple[str, ...] | None = None
+    ) -> StructuredNode | dict[str, Any]: ...
+
+    def create_document(self, **kwargs) -> StructuredNode: ...
+
+    ###
+    # Bulk
+    ###
+    def bulk_create_persons(
+        self, items: list[dict[str, Any]]
+    ) -> list[BulkItemResult]: ...
+
+    def bulk_create_companies(
+        self, items: list[dict[str, Any]]
+    ) -> list[BulkItemResult]: ...
+
+    def bulk_create_claims(
+        self, items: list[dict[str, Any]]
+    ) -> list[BulkItemResult]: ...
+
+    def bulk_create_documents(
+        self, items: list[dict[str, Any]]
+    ) -> list[BulkItemResult]: ...
+
+    def bulk_create_relationships(
+        self, links: list[dict[str, str]]
+    ) -> BulkLinkResult: ...
+
+    ###
+    # Relationships
+    ###
+    def create_person_company_relationship(
+        self, person_id: str, company_id: str
+    ) -> bool: ...
+
+    def create_person_claim_relationship(
+        self, person_id: str, claim_id: str
+    ) -> bool: ...
+
+    def create_person_document_relationship(
+        self, person_id: str, document_id: str
+    ) -> bool: ...
+
+    def create_claim_company_relationship(
+        self, claim_id: str, company_id: str
+    ) -> bool: ...
+
+    ###
+    # Listings, search and aggregates
+    ###
+    def get_claims_by_person(
+        self,
+        person_id: str,
+        limit: int,
+        cursor: str | None = None,
+        fields: tuple[str, ...] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        status: str | None = None,
+    ) -> Page: ...
+
+    def get_claims_by_company(
+        self,
+        company_id: str,
+        limit: int,
+        cursor: str | None = None,
+        fields: tuple[str, ...] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        status: str | None = None,
+    ) -> Page: ...
+
+    def get_claims(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        status: str | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> Page: ...
+
+    def get_documents(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> Page: ...
+
+    def stream_claims_by_person(
+        self,
+        person_id: str,
+        fields: tuple[str, ...] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        status: str | None = None,
+    ) -> Iterator[Any]: ...
+
+    def stream_claims_by_company(
+        self,
+        company_id: str,
+        fields: tuple[str, ...] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        status: str | None = None,
+    ) -> Iterator[Any]: ...
+
+    def get_company_by_person(self, person_id: str) -> Any: ...
+
+    def search(
+        self, label: str, text: str, limit: int, cursor: str | None = None
+    ) -> Page: ...
+
+    def get_claim_stats(
+        self,
+        group_by: tuple[str, ...],
+        company_id: str | None = None,
+        person_id: str | None = None,
+    ) -> list[ClaimStats]: ...
+
+    def get_subgraph(
+        self,
+        label: str,
+        pid: str,
+        relationships: tuple[str, ...],
+        depth: int,
+        max_nodes: int,
+        max_edges: int,
+    ) -> Subgraph: ...
+
+    def export_rows(
+        self, kind: str, page_size: int | None = None
+    ) -> Iterator[dict[str, Any]]: ...
@@ -1,4 +1,5 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
@@ -7,18 +8,33 @@ from fastapi.exceptions import RequestValidationError
 from core.exceptions import AuthorizationErrorException
 from core.handlers import (
     catch_auth_exception,
+    catch_database_unavailable,
     catch_entity_not_found,
+    catch_invalid_cursor,
     catch_request_validation_exception,
 )
-from core.logging.context import get_temporary_log_context, set_request_ctx_application_settings
+from core.logging.context import (
+    get_temporary_log_context,
+    set_request_ctx_application_settings,
+)
 from core.logging.logger import get_logger
+from core.middlewares import bind_retry_deadline, propagate_bookmarks
 from core.settings import get_settings
-from external.neo4j.exceptions import EntityNotFoundError
+from external.neo4j.exceptions import (
+    DatabaseUnavailableError,
+    EntityNotFoundError,
+    InvalidCursorError,
+)
+from views.batch import router as batch_router
 from views.claim import router as claim_router
 from views.company import router as company_router
 from views.document import router as document_router
+from views.export import router as export_router
+from views.graph import router as graph_router
+from views.metrics import router as metrics_router
 from views.person import router as person_router
 from views.relationship import router as relationship_router
+from views.search import router as search_router
 
 load_dotenv()
 logger = get_logger()
@@ -43,16 +59,65 @@ def _log_application_settings():
 ###
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    from external.neo4j import async_operations, counters, driver, existence, schema
     from external.neo4j.operations import check_db_connection
 
     _log_application_settings()
-    check_db_connection()
+
+    db_settings = settings.db_settings
+    if db_settings.backend == "memory":
+        logger.info("Using the in-memory backend, no database connection")
+        yield
+        return
+
+    if db_settings.driver_mode == "async":
+        driver.get_async_driver()
+        await async_operations.check_db_connection()
+        await driver.warm_up_async_pool(db_settings.pool_warmup_connections)
+    else:
+        driver.init_driver()
+        check_db_connection()
+        driver.warm_up_pool(db_settings.pool_warmup_connections)
+
+    if db_settings.schema_bootstrap:
+        schema.bootstrap_schema()
+
+    background_tasks = []
+    if db_settings.existence_filter_enabled:
+        async_driver = db_settings.driver_mode == "async"
+        if async_driver:
+            await existence.abuild_existence_filter()
+        else:
+            existence.build_existence_filter()
+        background_tasks.append(
+            asyncio.create_task(
+                existence.refresh_existence_filter(
+                    db_settings.existence_filter_refresh_interval, async_driver
+                )
+            )
+        )
+    if db_settings.claim_counters_reconcile_interval > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                counters.reconcile_claim_counters_periodically(
+                    db_settings.claim_counters_reconcile_interval
+                )
+            )
+        )
 
     # from external.neo4j.operations import clear_db
 
     # clear_db()
     yield
 
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    driver.close_driver()
+    await driver.close_async_driver()
+
 
 app = FastAPI(lifespan=lifespan)
 
@@ -64,6 +129,18 @@ app.include_router(company_router, tags=["Company"])
 app.include_router(claim_router, tags=["Claim"])
 app.include_router(document_router, tags=["Document"])
 app.include_router(relationship_router, tags=["Relationships"])
+app.include_router(graph_router, tags=["Graph"])
+app.include_router(batch_router, tags=["Batch"])
+app.include_router(search_router, tags=["Search"])
+app.include_router(export_router, tags=["Export"])
+app.include_router(metrics_router, tags=["Metrics"])
+
+
+###
+# Register Middlewares
+###
+app.middleware("http")(propagate_bookmarks)
+app.middleware("http")(bind_retry_deadline)
 
 
 ###
@@ -71,4 +148,6 @@ app.include_router(relationship_router, tags=["Relationships"])
 ###
 app.add_exception_handler(AuthorizationErrorException, catch_auth_exception)
 app.add_exception_handler(EntityNotFoundError, catch_entity_not_found)
+app.add_exception_handler(InvalidCursorError, catch_invalid_cursor)
+app.add_exception_handler(DatabaseUnavailableError, catch_database_unavailable)
 app.add_exception_handler(RequestValidationError, catch_request_validation_exception)
@@ -0,0 +1,48 @@
+import json
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, status
+from fastapi.responses import JSONResponse
+
+from core.auth import authorize_request
+from core.logging.context import set_request_ctx_http_data, set_request_ctx_log_data
+from core.logging.logger import get_logger
+from core.settings import get_settings
+from external.neo4j import operations
+from views.helpers import ENTITY_LOG_CONTEXTS, parse_batch_get, run_operation
+from views.serializers import EntityName
+
+logger = get_logger()
+router = APIRouter()
+settings = get_settings()
+
+
+@router.post(
+    "/v1/{entity}/batch-get",
+    name="Get Entities by IDs",
+    dependencies=[Depends(authorize_request)],
+)
+async def batch_get(
+    entity: EntityName,
+    req_data: Annotated[
+        list[str], Body(min_length=1, max_length=settings.batch_get_max_ids)
+    ],
+) -> JSONResponse:
+    # deduplicated in request order, the order of the response
+    pids = list(dict.fromkeys(req_data))
+    entities = await run_operation(
+        operations.batch_get, label=entity.label, pids=tuple(pids)
+    )
+    response_body = parse_batch_get(pids, entities)
+
+    context, _ = ENTITY_LOG_CONTEXTS[entity]
+    set_request_ctx_log_data(**{entity.value: context(method="batch_get")})
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(response_body)
+    )
+
+    logger.info(
+        f"Successfully retrieved {len(response_body['items'])} of {len(pids)} {entity.value} entities"
+    )
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
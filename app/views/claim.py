@@ -1,40 +1,179 @@
 import json
-from fastapi import APIRouter, Depends, status
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, Query, status
 from fastapi.responses import JSONResponse
 
 from core.auth import authorize_request
 from core.logging.context import set_request_ctx_http_data, set_request_ctx_log_data
 from core.logging.logger import get_logger
 from core.logging.serializers import ClaimContext
+from core.settings import get_settings
 from external.neo4j import operations
-from views.helpers import parse_entity
-from views.serializers import Claim
+from views.helpers import (
+    field_projection,
+    parse_bulk_results,
+    parse_claim_stats,
+    parse_entity,
+    parse_page,
+    run_operation,
+)
+from views.serializers import Claim, ClaimListing, ClaimStatsGroup, ClaimStatusChange
 
 logger = get_logger()
 router = APIRouter()
+settings = get_settings()
 
 
-@router.get("/v1/claim/{claim_id}", name="Get Claim", dependencies=[Depends(authorize_request)])
-def get_claim(claim_id: str) -> JSONResponse:
-    claim = operations.get_claim(claim_id)
+@router.get(
+    "/v1/claim/{claim_id}", name="Get Claim", dependencies=[Depends(authorize_request)]
+)
+async def get_claim(
+    claim_id: str,
+    fields: Annotated[tuple[str, ...] | None, Depends(field_projection(Claim))],
+) -> JSONResponse:
+    claim = await run_operation(operations.get_claim, claim_id=claim_id, fields=fields)
 
-    parsed_entity = parse_entity(claim)
-    set_request_ctx_log_data(claim=ClaimContext(method="get_claim", claim_id=parsed_entity.get("pid")))
-    set_request_ctx_http_data(status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity))
+    parsed_entity = parse_entity(claim, fields)
+    set_request_ctx_log_data(
+        claim=ClaimContext(method="get_claim", claim_id=parsed_entity.get("pid"))
+    )
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity)
+    )
 
     logger.info(f"Successfully retrieved claim with ID: {parsed_entity.get('pid')}")
 
     return JSONResponse(status_code=status.HTTP_200_OK, content=parsed_entity)
 
 
-@router.post("/v1/claim", name="Create Claim", dependencies=[Depends(authorize_request)])
-def create_claim(req_data: Claim) -> JSONResponse:
-    claim = operations.create_claim(**req_data.model_dump(by_alias=True))
+@router.post(
+    "/v1/claim", name="Create Claim", dependencies=[Depends(authorize_request)]
+)
+async def create_claim(req_data: Claim) -> JSONResponse:
+    claim = await run_operation(
+        operations.create_claim, **req_data.model_dump(by_alias=True)
+    )
 
     parsed_entity = parse_entity(claim)
-    set_request_ctx_log_data(claim=ClaimContext(method="create_claim", claim_id=parsed_entity.get("pid")))
-    set_request_ctx_http_data(status_code=status.HTTP_201_CREATED, response_body=json.dumps(parsed_entity))
+    set_request_ctx_log_data(
+        claim=ClaimContext(method="create_claim", claim_id=parsed_entity.get("pid"))
+    )
+    set_request_ctx_http_data(
+        status_code=status.HTTP_201_CREATED, response_body=json.dumps(parsed_entity)
+    )
 
     logger.info(f"Successfully created claim with ID: {parsed_entity.get('pid')}")
 
     return JSONResponse(status_code=status.HTTP_201_CREATED, content=parsed_entity)
+
+
+@router.patch(
+    "/v1/claim/{claim_id}/status",
+    name="Change Claim Status",
+    dependencies=[Depends(authorize_request)],
+)
+async def update_claim_status(
+    claim_id: str, req_data: ClaimStatusChange
+) -> JSONResponse:
+    claim = await run_operation(
+        operations.update_claim_status, claim_id=claim_id, status=req_data.status
+    )
+
+    parsed_entity = parse_entity(claim)
+    set_request_ctx_log_data(
+        claim=ClaimContext(method="update_claim_status", claim_id=claim_id)
+    )
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity)
+    )
+
+    logger.info(
+        f"Successfully changed the status of claim with ID: {claim_id} to {req_data.status}"
+    )
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=parsed_entity)
+
+
+@router.post(
+    "/v1/claim/bulk",
+    name="Bulk Create Claims",
+    dependencies=[Depends(authorize_request)],
+)
+async def bulk_create_claims(
+    req_data: Annotated[
+        list[Claim], Body(min_length=1, max_length=settings.bulk_max_items)
+    ],
+) -> JSONResponse:
+    results = await run_operation(
+        operations.bulk_create_claims,
+        items=[item.model_dump(by_alias=True) for item in req_data],
+    )
+
+    response_body = parse_bulk_results(results)
+    set_request_ctx_log_data(claim=ClaimContext(method="bulk_create_claims"))
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(response_body)
+    )
+
+    logger.info(
+        f"Successfully created {response_body['created']} of {len(req_data)} claims"
+    )
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
+
+
+@router.get(
+    "/v1/claims",
+    name="List Claims by Submission Date",
+    dependencies=[Depends(authorize_request)],
+)
+async def get_claims(listing: Annotated[ClaimListing, Query()]) -> JSONResponse:
+    page = await run_operation(
+        operations.get_claims,
+        limit=listing.limit,
+        cursor=listing.cursor,
+        since=listing.since,
+        until=listing.until,
+        status=listing.status,
+        fields=listing.fields,
+    )
+    response_body = parse_page(page, listing.fields)
+
+    set_request_ctx_log_data(claim=ClaimContext(method="get_claims"))
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(response_body)
+    )
+
+    logger.info(f"Successfully retrieved {len(page.items)} claims")
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
+
+
+@router.get(
+    "/v1/claims/stats",
+    name="Get Claim Amount Statistics",
+    dependencies=[Depends(authorize_request)],
+)
+async def get_claim_stats(
+    group_by: Annotated[list[ClaimStatsGroup] | None, Query()] = None,
+    company_id: str | None = None,
+    person_id: str | None = None,
+) -> JSONResponse:
+    stats = await run_operation(
+        operations.get_claim_stats,
+        # deduplicated in request order, the order of the grouping columns, by status when not given
+        group_by=tuple(dict.fromkeys(group_by or [ClaimStatsGroup.STATUS])),
+        company_id=company_id,
+        person_id=person_id,
+    )
+    response_body = parse_claim_stats(stats)
+
+    set_request_ctx_log_data(claim=ClaimContext(method="get_claim_stats"))
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(response_body)
+    )
+
+    logger.info(f"Successfully computed claim statistics for {len(stats)} groups")
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
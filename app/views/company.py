@@ -1,40 +1,102 @@
 import json
-from fastapi import APIRouter, Depends, status
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, status
 from fastapi.responses import JSONResponse
 
 from core.auth import authorize_request
 from core.logging.context import set_request_ctx_http_data, set_request_ctx_log_data
 from core.logging.logger import get_logger
 from core.logging.serializers import CompanyContext
+from core.settings import get_settings
 from external.neo4j import operations
-from views.helpers import parse_entity
+from views.helpers import (
+    field_projection,
+    parse_bulk_results,
+    parse_entity,
+    run_operation,
+)
 from views.serializers import Company
 
 logger = get_logger()
 router = APIRouter()
+settings = get_settings()
 
 
-@router.get("/v1/company/{company_id}", name="Get Company", dependencies=[Depends(authorize_request)])
-def get_company(company_id: str) -> JSONResponse:
-    company = operations.get_company(company_id)
+@router.get(
+    "/v1/company/{company_id}",
+    name="Get Company",
+    dependencies=[Depends(authorize_request)],
+)
+async def get_company(
+    company_id: str,
+    fields: Annotated[tuple[str, ...] | None, Depends(field_projection(Company))],
+) -> JSONResponse:
+    company = await run_operation(
+        operations.get_company, company_id=company_id, fields=fields
+    )
 
-    parsed_entity = parse_entity(company)
-    set_request_ctx_log_data(company=CompanyContext(method="get_company", company_id=parsed_entity.get("pid")))
-    set_request_ctx_http_data(status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity))
+    parsed_entity = parse_entity(company, fields)
+    set_request_ctx_log_data(
+        company=CompanyContext(
+            method="get_company", company_id=parsed_entity.get("pid")
+        )
+    )
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity)
+    )
 
     logger.info(f"Successfully retrieved company with ID: {parsed_entity.get('pid')}")
 
     return JSONResponse(status_code=status.HTTP_200_OK, content=parsed_entity)
 
 
-@router.post("/v1/company", name="Create Company", dependencies=[Depends(authorize_request)])
-def create_company(req_data: Company) -> JSONResponse:
-    company = operations.create_company(**req_data.model_dump(by_alias=True))
+@router.post(
+    "/v1/company", name="Create Company", dependencies=[Depends(authorize_request)]
+)
+async def create_company(req_data: Company) -> JSONResponse:
+    company = await run_operation(
+        operations.create_company, **req_data.model_dump(by_alias=True)
+    )
 
     parsed_entity = parse_entity(company)
-    set_request_ctx_log_data(company=CompanyContext(method="create_company", company_id=parsed_entity.get("pid")))
-    set_request_ctx_http_data(status_code=status.HTTP_201_CREATED, response_body=json.dumps(parsed_entity))
+    set_request_ctx_log_data(
+        company=CompanyContext(
+            method="create_company", company_id=parsed_entity.get("pid")
+        )
+    )
+    set_request_ctx_http_data(
+        status_code=status.HTTP_201_CREATED, response_body=json.dumps(parsed_entity)
+    )
 
     logger.info(f"Successfully created company with ID: {parsed_entity.get('pid')}")
 
     return JSONResponse(status_code=status.HTTP_201_CREATED, content=parsed_entity)
+
+
+@router.post(
+    "/v1/company/bulk",
+    name="Bulk Create Companies",
+    dependencies=[Depends(authorize_request)],
+)
+async def bulk_create_companies(
+    req_data: Annotated[
+        list[Company], Body(min_length=1, max_length=settings.bulk_max_items)
+    ],
+) -> JSONResponse:
+    results = await run_operation(
+        operations.bulk_create_companies,
+        items=[item.model_dump(by_alias=True) for item in req_data],
+    )
+
+    response_body = parse_bulk_results(results)
+    set_request_ctx_log_data(company=CompanyContext(method="bulk_create_companies"))
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(response_body)
+    )
+
+    logger.info(
+        f"Successfully created {response_body['created']} of {len(req_data)} companies"
+    )
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
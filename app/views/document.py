@@ -1,40 +1,129 @@
 import json
-from fastapi import APIRouter, Depends, status
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, Query, status
 from fastapi.responses import JSONResponse
 
 from core.auth import authorize_request
 from core.logging.context import set_request_ctx_http_data, set_request_ctx_log_data
 from core.logging.logger import get_logger
 from core.logging.serializers import DocumentContext
+from core.settings import get_settings
 from external.neo4j import operations
-from views.helpers import parse_entity
-from views.serializers import Document
+from views.helpers import (
+    field_projection,
+    parse_bulk_results,
+    parse_entity,
+    parse_page,
+    run_operation,
+)
+from views.serializers import Document, SubmittedListing
 
 logger = get_logger()
 router = APIRouter()
+settings = get_settings()
 
 
-@router.get("/v1/document/{document_id}", name="Get Document", dependencies=[Depends(authorize_request)])
-def get_document(document_id: str) -> JSONResponse:
-    document = operations.get_document(document_id)
+@router.get(
+    "/v1/document/{document_id}",
+    name="Get Document",
+    dependencies=[Depends(authorize_request)],
+)
+async def get_document(
+    document_id: str,
+    fields: Annotated[tuple[str, ...] | None, Depends(field_projection(Document))],
+) -> JSONResponse:
+    document = await run_operation(
+        operations.get_document, document_id=document_id, fields=fields
+    )
 
-    parsed_entity = parse_entity(document)
-    set_request_ctx_log_data(document=DocumentContext(method="get_document", document_id=parsed_entity.get("pid")))
-    set_request_ctx_http_data(status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity))
+    parsed_entity = parse_entity(document, fields)
+    set_request_ctx_log_data(
+        document=DocumentContext(
+            method="get_document", document_id=parsed_entity.get("pid")
+        )
+    )
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity)
+    )
 
     logger.info(f"Successfully retrieved document with ID: {parsed_entity.get('pid')}")
 
     return JSONResponse(status_code=status.HTTP_200_OK, content=parsed_entity)
 
 
-@router.post("/v1/document", name="Create Document", dependencies=[Depends(authorize_request)])
-def create_document(req_data: Document) -> JSONResponse:
-    document = operations.create_document(**req_data.model_dump(by_alias=True))
+@router.post(
+    "/v1/document", name="Create Document", dependencies=[Depends(authorize_request)]
+)
+async def create_document(req_data: Document) -> JSONResponse:
+    document = await run_operation(
+        operations.create_document, **req_data.model_dump(by_alias=True)
+    )
 
     parsed_entity = parse_entity(document)
-    set_request_ctx_log_data(document=DocumentContext(method="create_document", document_id=parsed_entity.get("pid")))
-    set_request_ctx_http_data(status_code=status.HTTP_201_CREATED, response_body=json.dumps(parsed_entity))
+    set_request_ctx_log_data(
+        document=DocumentContext(
+            method="create_document", document_id=parsed_entity.get("pid")
+        )
+    )
+    set_request_ctx_http_data(
+        status_code=status.HTTP_201_CREATED, response_body=json.dumps(parsed_entity)
+    )
 
     logger.info(f"Successfully created document with ID: {parsed_entity.get('pid')}")
 
     return JSONResponse(status_code=status.HTTP_201_CREATED, content=parsed_entity)
+
+
+@router.post(
+    "/v1/document/bulk",
+    name="Bulk Create Documents",
+    dependencies=[Depends(authorize_request)],
+)
+async def bulk_create_documents(
+    req_data: Annotated[
+        list[Document], Body(min_length=1, max_length=settings.bulk_max_items)
+    ],
+) -> JSONResponse:
+    results = await run_operation(
+        operations.bulk_create_documents,
+        items=[item.model_dump(by_alias=True) for item in req_data],
+    )
+
+    response_body = parse_bulk_results(results)
+    set_request_ctx_log_data(document=DocumentContext(method="bulk_create_documents"))
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(response_body)
+    )
+
+    logger.info(
+        f"Successfully created {response_body['created']} of {len(req_data)} documents"
+    )
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
+
+
+@router.get(
+    "/v1/documents",
+    name="List Documents by Submission Date",
+    dependencies=[Depends(authorize_request)],
+)
+async def get_documents(listing: Annotated[SubmittedListing, Query()]) -> JSONResponse:
+    page = await run_operation(
+        operations.get_documents,
+        limit=listing.limit,
+        cursor=listing.cursor,
+        since=listing.since,
+        until=listing.until,
+        fields=listing.fields,
+    )
+    response_body = parse_page(page, listing.fields)
+
+    set_request_ctx_log_data(document=DocumentContext(method="get_documents"))
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(response_body)
+    )
+
+    logger.info(f"Successfully retrieved {len(page.items)} documents")
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
@@ -0,0 +1,33 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
+
+from core.auth import authorize_request
+from core.logging.context import set_request_ctx_http_data
+from core.logging.logger import get_logger
+from external.neo4j import operations
+from views.helpers import export_response, run_operation
+from views.serializers import ExportFormat, ExportKind
+
+logger = get_logger()
+router = APIRouter()
+
+
+@router.get(
+    "/v1/export/{kind}",
+    name="Export Entities or Links",
+    dependencies=[Depends(authorize_request)],
+)
+async def export(
+    kind: ExportKind,
+    fmt: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.JSONL,
+    gzip: bool = False,
+) -> StreamingResponse:
+    rows = await run_operation(operations.export_rows, kind=kind.value)
+
+    set_request_ctx_http_data(status_code=status.HTTP_200_OK)
+
+    logger.info(f"Exporting {kind.value} as {fmt.value}")
+
+    return export_response(rows, kind, fmt, compress=gzip)
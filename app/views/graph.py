@@ -0,0 +1,62 @@
+import json
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import JSONResponse
+
+from core.auth import authorize_request
+from core.logging.context import set_request_ctx_http_data, set_request_ctx_log_data
+from core.logging.logger import get_logger
+from core.settings import get_settings
+from external.neo4j import operations
+from views.helpers import ENTITY_LOG_CONTEXTS, parse_subgraph, run_operation
+from views.serializers import EntityName, RelationshipType
+
+logger = get_logger()
+router = APIRouter()
+settings = get_settings()
+
+
+@router.get(
+    "/v1/{entity}/{entity_id}/subgraph",
+    name="Get the neighbourhood of an entity",
+    dependencies=[Depends(authorize_request)],
+)
+async def get_subgraph(
+    entity: EntityName,
+    entity_id: str,
+    depth: Annotated[int, Query(ge=1, le=settings.subgraph_max_depth)] = 2,
+    types: Annotated[list[RelationshipType] | None, Query()] = None,
+    max_nodes: Annotated[
+        int, Query(ge=1, le=settings.subgraph_max_nodes)
+    ] = settings.subgraph_max_nodes,
+    max_edges: Annotated[
+        int, Query(ge=0, le=settings.subgraph_max_edges)
+    ] = settings.subgraph_max_edges,
+) -> JSONResponse:
+    subgraph = await run_operation(
+        operations.get_subgraph,
+        label=entity.label,
+        pid=entity_id,
+        # sorted and deduplicated, so equivalent requests share the same query
+        relationships=tuple(sorted(set(types or RelationshipType))),
+        depth=depth,
+        max_nodes=max_nodes,
+        max_edges=max_edges,
+    )
+    response_body = parse_subgraph(subgraph)
+
+    context, id_field = ENTITY_LOG_CONTEXTS[entity]
+    set_request_ctx_log_data(
+        **{entity.value: context(method="get_subgraph", **{id_field: entity_id})}
+    )
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(response_body)
+    )
+
+    logger.info(
+        f"Successfully retrieved {len(subgraph.nodes)} nodes and {len(subgraph.edges)} edges around "
+        f"{entity.value} with ID: {entity_id}"
+    )
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
@@ -1,21 +1,267 @@
+import json
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 from datetime import datetime
-from typing import Any
+from itertools import batched
+from typing import Annotated, Any
 
+import anyio
+from fastapi import Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
 from neomodel import StructuredNode
+from pydantic import BaseModel, ValidationError
 
+from core.logging.serializers import (
+    ClaimContext,
+    CompanyContext,
+    DocumentContext,
+    PersonContext,
+)
+from core.settings import get_settings
+from external.memory.repository import memory_repository
+from external.neo4j import async_operations
+from external.neo4j.bulk import BulkItemResult, BulkItemStatus
+from external.neo4j.export import RowEncoder, aencode_rows, encode_rows, export_columns
+from external.neo4j.pagination import Page
+from external.neo4j.query import ClaimStats, Subgraph
+from views.serializers import (
+    ClaimFilter,
+    ClaimStatus,
+    EntityName,
+    ExportFormat,
+    ExportKind,
+    parse_fields,
+)
 
-def parse_entity(entity: StructuredNode | list[StructuredNode]) -> dict[str, Any] | list[dict[str, Any] | None] | None:
+settings = get_settings()
+db_settings = settings.db_settings
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.JSONL: NDJSON_MEDIA_TYPE,
+    ExportFormat.CSV: "text/csv",
+}
+GZIP_MEDIA_TYPE = "application/gzip"
+
+# entity -> (log context, its id field) of the endpoints taking any entity
+ENTITY_LOG_CONTEXTS: dict[EntityName, tuple[type[BaseModel], str]] = {
+    EntityName.PERSON: (PersonContext, "person_id"),
+    EntityName.COMPANY: (CompanyContext, "company_id"),
+    EntityName.CLAIM: (ClaimContext, "claim_id"),
+    EntityName.DOCUMENT: (DocumentContext, "document_id"),
+}
+
+
+async def run_operation(operation: Callable[..., Any], **kwargs) -> Any:
+    """Run a data operation on the backend selected by the `DB_BACKEND` and `DB_DRIVER_MODE` settings.
+
+    Views pass the sync operation from `external.neo4j.operations`. The in-memory backend runs its method with the
+    same name inline, it never blocks. In async mode the native counterpart with the same name from
+    `external.neo4j.async_operations` is awaited instead, otherwise the blocking call runs in the threadpool.
+    """
+    if db_settings.backend == "memory":
+        return getattr(memory_repository, operation.__name__)(**kwargs)
+    if db_settings.driver_mode == "async":
+        return await getattr(async_operations, operation.__name__)(**kwargs)
+    return await run_in_threadpool(operation, **kwargs)
+
+
+def field_projection(model: type[BaseModel]) -> Callable[..., tuple[str, ...] | None]:
+    """Dependency reading the `fields` query parameter of an endpoint returning `model` entities."""
+
+    def dependency(
+        fields: Annotated[list[str] | None, Query()] = None,
+    ) -> tuple[str, ...] | None:
+        try:
+            return parse_fields(model, fields)
+        except ValueError as exc:
+            error = {
+                "type": "value_error",
+                "loc": ("query", "fields"),
+                "msg": str(exc),
+                "input": fields,
+            }
+            raise RequestValidationError([error]) from exc
+
+    return dependency
+
+
+def claim_filter(
+    since: Annotated[datetime | None, Query(alias="from")] = None,
+    until: Annotated[datetime | None, Query(alias="to")] = None,
+    status: ClaimStatus | None = None,
+) -> ClaimFilter:
+    """Dependency reading the submission window and status filters of the claim listings of a person or a company."""
+    try:
+        return ClaimFilter.model_validate(
+            {"from": since, "to": until, "status": status}
+        )
+    except ValidationError as exc:
+        errors = [
+            {**error, "loc": ("query", *error["loc"])}
+            for error in exc.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors) from exc
+
+
+def parse_entity(
+    entity: StructuredNode | list[StructuredNode], fields: Iterable[str] | None = None
+) -> dict[str, Any] | list[dict[str, Any] | None] | None:
     if isinstance(entity, list):
-        return [_parse_to_str(e) for e in entity]
-    return _parse_to_str(entity)
+        return [_parse_to_str(e, fields) for e in entity]
+    return _parse_to_str(entity, fields)
 
 
-def _parse_to_str(entity: StructuredNode) -> dict[str, Any] | None:
-    # NOTE: neomodel OGM uses __properties__, cypher_query uses _properties
-    properties: dict[str, Any] | None = getattr(entity, "__properties__", None) or getattr(entity, "_properties", None)
+def _parse_to_str(
+    entity: StructuredNode | dict[str, Any], fields: Iterable[str] | None = None
+) -> dict[str, Any] | None:
+    # NOTE: neomodel OGM uses __properties__, cypher_query uses _properties, map projections are plain dicts
+    properties: dict[str, Any] | None
+    if isinstance(entity, dict):
+        properties = dict(entity)
+    else:
+        properties = getattr(entity, "__properties__", None) or getattr(
+            entity, "_properties", None
+        )
 
+    if properties and fields is not None:
+        properties = {field: properties.get(field) for field in fields}
     if properties:
         for key, value in properties.items():
             if isinstance(value, datetime):
                 properties[key] = f"{value:%Y-%m-%dT%H:%M:%S}"
         return properties
+
+
+def parse_bulk_results(results: list[BulkItemResult]) -> dict[str, Any]:
+    body: dict[str, Any] = {status.value: 0 for status in BulkItemStatus}
+    for result in results:
+        body[result.status] += 1
+    body["results"] = [
+        {"pid": result.pid, "status": result.status.value} for result in results
+    ]
+    return body
+
+
+def parse_page(page: Page, fields: Iterable[str] | None = None) -> dict[str, Any]:
+    return {"items": parse_entity(page.items, fields), "next_cursor": page.next_cursor}
+
+
+def parse_batch_get(
+    pids: list[str], entities: list[StructuredNode | None]
+) -> dict[str, Any]:
+    return {
+        "items": [_parse_to_str(entity) for entity in entities if entity is not None],
+        "missing": [pid for pid, entity in zip(pids, entities) if entity is None],
+    }
+
+
+def parse_search_page(page: Page) -> dict[str, Any]:
+    return {
+        "items": [
+            {"entity": _parse_to_str(hit.node), "score": hit.score}
+            for hit in page.items
+        ],
+        "next_cursor": page.next_cursor,
+    }
+
+
+def parse_subgraph(subgraph: Subgraph) -> dict[str, Any]:
+    return {
+        "nodes": parse_entity(subgraph.nodes),
+        "edges": [
+            {"from": edge.from_id, "type": edge.type, "to": edge.to_id}
+            for edge in subgraph.edges
+        ],
+        "truncated": subgraph.truncated,
+    }
+
+
+def parse_claim_stats(stats: list[ClaimStats]) -> dict[str, Any]:
+    return {
+        "groups": [
+            {
+                **row.group,
+                "count": row.count,
+                "sum": row.sum,
+                "min": row.min,
+                "max": row.max,
+                "avg": row.avg,
+            }
+            for row in stats
+        ]
+    }
+
+
+def wants_ndjson(accept: str | None) -> bool:
+    return bool(accept) and NDJSON_MEDIA_TYPE in accept
+
+
+def ndjson_response(entities: Iterator[Any] | AsyncIterator[Any]) -> StreamingResponse:
+    """Stream the entities as newline-delimited JSON while they are read from the DB.
+
+    The entities are closed when the response ends, including when the client disconnects and starlette cancels it,
+    so the DB session they hold is not left open until garbage collection.
+    """
+    if hasattr(entities, "__aiter__"):
+        content = _aiter_ndjson(entities)
+    else:
+        content = _iter_ndjson(entities)
+    return StreamingResponse(content, media_type=NDJSON_MEDIA_TYPE)
+
+
+async def _iter_ndjson(entities: Iterator[Any]) -> AsyncIterator[str]:
+    # Chunked, each chunk is read in the threadpool since iterating the entities blocks on the DB
+    chunks = (
+        "".join(json.dumps(_parse_to_str(entity)) + "\n" for entity in chunk)
+        for chunk in batched(entities, settings.stream_chunk_size)
+    )
+    try:
+        while (chunk := await run_in_threadpool(next, chunks, None)) is not None:
+            yield chunk
+    finally:
+        with anyio.CancelScope(shield=True):
+            await run_in_threadpool(_close_iterator, entities)
+
+
+async def _aiter_ndjson(entities: AsyncIterator[Any]) -> AsyncIterator[str]:
+    chunk: list[str] = []
+    try:
+        async for entity in entities:
+            chunk.append(json.dumps(_parse_to_str(entity)) + "\n")
+            if len(chunk) >= settings.stream_chunk_size:
+                yield "".join(chunk)
+                chunk = []
+        if chunk:
+            yield "".join(chunk)
+    finally:
+        if hasattr(entities, "aclose"):
+            with anyio.CancelScope(shield=True):
+                await entities.aclose()
+
+
+def _close_iterator(entities: Iterator[Any]) -> None:
+    if hasattr(entities, "close"):
+        entities.close()
+
+
+def export_response(
+    rows: Iterator[dict[str, Any]] | AsyncIterator[dict[str, Any]],
+    kind: ExportKind,
+    fmt: ExportFormat,
+    compress: bool,
+) -> StreamingResponse:
+    """Stream the exported rows as a `kind.fmt[.gz]` attachment while they are read from the DB."""
+    encoder = RowEncoder(fmt, export_columns(kind), compress=compress)
+    if hasattr(rows, "__aiter__"):
+        content = aencode_rows(rows, encoder)
+    else:
+        content = encode_rows(rows, encoder)
+
+    filename = f"{kind.value}.{fmt.value}" + (".gz" if compress else "")
+    return StreamingResponse(
+        content,
+        media_type=GZIP_MEDIA_TYPE if compress else EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+
+from core.auth import authorize_request
+from core.logging.context import set_request_ctx_http_data
+from external.neo4j.cache import entity_cache
+from external.neo4j.coalescing import single_flight
+from external.neo4j.existence import existence_filter
+from external.neo4j.retry import transaction_retry
+
+router = APIRouter()
+
+
+@router.get(
+    "/v1/metrics",
+    name="Get Data Layer Metrics",
+    dependencies=[Depends(authorize_request)],
+)
+async def get_metrics() -> JSONResponse:
+    response_body = {
+        "entity_cache": entity_cache.stats(),
+        "existence_filter": existence_filter.stats(),
+        "single_flight": single_flight.stats(),
+        "transaction_retry": transaction_retry.stats(),
+    }
+
+    set_request_ctx_http_data(status_code=status.HTTP_200_OK)
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
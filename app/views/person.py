@@ -1,40 +1,98 @@
 import json
-from fastapi import APIRouter, Depends, status
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, status
 from fastapi.responses import JSONResponse
 
 from core.auth import authorize_request
 from core.logging.context import set_request_ctx_http_data, set_request_ctx_log_data
 from core.logging.logger import get_logger
 from core.logging.serializers import PersonContext
+from core.settings import get_settings
 from external.neo4j import operations
-from views.helpers import parse_entity
+from views.helpers import (
+    field_projection,
+    parse_bulk_results,
+    parse_entity,
+    run_operation,
+)
 from views.serializers import Person
 
 logger = get_logger()
 router = APIRouter()
+settings = get_settings()
 
 
-@router.get("/v1/person/{person_id}", name="Get Person", dependencies=[Depends(authorize_request)])
-def get_person(person_id: str) -> JSONResponse:
-    person = operations.get_person(person_id)
+@router.get(
+    "/v1/person/{person_id}",
+    name="Get Person",
+    dependencies=[Depends(authorize_request)],
+)
+async def get_person(
+    person_id: str,
+    fields: Annotated[tuple[str, ...] | None, Depends(field_projection(Person))],
+) -> JSONResponse:
+    person = await run_operation(
+        operations.get_person, person_id=person_id, fields=fields
+    )
 
-    parsed_entity = parse_entity(person)
-    set_request_ctx_log_data(person=PersonContext(method="get_person", person_id=parsed_entity.get("pid")))
-    set_request_ctx_http_data(status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity))
+    parsed_entity = parse_entity(person, fields)
+    set_request_ctx_log_data(
+        person=PersonContext(method="get_person", person_id=parsed_entity.get("pid"))
+    )
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity)
+    )
 
     logger.info(f"Successfully retrieved person with ID: {parsed_entity.get('pid')}")
 
     return JSONResponse(status_code=status.HTTP_200_OK, content=parsed_entity)
 
 
-@router.post("/v1/person", name="Create Person", dependencies=[Depends(authorize_request)])
-def create_person(req_data: Person) -> JSONResponse:
-    person = operations.create_person(**req_data.model_dump(by_alias=True))
+@router.post(
+    "/v1/person", name="Create Person", dependencies=[Depends(authorize_request)]
+)
+async def create_person(req_data: Person) -> JSONResponse:
+    person = await run_operation(
+        operations.create_person, **req_data.model_dump(by_alias=True)
+    )
 
     parsed_entity = parse_entity(person)
-    set_request_ctx_log_data(person=PersonContext(method="create_person", person_id=parsed_entity.get("pid")))
-    set_request_ctx_http_data(status_code=status.HTTP_201_CREATED, response_body=json.dumps(parsed_entity))
+    set_request_ctx_log_data(
+        person=PersonContext(method="create_person", person_id=parsed_entity.get("pid"))
+    )
+    set_request_ctx_http_data(
+        status_code=status.HTTP_201_CREATED, response_body=json.dumps(parsed_entity)
+    )
 
     logger.info(f"Successfully created person with ID: {parsed_entity.get('pid')}")
 
     return JSONResponse(status_code=status.HTTP_201_CREATED, content=parsed_entity)
+
+
+@router.post(
+    "/v1/person/bulk",
+    name="Bulk Create Persons",
+    dependencies=[Depends(authorize_request)],
+)
+async def bulk_create_persons(
+    req_data: Annotated[
+        list[Person], Body(min_length=1, max_length=settings.bulk_max_items)
+    ],
+) -> JSONResponse:
+    results = await run_operation(
+        operations.bulk_create_persons,
+        items=[item.model_dump(by_alias=True) for item in req_data],
+    )
+
+    response_body = parse_bulk_results(results)
+    set_request_ctx_log_data(person=PersonContext(method="bulk_create_persons"))
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(response_body)
+    )
+
+    logger.info(
+        f"Successfully created {response_body['created']} of {len(req_data)} persons"
+    )
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
@@ -1,16 +1,36 @@
 import json
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, Header, Query, status
+from fastapi.responses import JSONResponse, Response
 
 from core.auth import authorize_request
 from core.logging.context import set_request_ctx_http_data, set_request_ctx_log_data
 from core.logging.logger import get_logger
-from core.logging.serializers import CompanyContext, PersonContext, ClaimContext, DocumentContext
+from core.logging.serializers import (
+    ClaimContext,
+    CompanyContext,
+    DocumentContext,
+    PersonContext,
+)
+from core.settings import get_settings
 from external.neo4j import operations
-from views.helpers import parse_entity
+from external.neo4j.bulk import RELATIONSHIP_ENDPOINTS
+from views.helpers import (
+    ENTITY_LOG_CONTEXTS,
+    claim_filter,
+    field_projection,
+    ndjson_response,
+    parse_entity,
+    parse_page,
+    run_operation,
+    wants_ndjson,
+)
+from views.serializers import Claim, ClaimFilter, EntityName, RelationshipLink
 
 logger = get_logger()
 router = APIRouter()
+settings = get_settings()
 
 
 @router.post(
@@ -18,24 +38,36 @@ router = APIRouter()
     name="Person Works For Company",
     dependencies=[Depends(authorize_request)],
 )
-def create_person_company_relationship(person_id: str, company_id: str) -> JSONResponse:
-    is_connected = operations.create_person_company_relationship(person_id=person_id, company_id=company_id)
-    response_body = {"isConnected": is_connected}
+async def create_person_company_relationship(
+    person_id: str, company_id: str
+) -> JSONResponse:
+    created = await run_operation(
+        operations.create_person_company_relationship,
+        person_id=person_id,
+        company_id=company_id,
+    )
+    # the operation raises when an endpoint is missing, so the nodes are connected, by this request or a previous one
+    status_code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
+    response_body = {"isConnected": True, "created": created}
 
     set_request_ctx_log_data(
-        company=CompanyContext(method="create_person_company_relationship", company_id=company_id),
-        person=PersonContext(method="create_person_company_relationship", person_id=person_id),
+        company=CompanyContext(
+            method="create_person_company_relationship", company_id=company_id
+        ),
+        person=PersonContext(
+            method="create_person_company_relationship", person_id=person_id
+        ),
     )
-    set_request_ctx_http_data(status_code=status.HTTP_200_OK, response_body=response_body)
+    set_request_ctx_http_data(status_code=status_code, response_body=response_body)
 
     logger.info(
-        (
-            f"{'Successfully connected' if is_connected else 'Failed to connect'} "
+        
+            f"{'Successfully connected' if created else 'Already connected'} "
             f"company with ID: {company_id} with person with ID: {person_id}"
-        )
+        
     )
 
-    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
+    return JSONResponse(status_code=status_code, content=response_body)
 
 
 @router.post(
@@ -43,24 +75,35 @@ def create_person_company_relationship(person_id: str, company_id: str) -> JSONR
     name="Person Submits Claim",
     dependencies=[Depends(authorize_request)],
 )
-def create_person_claim_relationship(person_id: str, claim_id: str) -> JSONResponse:
-    is_connected = operations.create_person_claim_relationship(person_id=person_id, claim_id=claim_id)
-    response_body = {"isConnected": is_connected}
+async def create_person_claim_relationship(
+    person_id: str, claim_id: str
+) -> JSONResponse:
+    created = await run_operation(
+        operations.create_person_claim_relationship,
+        person_id=person_id,
+        claim_id=claim_id,
+    )
+    status_code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
+    response_body = {"isConnected": True, "created": created}
 
     set_request_ctx_log_data(
-        claim=ClaimContext(method="create_person_claim_relationship", claim_id=claim_id),
-        person=PersonContext(method="create_person_claim_relationship", person_id=person_id),
+        claim=ClaimContext(
+            method="create_person_claim_relationship", claim_id=claim_id
+        ),
+        person=PersonContext(
+            method="create_person_claim_relationship", person_id=person_id
+        ),
     )
-    set_request_ctx_http_data(status_code=status.HTTP_200_OK, response_body=response_body)
+    set_request_ctx_http_data(status_code=status_code, response_body=response_body)
 
     logger.info(
-        (
-            f"{'Successfully connected' if is_connected else 'Failed to connect'} "
+        
+            f"{'Successfully connected' if created else 'Already connected'} "
             f"claim with ID: {claim_id} with person with ID: {person_id}"
-        )
+        
     )
 
-    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
+    return JSONResponse(status_code=status_code, content=response_body)
 
 
 @router.post(
@@ -68,22 +111,33 @@ def create_person_claim_relationship(person_id: str, claim_id: str) -> JSONRespo
     name="Person Sends Document",
     dependencies=[Depends(authorize_request)],
 )
-def create_person_document_relationship(person_id: str, document_id: str) -> JSONResponse:
-    is_connected = operations.create_person_document_relationship(person_id=person_id, document_id=document_id)
-    response_body = {"isConnected": is_connected}
+async def create_person_document_relationship(
+    person_id: str, document_id: str
+) -> JSONResponse:
+    created = await run_operation(
+        operations.create_person_document_relationship,
+        person_id=person_id,
+        document_id=document_id,
+    )
+    status_code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
+    response_body = {"isConnected": True, "created": created}
 
     set_request_ctx_log_data(
-        document=DocumentContext(method="create_person_document_relationship", document_id=document_id),
-        person=PersonContext(method="create_person_document_relationship", person_id=person_id),
+        document=DocumentContext(
+            method="create_person_document_relationship", document_id=document_id
+        ),
+        person=PersonContext(
+            method="create_person_document_relationship", person_id=person_id
+        ),
     )
-    set_request_ctx_http_data(status_code=status.HTTP_200_OK, response_body=response_body)
+    set_request_ctx_http_data(status_code=status_code, response_body=response_body)
 
     logger.info(
-        f"{'Successfully connected' if is_connected else 'Failed to connect'} "
+        f"{'Successfully connected' if created else 'Already connected'} "
         f"document with ID: {document_id} with person with ID: {person_id}"
     )
 
-    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
+    return JSONResponse(status_code=status_code, content=response_body)
 
 
 @router.post(
@@ -91,17 +145,28 @@ def create_person_document_relationship(person_id: str, document_id: str) -> JSO
     name="Claim has Claimant to Company",
     dependencies=[Depends(authorize_request)],
 )
-def create_claim_company_relationship(claim_id: str, company_id: str) -> JSONResponse:
-    is_connected = operations.create_claim_company_relationship(claim_id=claim_id, company_id=company_id)
-    response_body = {"isConnected": is_connected}
+async def create_claim_company_relationship(
+    claim_id: str, company_id: str
+) -> JSONResponse:
+    created = await run_operation(
+        operations.create_claim_company_relationship,
+        claim_id=claim_id,
+        company_id=company_id,
+    )
+    status_code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
+    response_body = {"isConnected": True, "created": created}
 
     set_request_ctx_log_data(
-        claim=ClaimContext(method="create_claim_company_relationship", claim_id=claim_id),
-        company=CompanyContext(method="create_claim_company_relationship", company_id=company_id),
+        claim=ClaimContext(
+            method="create_claim_company_relationship", claim_id=claim_id
+        ),
+        company=CompanyContext(
+            method="create_claim_company_relationship", company_id=company_id
+        ),
     )
-    set_request_ctx_http_data(status_code=status.HTTP_200_OK, response_body=response_body)
+    set_request_ctx_http_data(status_code=status_code, response_body=response_body)
 
-    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
+    return JSONResponse(status_code=status_code, content=response_body)
 
 
 @router.get(
@@ -109,12 +174,53 @@ def create_claim_company_relationship(claim_id: str, company_id: str) -> JSONRes
     name="Get Claims Submitted by Person",
     dependencies=[Depends(authorize_request)],
 )
-def get_claims_by_person(person_id: str) -> JSONResponse:
-    claims = operations.get_claims_by_person(person_id=person_id)
-    parsed_entity = parse_entity(claims)
+async def get_claims_by_person(
+    person_id: str,
+    fields: Annotated[tuple[str, ...] | None, Depends(field_projection(Claim))],
+    filters: Annotated[ClaimFilter, Depends(claim_filter)],
+    limit: Annotated[
+        int, Query(ge=1, le=settings.page_max_limit)
+    ] = settings.page_default_limit,
+    cursor: str | None = None,
+    accept: Annotated[str | None, Header()] = None,
+) -> Response:
+    if wants_ndjson(accept):
+        claims = await run_operation(
+            operations.stream_claims_by_person,
+            person_id=person_id,
+            fields=fields,
+            since=filters.since,
+            until=filters.until,
+            status=filters.status,
+        )
+
+        set_request_ctx_log_data(
+            person=PersonContext(method="stream_claims_by_person", person_id=person_id)
+        )
+        set_request_ctx_http_data(status_code=status.HTTP_200_OK)
+
+        logger.info(f"Streaming claims by person with ID: {person_id}")
+
+        return ndjson_response(claims)
 
-    set_request_ctx_log_data(person=PersonContext(method="get_claims_by_person", person_id=person_id))
-    set_request_ctx_http_data(status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity))
+    page = await run_operation(
+        operations.get_claims_by_person,
+        person_id=person_id,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+        since=filters.since,
+        until=filters.until,
+        status=filters.status,
+    )
+    parsed_entity = parse_page(page, fields)
+
+    set_request_ctx_log_data(
+        person=PersonContext(method="get_claims_by_person", person_id=person_id)
+    )
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity)
+    )
 
     logger.info(f"Successfully retrieved claims by person with ID: {person_id}")
 
@@ -126,12 +232,55 @@ def get_claims_by_person(person_id: str) -> JSONResponse:
     name="Get Claims associated to a specific Company",
     dependencies=[Depends(authorize_request)],
 )
-def get_claims_by_company(company_id: str) -> JSONResponse:
-    claims = operations.get_claims_by_company(company_id=company_id)
-    parsed_entity = parse_entity(claims)
+async def get_claims_by_company(
+    company_id: str,
+    fields: Annotated[tuple[str, ...] | None, Depends(field_projection(Claim))],
+    filters: Annotated[ClaimFilter, Depends(claim_filter)],
+    limit: Annotated[
+        int, Query(ge=1, le=settings.page_max_limit)
+    ] = settings.page_default_limit,
+    cursor: str | None = None,
+    accept: Annotated[str | None, Header()] = None,
+) -> Response:
+    if wants_ndjson(accept):
+        claims = await run_operation(
+            operations.stream_claims_by_company,
+            company_id=company_id,
+            fields=fields,
+            since=filters.since,
+            until=filters.until,
+            status=filters.status,
+        )
 
-    set_request_ctx_log_data(company=CompanyContext(method="get_claims_by_company", company_id=company_id))
-    set_request_ctx_http_data(status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity))
+        set_request_ctx_log_data(
+            company=CompanyContext(
+                method="stream_claims_by_company", company_id=company_id
+            )
+        )
+        set_request_ctx_http_data(status_code=status.HTTP_200_OK)
+
+        logger.info(f"Streaming claims by company with ID: {company_id}")
+
+        return ndjson_response(claims)
+
+    page = await run_operation(
+        operations.get_claims_by_company,
+        company_id=company_id,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+        since=filters.since,
+        until=filters.until,
+        status=filters.status,
+    )
+    parsed_entity = parse_page(page, fields)
+
+    set_request_ctx_log_data(
+        company=CompanyContext(method="get_claims_by_company", company_id=company_id)
+    )
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity)
+    )
 
     logger.info(f"Successfully retrieved claims by company with ID: {company_id}")
 
@@ -143,8 +292,8 @@ def get_claims_by_company(company_id: str) -> JSONResponse:
     name="Get Company associated to a Person",
     dependencies=[Depends(authorize_request)],
 )
-def get_company_by_person(person_id: str) -> JSONResponse:
-    company = operations.get_company_by_person(person_id=person_id)
+async def get_company_by_person(person_id: str) -> JSONResponse:
+    company = await run_operation(operations.get_company_by_person, person_id=person_id)
     parsed_entity = parse_entity(company)
     company_id = parsed_entity.get("pid")
 
@@ -152,8 +301,55 @@ def get_company_by_person(person_id: str) -> JSONResponse:
         company=CompanyContext(method="get_company_by_person", company_id=company_id),
         person=PersonContext(method="get_company_by_person", person_id=person_id),
     )
-    set_request_ctx_http_data(status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity))
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(parsed_entity)
+    )
 
-    logger.info(f"Successfully retrieved company with ID: {company_id} by person with ID: {person_id}")
+    logger.info(
+        f"Successfully retrieved company with ID: {company_id} by person with ID: {person_id}"
+    )
 
     return JSONResponse(status_code=status.HTTP_200_OK, content=parsed_entity)
+
+
+@router.post(
+    "/v1/relationships/bulk",
+    name="Bulk Create Relationships",
+    dependencies=[Depends(authorize_request)],
+)
+async def bulk_create_relationships(
+    req_data: Annotated[
+        list[RelationshipLink], Body(min_length=1, max_length=settings.bulk_max_items)
+    ],
+) -> JSONResponse:
+    result = await run_operation(
+        operations.bulk_create_relationships,
+        links=[link.model_dump() for link in req_data],
+    )
+    response_body = {
+        "linked": result.linked,
+        "skipped": result.skipped,
+        "notFound": result.not_found,
+    }
+
+    # the entities at either end of the linked relationship types
+    entities = {
+        EntityName(model.__label__.lower())
+        for link in req_data
+        for model in RELATIONSHIP_ENDPOINTS[link.type]
+    }
+    set_request_ctx_log_data(
+        **{
+            entity.value: ENTITY_LOG_CONTEXTS[entity][0](
+                method="bulk_create_relationships"
+            )
+            for entity in entities
+        }
+    )
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(response_body)
+    )
+
+    logger.info(f"Successfully linked {result.linked} of {len(req_data)} relationships")
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
@@ -0,0 +1,44 @@
+import json
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import JSONResponse
+
+from core.auth import authorize_request
+from core.logging.context import set_request_ctx_http_data
+from core.logging.logger import get_logger
+from core.settings import get_settings
+from external.neo4j import operations
+from views.helpers import parse_search_page, run_operation
+from views.serializers import SearchableEntity
+
+logger = get_logger()
+router = APIRouter()
+settings = get_settings()
+
+
+@router.get(
+    "/v1/search/{entity}",
+    name="Full-text Search",
+    dependencies=[Depends(authorize_request)],
+)
+async def search(
+    entity: SearchableEntity,
+    q: Annotated[str, Query(min_length=1, max_length=200, pattern=r"\S")],
+    limit: Annotated[
+        int, Query(ge=1, le=settings.page_max_limit)
+    ] = settings.page_default_limit,
+    cursor: str | None = None,
+) -> JSONResponse:
+    page = await run_operation(
+        operations.search, label=entity.label, text=q, limit=limit, cursor=cursor
+    )
+    response_body = parse_search_page(page)
+
+    set_request_ctx_http_data(
+        status_code=status.HTTP_200_OK, response_body=json.dumps(response_body)
+    )
+
+    logger.info(f"Successfully found {len(page.items)} {entity.value} results")
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=response_body)
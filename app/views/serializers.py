@@ -1,12 +1,17 @@
 import re
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Annotated
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic_settings import SettingsConfigDict
 
+from core.settings import get_settings
+
+settings = get_settings()
+
 
 class RelationshipType(StrEnum):
     WORKS_FOR = "WORKS_FOR"
@@ -15,6 +20,46 @@ class RelationshipType(StrEnum):
     HAS_CLAIMANT = "HAS_CLAIMANT"
 
 
+class EntityName(StrEnum):
+    PERSON = "person"
+    COMPANY = "company"
+    CLAIM = "claim"
+    DOCUMENT = "document"
+
+    @property
+    def label(self) -> str:
+        return self.value.capitalize()
+
+
+class SearchableEntity(StrEnum):
+    PERSON = "person"
+    COMPANY = "company"
+    DOCUMENT = "document"
+
+    @property
+    def label(self) -> str:
+        return self.value.capitalize()
+
+
+class ExportKind(StrEnum):
+    PERSON = "person"
+    COMPANY = "company"
+    CLAIM = "claim"
+    DOCUMENT = "document"
+    LINKS = "links"
+
+
+class ExportFormat(StrEnum):
+    JSONL = "jsonl"
+    CSV = "csv"
+
+
+class ClaimStatsGroup(StrEnum):
+    STATUS = "status"
+    COMPANY = "company"
+    PERSON = "person"
+
+
 class CompanyType(StrEnum):
     INSURANCE = "Insurance"
     CLAIMANT = "Claimant"
@@ -65,6 +110,12 @@ class Claim(IDModel):
         return v
 
 
+class ClaimStatusChange(BaseModel):
+    model_config = SettingsConfigDict(use_enum_values=True)
+
+    status: ClaimStatus
+
+
 class Document(IDModel):
     doc_number: str = Field(examples=["DOC1234"])
     title: str | None = None
@@ -79,3 +130,90 @@ class Document(IDModel):
         if not pattern.match(v):
             raise ValueError("Invalid Doc Number. Valid example: 'DOC1234'")
         return v
+
+
+def parse_fields(
+    model: type[BaseModel], values: Iterable[str] | None
+) -> tuple[str, ...] | None:
+    """Properties of a `fields` projection of `model` entities, comma separated and/or repeated.
+
+    `pid` is always included; None means every property.
+    """
+    if not values:
+        return None
+
+    fields = [
+        field.strip() for value in values for field in value.split(",") if field.strip()
+    ]
+    if unknown := [field for field in fields if field not in model.model_fields]:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}. Valid fields: {', '.join(model.model_fields)}"
+        )
+    return tuple(dict.fromkeys(["pid", *fields]))
+
+
+class SubmissionWindow(BaseModel):
+    """Entities submitted from `from` (included) to `to` (excluded), either bound being optional."""
+
+    since: datetime | None = Field(default=None, alias="from")
+    until: datetime | None = Field(default=None, alias="to")
+
+    @field_validator("since", "until")
+    @classmethod
+    def assume_utc(cls, v: datetime | None) -> datetime | None:
+        # dates are stored as UTC timestamps, like naive dates are by the node models
+        return v.replace(tzinfo=UTC) if v is not None and v.tzinfo is None else v
+
+    @model_validator(mode="after")
+    def validate_window(self) -> "SubmissionWindow":
+        if (
+            self.since is not None
+            and self.until is not None
+            and self.since >= self.until
+        ):
+            raise ValueError("'from' must be before 'to'")
+        return self
+
+
+class ClaimFilter(SubmissionWindow):
+    """Query of the claim listings of a person or a company: the submission window and the claim status."""
+
+    model_config = SettingsConfigDict(use_enum_values=True)
+
+    status: ClaimStatus | None = None
+
+
+class SubmittedListing(SubmissionWindow):
+    """Query of the document listing: a page of the documents submitted from `from` (included) to `to` (excluded)."""
+
+    limit: int = Field(
+        default=settings.page_default_limit, ge=1, le=settings.page_max_limit
+    )
+    cursor: str | None = None
+    fields: tuple[str, ...] | None = None
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, v: tuple[str, ...] | None) -> tuple[str, ...] | None:
+        return parse_fields(Document, v)
+
+
+class ClaimListing(SubmittedListing):
+    """Query of the claim listing: the submission window and the claim status."""
+
+    model_config = SettingsConfigDict(use_enum_values=True)
+
+    status: ClaimStatus | None = None
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, v: tuple[str, ...] | None) -> tuple[str, ...] | None:
+        return parse_fields(Claim, v)
+
+
+class RelationshipLink(BaseModel):
+    model_config = SettingsConfigDict(use_enum_values=True)
+
+    from_id: str
+    to_id: str
+    type: RelationshipType
@@ -0,0 +1,80 @@
+import json
+from pathlib import Path
+
+from commands import benchmark
+
+BASELINE = Path(__file__).parents[2] / "benchmarks" / "baseline.json"
+
+
+def _result(median_us: float, peak_bytes: int) -> dict:
+    return {"median_us": median_us, "peak_bytes": peak_bytes}
+
+
+def test_cases_build_the_payloads_of_the_views():
+    assert isinstance(benchmark.parse_entity_case(1)(), dict)
+    assert len(benchmark.parse_entity_case(10)()) == 10
+    assert (
+        json.loads(benchmark.json_dumps_case(10)())[0]["submission_date"]
+        == "2024-01-01T00:00:00"
+    )
+
+    line = json.loads(benchmark.log_chain_case(10)())
+    assert line["message"] == "Successfully retrieved claims"
+    assert len(json.loads(line["http"]["response_body"])) == 10
+
+
+def test_compare_flags_slower_and_bigger_cases():
+    baseline = {
+        "results": {
+            "json_dumps": {"1": _result(10, 1000), "1k": _result(1000, 100_000)}
+        }
+    }
+    report = {
+        "results": {
+            "json_dumps": {"1": _result(12, 1050), "1k": _result(1500, 150_000)},
+            "log_chain": {"1": _result(50, 4000)},
+        }
+    }
+
+    regressions = benchmark.compare(
+        report, baseline, tolerance=0.25, memory_tolerance=0.1
+    )
+
+    # log_chain is not in the baseline, json_dumps 1 is within the tolerances
+    assert [
+        (item["case"], item["size"], item["metric"], item["change"])
+        for item in regressions
+    ] == [
+        ("json_dumps", "1k", "median_us", 0.5),
+        ("json_dumps", "1k", "peak_bytes", 0.5),
+    ]
+
+
+def test_benchmark_compares_with_the_stored_baseline(tmp_path: Path):
+    output = tmp_path / "report.json"
+
+    code = benchmark.main(
+        [
+            "--size",
+            "1",
+            "--repeat",
+            "1",
+            "--baseline",
+            str(BASELINE),
+            "--output",
+            str(output),
+        ]
+    )
+
+    report = json.loads(output.read_text())
+    assert set(report["results"]) == set(benchmark.CASES)
+    assert report["results"]["json_dumps"]["1"]["peak_bytes"] > 0
+    assert "regressions" in report and code in (0, 1)
+
+
+def test_stored_baseline_covers_every_case_and_size():
+    baseline = json.loads(BASELINE.read_text())
+
+    assert {case: set(sizes) for case, sizes in baseline["results"].items()} == {
+        case: set(benchmark.SIZES) for case in benchmark.CASES
+    }
@@ -0,0 +1,182 @@
+import gzip
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from commands import bulk_import
+from commands.bulk_import import BatchResult, BulkImport, Checkpoint, RejectedRow
+from external.neo4j.bulk import BulkItemResult, BulkItemStatus, BulkLinkResult
+
+
+def test_read_rows_streams_csv_and_gzipped_jsonl(tmp_path: Path):
+    csv_file = tmp_path / "persons.csv"
+    csv_file.write_text("pid,name,role\np1,Jane,\np2,John,Agent\n")
+    jsonl_file = tmp_path / "links.jsonl.gz"
+    with gzip.open(jsonl_file, "wt") as file:
+        file.write(
+            '{"from_id": "p1", "to_id": "c1", "type": "WORKS_FOR"}\n\n{"from_id": "p2"}\n'
+        )
+
+    assert list(bulk_import.read_rows(csv_file)) == [
+        (2, {"pid": "p1", "name": "Jane"}),
+        (3, {"pid": "p2", "name": "John", "role": "Agent"}),
+    ]
+    assert list(bulk_import.read_rows(jsonl_file)) == [
+        (1, {"from_id": "p1", "to_id": "c1", "type": "WORKS_FOR"}),
+        (3, {"from_id": "p2"}),
+    ]
+
+
+def test_read_rows_rejects_unknown_format(tmp_path: Path):
+    with pytest.raises(ValueError):
+        list(bulk_import.read_rows(tmp_path / "persons.xml"))
+
+
+def test_read_rows_streams_malformed_json_lines_as_rejected(
+    tmp_path: Path, mocker: MockerFixture
+):
+    jsonl_file = tmp_path / "persons.jsonl"
+    jsonl_file.write_text('{"pid": "p1", "name": "Jane"}\n{"pid": "p2",\n["p3"]\n')
+
+    rows = list(bulk_import.read_rows(jsonl_file))
+
+    error = "Expecting property name enclosed in double quotes"
+    assert rows == [
+        (1, {"pid": "p1", "name": "Jane"}),
+        (2, RejectedRow(2, f"{jsonl_file}:2: invalid JSON: {error} (column 14)")),
+        (3, RejectedRow(3, f"{jsonl_file}:3: expected a JSON object, got list")),
+    ]
+
+    write = mocker.Mock(return_value=[BulkItemResult("p1", BulkItemStatus.CREATED)])
+    mocker.patch.dict(bulk_import.KINDS, {"person": (bulk_import.Person, write)})
+    result = bulk_import.import_batch("person", rows)
+
+    assert result.rows == 3
+    assert [row.line for row in result.rejected] == [2, 3]
+    assert result.counts == {"created": 1}
+
+
+def test_import_batch_validates_rows_and_counts_results(mocker: MockerFixture):
+    write = mocker.Mock(return_value=[BulkItemResult("p1", BulkItemStatus.CREATED)])
+    mocker.patch.dict(bulk_import.KINDS, {"person": (bulk_import.Person, write)})
+
+    rows = [
+        (2, {"pid": "p1", "name": "Jane"}),
+        (3, {"name": "No Pid"}),
+        (4, {"pid": "p3"}),
+    ]
+    result = bulk_import.import_batch("person", rows)
+
+    write.assert_called_once_with(
+        [{"pid": "p1", "name": "Jane", "role": None, "email": None, "phone": None}]
+    )
+    assert result == BatchResult(
+        rows=3,
+        rejected=[
+            RejectedRow(3, "pid: Field required"),
+            RejectedRow(4, "name: Field required"),
+        ],
+        counts={"created": 1},
+    )
+
+
+def test_import_batch_links(mocker: MockerFixture):
+    write = mocker.Mock(return_value=BulkLinkResult(linked=1, skipped=0, not_found={}))
+    mocker.patch.dict(
+        bulk_import.KINDS, {"links": (bulk_import.RelationshipLink, write)}
+    )
+
+    result = bulk_import.import_batch(
+        "links", [(1, {"from_id": "p1", "to_id": "c1", "type": "WORKS_FOR"})]
+    )
+
+    assert result.counts == {"linked": 1, "skipped": 0}
+
+
+def test_import_resumes_from_checkpoint(tmp_path: Path, mocker: MockerFixture):
+    data = tmp_path / "persons.jsonl"
+    data.write_text(
+        "".join(json.dumps({"pid": f"p{i}", "name": "Name"}) + "\n" for i in range(5))
+    )
+    checkpoint_path = tmp_path / "checkpoint.json"
+    failing = {"p2"}
+
+    def import_batch(kind, rows):
+        if rows[0][1]["pid"] in failing:
+            raise RuntimeError("connection lost")
+        return BatchResult(rows=len(rows), rejected=[], counts={"created": len(rows)})
+
+    mocker.patch("commands.bulk_import.import_batch", side_effect=import_batch)
+
+    def run() -> list:
+        checkpoint = Checkpoint.load(checkpoint_path, batch_size=2)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return BulkImport(executor, checkpoint, batch_size=2, max_in_flight=1).run(
+                [("person", data)]
+            )
+
+    with pytest.raises(RuntimeError):
+        run()
+    assert json.loads(checkpoint_path.read_text())["inputs"][
+        f"person:{data.resolve()}"
+    ]["done"] == [0]
+
+    failing.clear()
+    [stats] = run()
+    assert (stats.rows, stats.resumed) == (3, 2)
+    assert stats.counts == {"created": 3}
+
+
+def test_checkpoint_skips_finished_batches(tmp_path: Path, mocker: MockerFixture):
+    data = tmp_path / "persons.jsonl"
+    data.write_text(
+        "".join(json.dumps({"pid": f"p{i}", "name": "Name"}) + "\n" for i in range(5))
+    )
+    checkpoint = Checkpoint(tmp_path / "checkpoint.json", batch_size=2)
+    checkpoint.mark_done("person", data, 1)
+    import_batch = mocker.patch(
+        "commands.bulk_import.import_batch",
+        side_effect=lambda kind, rows: BatchResult(
+            rows=len(rows), rejected=[], counts={"created": len(rows)}
+        ),
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        [stats] = BulkImport(
+            executor, Checkpoint.load(checkpoint.path, 2), batch_size=2, max_in_flight=4
+        ).run([("person", data)])
+
+    written = sorted(
+        row["pid"] for call in import_batch.call_args_list for _, row in call.args[1]
+    )
+    assert written == ["p0", "p1", "p4"]
+    assert (stats.rows, stats.resumed) == (3, 2)
+    assert (
+        json.loads(checkpoint.path.read_text())["inputs"][f"person:{data.resolve()}"][
+            "complete"
+        ]
+        is True
+    )
+
+
+def test_checkpoint_refuses_changed_input_or_batch_size(tmp_path: Path):
+    data = tmp_path / "persons.csv"
+    data.write_text("pid,name\np1,Jane\n")
+    checkpoint = Checkpoint(tmp_path / "checkpoint.json", batch_size=2)
+    checkpoint.mark_done("person", data, 0)
+
+    with pytest.raises(ValueError, match="--batch-size"):
+        Checkpoint.load(checkpoint.path, batch_size=3)
+
+    data.write_text("pid,name\np1,Jane\np2,John\n")
+    with pytest.raises(ValueError, match="changed"):
+        Checkpoint.load(checkpoint.path, batch_size=2).done_batches("person", data)
+    assert (
+        Checkpoint.load(checkpoint.path, batch_size=2, restart=True).done_batches(
+            "person", data
+        )
+        == set()
+    )
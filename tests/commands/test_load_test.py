@@ -0,0 +1,102 @@
+import json
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from commands import load_test
+from core.settings import get_settings
+
+
+def _stats(p95_ms: float, throughput: float) -> dict:
+    return {"p50_ms": 1.0, "p95_ms": p95_ms, "p99_ms": p95_ms, "throughput": throughput}
+
+
+def test_parse_mix():
+    assert load_test.parse_mix(None) == load_test.DEFAULT_MIX
+    assert load_test.parse_mix("get_person=3, create_claim") == {
+        "get_person": 3.0,
+        "create_claim": 1.0,
+    }
+    with pytest.raises(ValueError, match="Unknown route 'get_invoice'"):
+        load_test.parse_mix("get_invoice=1")
+    with pytest.raises(ValueError, match="at least one route"):
+        load_test.parse_mix("get_person=0")
+
+
+def test_percentile_is_nearest_rank():
+    values = [float(i) for i in range(1, 101)]
+
+    assert [load_test.percentile(values, q) for q in (50, 95, 99, 100)] == [
+        50.0,
+        95.0,
+        99.0,
+        100.0,
+    ]
+    assert load_test.percentile([], 99) == 0.0
+
+
+def test_compare_flags_slower_and_lower_throughput_routes():
+    baseline = {
+        "overall": _stats(10, 1000),
+        "routes": {"get_person": _stats(10, 500), "get_claim": _stats(0.2, 500)},
+    }
+    report = {
+        "overall": _stats(10.5, 990),
+        "routes": {"get_person": _stats(20, 400), "get_claim": _stats(0.4, 500)},
+    }
+
+    regressions = load_test.compare(report, baseline, tolerance=0.1, min_delta_ms=1.0)
+
+    # get_claim doubled, but by less than the 1 ms noise floor
+    assert [(item["route"], item["metric"]) for item in regressions] == [
+        ("get_person", "p95_ms"),
+        ("get_person", "p99_ms"),
+        ("get_person", "throughput"),
+    ]
+    assert regressions[0]["change"] == 1.0
+
+
+def test_load_test_in_process_on_memory_backend(tmp_path: Path, mocker: MockerFixture):
+    mocker.patch.object(get_settings().db_settings, "backend", "memory")
+    output = tmp_path / "report.json"
+
+    code = load_test.main(
+        [
+            "--duration",
+            "0.3",
+            "--warmup",
+            "0",
+            "--concurrency",
+            "2",
+            "--seed-size",
+            "20",
+            "--output",
+            str(output),
+        ]
+    )
+
+    report = json.loads(output.read_text())
+    assert code == 0
+    assert report["backend"] == "memory" and report["load"] == {"concurrency": 2}
+    assert report["overall"]["requests"] > 0 and report["overall"]["errors"] == 0
+    assert set(report["routes"]) <= set(load_test.ROUTES)
+
+    argv = [
+        "--duration",
+        "0.3",
+        "--warmup",
+        "0",
+        "--seed-size",
+        "20",
+        "--baseline",
+        str(output),
+    ]
+    assert load_test.main(argv) in (0, 1)
+
+
+def test_asgi_target_runs_on_the_configured_backend(mocker: MockerFixture):
+    mocker.patch.object(get_settings().db_settings, "backend", "neo4j")
+
+    with pytest.raises(SystemExit):
+        load_test.main(["--backend", "memory"])
@@ -0,0 +1,113 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from external.neo4j import async_operations
+from external.neo4j.exceptions import EntityNotFoundError
+from external.neo4j.query import RelationshipWriteResult
+from tests.mocks.constants import TEST_CLAIM_ID, TEST_COMPANY_ID, TEST_PERSON_ID
+
+
+@pytest.mark.asyncio
+async def test_create_person_company_relationship_success(mocker: MockerFixture):
+    mocked_write = mocker.patch(
+        "external.neo4j.async_operations._write",
+        return_value=RelationshipWriteResult(
+            from_found=True, to_found=True, created=True
+        ),
+    )
+
+    assert await async_operations.create_person_company_relationship(
+        person_id=TEST_PERSON_ID, company_id=TEST_COMPANY_ID
+    )
+    mocked_write.assert_awaited_once_with(
+        async_operations.aq.create_relationship_by_pid,
+        from_label="Person",
+        from_id=TEST_PERSON_ID,
+        to_label="Company",
+        to_id=TEST_COMPANY_ID,
+        relationship="WORKS_FOR",
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_claim_company_relationship_failed_company_not_found(
+    mocker: MockerFixture,
+):
+    mocker.patch(
+        "external.neo4j.async_operations._write",
+        return_value=RelationshipWriteResult(
+            from_found=True, to_found=False, created=False
+        ),
+    )
+
+    with pytest.raises(EntityNotFoundError) as exc:
+        await async_operations.create_claim_company_relationship(
+            claim_id=TEST_CLAIM_ID, company_id=TEST_COMPANY_ID
+        )
+
+    assert exc.value.args[0] == f"Company with id:{TEST_COMPANY_ID} not found"
+
+
+@pytest.mark.asyncio
+async def test_get_person_not_found(mocker: MockerFixture):
+    mocker.patch("external.neo4j.async_operations._read", return_value=None)
+
+    with pytest.raises(EntityNotFoundError) as exc:
+        await async_operations.get_person(person_id=TEST_PERSON_ID)
+
+    assert exc.value.args[0] == f"Person with id:{TEST_PERSON_ID} not found"
+
+
+@pytest.mark.asyncio
+async def test_get_claims_by_company_failed_claim_not_found(mocker: MockerFixture):
+    mocker.patch("external.neo4j.async_operations._read", return_value=[])
+
+    with pytest.raises(EntityNotFoundError) as exc:
+        await async_operations.get_claims_by_company(
+            company_id=TEST_COMPANY_ID, limit=10
+        )
+
+    assert (
+        exc.value.args[0]
+        == f"No claims associated to Company with id:{TEST_COMPANY_ID} found"
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_get_reads_uncached_pids_once(mocker: MockerFixture):
+    mocker.patch("external.neo4j.async_operations.entity_cache.enabled", False)
+    read = mocker.patch(
+        "external.neo4j.async_operations._read", return_value=[{"pid": "p2"}]
+    )
+    mocker.patch.object(
+        async_operations.Person, "inflate", side_effect=lambda node: node["pid"]
+    )
+
+    entities = await async_operations.batch_get(label="Person", pids=("p1", "p2"))
+
+    read.assert_called_once()
+    assert read.call_args.kwargs == {"label": "Person", "pids": ["p1", "p2"]}
+    assert entities == [None, "p2"]
+
+
+@pytest.mark.asyncio
+async def test_export_rows_pages_through_the_label(mocker: MockerFixture):
+    read = mocker.patch(
+        "external.neo4j.async_operations._read",
+        side_effect=[
+            [{"pid": "d1", "doc_number": "DOC1"}, {"pid": "d2", "doc_number": "DOC2"}],
+            [],
+        ],
+    )
+
+    rows = [
+        row async for row in await async_operations.export_rows("document", page_size=2)
+    ]
+
+    assert rows == [
+        {"pid": "d1", "doc_number": "DOC1"},
+        {"pid": "d2", "doc_number": "DOC2"},
+    ]
+    read.assert_awaited_with(
+        async_operations.aq.get_nodes_page, label="Document", after="d2", limit=2
+    )
@@ -0,0 +1,111 @@
+from datetime import datetime
+
+from external.neo4j.bulk import (
+    BulkItemResult,
+    BulkItemStatus,
+    BulkLinkResult,
+    group_links,
+    iter_batches,
+    merge_results,
+    prepare_rows,
+    summarize_links,
+)
+from external.neo4j.query import MissingLink
+from external.neo4j.serializers import Claim, Person
+from tests.mocks import bodies
+
+
+def test_prepare_rows_deflates_and_drops_duplicates():
+    prepared = prepare_rows(
+        Person,
+        [
+            bodies.create_person_request("p1"),
+            bodies.create_person_request("p2"),
+            bodies.create_person_request("p1"),
+        ],
+    )
+
+    assert [row["pid"] for row in prepared.rows] == ["p1", "p2"]
+    assert prepared.pids == ["p1", "p2", "p1"]
+    assert prepared.duplicates == {2}
+
+
+def test_prepare_rows_stores_datetimes_like_neomodel():
+    request = {
+        **bodies.create_claim_request(),
+        "submission_date": datetime(2025, 5, 27, 16, 2, 8),
+        "description": None,
+    }
+    prepared = prepare_rows(Claim, [request])
+
+    assert prepared.rows[0]["submission_date"] == 1748361728.0
+
+
+def test_iter_batches():
+    rows = [{"pid": str(i)} for i in range(5)]
+
+    assert [len(batch) for batch in iter_batches(rows, 2)] == [2, 2, 1]
+
+
+def test_merge_results_keeps_request_order():
+    prepared = prepare_rows(
+        Person,
+        [
+            bodies.create_person_request("p1"),
+            bodies.create_person_request("p2"),
+            bodies.create_person_request("p1"),
+        ],
+    )
+
+    results = merge_results({"p1": True, "p2": False}, prepared)
+
+    assert results == [
+        BulkItemResult("p1", BulkItemStatus.CREATED),
+        BulkItemResult("p2", BulkItemStatus.EXISTS),
+        BulkItemResult("p1", BulkItemStatus.DUPLICATE),
+    ]
+
+
+def test_group_links_by_type():
+    grouped = group_links(
+        [
+            {"from_id": "p1", "to_id": "c1", "type": "WORKS_FOR"},
+            {"from_id": "cl1", "to_id": "c1", "type": "HAS_CLAIMANT"},
+            {"from_id": "p2", "to_id": "c1", "type": "WORKS_FOR"},
+        ]
+    )
+
+    assert grouped == {
+        "WORKS_FOR": [
+            {"from_id": "p1", "to_id": "c1"},
+            {"from_id": "p2", "to_id": "c1"},
+        ],
+        "HAS_CLAIMANT": [{"from_id": "cl1", "to_id": "c1"}],
+    }
+
+
+def test_summarize_links_lists_each_missing_pid_once():
+    result = summarize_links(
+        total=5,
+        missing=[
+            (
+                "Person",
+                "Company",
+                MissingLink("p1", "c1", from_found=False, to_found=True),
+            ),
+            (
+                "Person",
+                "Company",
+                MissingLink("p1", "c2", from_found=False, to_found=False),
+            ),
+            (
+                "Claim",
+                "Company",
+                MissingLink("cl1", "c2", from_found=True, to_found=False),
+            ),
+        ],
+    )
+
+    assert result == BulkLinkResult(
+        linked=2, skipped=3, not_found={"Person": ["p1"], "Company": ["c2"]}
+    )
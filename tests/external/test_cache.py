@@ -0,0 +1,106 @@
+from pytest_mock import MockerFixture
+
+from external.neo4j.cache import EntityCache
+
+
+def test_get_or_load_reads_through_once():
+    cache = EntityCache(max_size=10, ttl=60)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return "person"
+
+    assert cache.get_or_load("Person", "p1", loader) == "person"
+    assert cache.get_or_load("Person", "p1", loader) == "person"
+
+    assert len(loads) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_get_or_load_does_not_cache_missing_entities():
+    cache = EntityCache(max_size=10, ttl=60)
+
+    assert cache.get_or_load("Person", "p1", lambda: None) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_disabled_cache_always_loads():
+    cache = EntityCache(max_size=10, ttl=60, enabled=False)
+
+    cache.get_or_load("Person", "p1", lambda: "person")
+
+    assert cache.get("Person", "p1") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = EntityCache(max_size=2, ttl=60)
+    cache.set("Person", "p1", 1)
+    cache.set("Person", "p2", 2)
+    cache.get("Person", "p1")
+    cache.set("Person", "p3", 3)
+
+    assert cache.get("Person", "p2") is None
+    assert cache.get("Person", "p1") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_expired_entry_is_a_miss(mocker: MockerFixture):
+    mocked_time = mocker.patch(
+        "external.neo4j.cache.time.monotonic", return_value=100.0
+    )
+    cache = EntityCache(max_size=2, ttl=10)
+    cache.set("Person", "p1", 1)
+
+    mocked_time.return_value = 111.0
+
+    assert cache.get("Person", "p1") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_invalidate():
+    cache = EntityCache(max_size=10, ttl=60)
+    cache.set("Person", "p1", 1)
+    cache.set("Company", "p1", 2)
+
+    cache.invalidate("Person", "p1", "p2")
+
+    assert cache.get("Person", "p1") is None
+    assert cache.get("Company", "p1") == 2
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_get_many_or_load_only_loads_uncached_pids():
+    cache = EntityCache(max_size=10, ttl=60)
+    cache.set("Person", "p1", "person-1")
+    loads = []
+
+    def loader(pids):
+        loads.append(pids)
+        return {"p2": "person-2"}
+
+    assert cache.get_many_or_load("Person", ["p1", "p2", "p3"], loader) == {
+        "p1": "person-1",
+        "p2": "person-2",
+    }
+    assert cache.get_many_or_load("Person", ["p1", "p2"], loader) == {
+        "p1": "person-1",
+        "p2": "person-2",
+    }
+
+    assert loads == [["p2", "p3"]]
+
+
+def test_load_racing_with_an_invalidation_is_not_cached():
+    cache = EntityCache(max_size=10, ttl=60)
+
+    def loader():
+        # the entity is written, and invalidated, while it is being read
+        cache.invalidate("Person", "p1")
+        return "stale person"
+
+    assert cache.get_or_load("Person", "p1", loader) == "stale person"
+    assert cache.get("Person", "p1") is None
+    assert cache.get_or_load("Person", "p1", lambda: "person") == "person"
+    assert cache.get("Person", "p1") == "person"
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from external.neo4j.coalescing import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    executions = []
+
+    @single_flight.coalesce
+    def get_person(person_id: str) -> str:
+        executions.append(person_id)
+        release.wait(timeout=5)
+        return f"person {person_id}"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(get_person, person_id="p1") for _ in range(4)]
+        while single_flight.stats()["calls"] < 4:
+            pass
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == ["person p1"] * 4
+    assert executions == ["p1"]
+    assert single_flight.stats() == {
+        "enabled": True,
+        "calls": 4,
+        "executions": 1,
+        "coalesced": 3,
+        "in_flight": 0,
+    }
+
+
+def test_different_arguments_are_not_coalesced():
+    single_flight = SingleFlight()
+
+    @single_flight.coalesce
+    def get_person(person_id: str) -> str:
+        return person_id
+
+    assert get_person(person_id="p1") == "p1"
+    assert get_person(person_id="p2") == "p2"
+    assert single_flight.stats()["executions"] == 2
+
+
+def test_exception_is_shared_and_not_kept():
+    single_flight = SingleFlight()
+    calls = []
+
+    @single_flight.coalesce
+    def get_person(person_id: str) -> str:
+        calls.append(person_id)
+        raise LookupError(person_id)
+
+    for _ in range(2):
+        with pytest.raises(LookupError):
+            get_person(person_id="p1")
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_calls_share_one_execution():
+    single_flight = SingleFlight()
+    executions = []
+
+    @single_flight.acoalesce
+    async def get_person(person_id: str) -> str:
+        executions.append(person_id)
+        await asyncio.sleep(0.01)
+        return f"person {person_id}"
+
+    results = await asyncio.gather(*(get_person(person_id="p1") for _ in range(5)))
+
+    assert results == ["person p1"] * 5
+    assert executions == ["p1"]
+    assert single_flight.stats()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_caller_does_not_cancel_shared_call():
+    single_flight = SingleFlight()
+
+    @single_flight.acoalesce
+    async def get_person(person_id: str) -> str:
+        await asyncio.sleep(0.01)
+        return person_id
+
+    first = asyncio.ensure_future(get_person(person_id="p1"))
+    second = asyncio.ensure_future(get_person(person_id="p1"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "p1"
+
+
+def test_disabled_single_flight_runs_every_call():
+    single_flight = SingleFlight(enabled=False)
+
+    assert single_flight.do("key", lambda: 1) == 1
+    assert single_flight.stats()["calls"] == 0
@@ -0,0 +1,71 @@
+from pytest_mock import MockerFixture
+
+from external.neo4j import counters
+from external.neo4j import query as q
+from external.neo4j.cache import EntityCache
+from external.neo4j.serializers import Company, Person
+from views.serializers import ClaimStatus
+
+
+def test_claim_relationships_count_the_claim_on_create():
+    query = q.create_relationship_by_pid_query(
+        from_label="Claim", to_label="Company", relationship="HAS_CLAIMANT"
+    )
+
+    assert "ON CREATE SET b.claim_count = coalesce(b.claim_count, 0) + 1" in query
+    assert (
+        "b.claim_amount = coalesce(b.claim_amount, 0) + coalesce(a.amount, 0)" in query
+    )
+    assert (
+        "b.claim_count_approved = coalesce(b.claim_count_approved, 0) + CASE a.status WHEN 'Approved'"
+        in query
+    )
+
+
+def test_bulk_claim_relationships_count_the_claim_on_create():
+    query = q.bulk_merge_relationships_query(
+        from_label="Person", to_label="Claim", relationship="SUBMITTED"
+    )
+
+    assert "ON CREATE SET a.claim_count = coalesce(a.claim_count, 0) + 1" in query
+
+
+def test_other_relationships_have_no_counters():
+    query = q.create_relationship_by_pid_query(
+        from_label="Person", to_label="Company", relationship="WORKS_FOR"
+    )
+
+    assert "ON CREATE" not in query
+
+
+def test_status_counters_are_properties_of_the_holders():
+    assert set(counters.STATUS_COUNTERS) == {status.value for status in ClaimStatus}
+    for model in (Person, Company):
+        assert set(counters.STATUS_COUNTERS.values()) <= set(
+            model.defined_properties(rels=False)
+        )
+
+
+def test_claim_status_is_read_after_taking_the_claim_write_lock():
+    query = counters.UPDATE_CLAIM_STATUS_QUERY
+
+    assert query.index("SET cl._lock = true") < query.index("cl.status AS previous")
+    assert "REMOVE cl._lock" in query
+
+
+def test_reconcile_claim_counters_invalidates_repaired_holders(mocker: MockerFixture):
+    cache = EntityCache(max_size=10, ttl=60)
+    cache.set("Company", "c1", "company")
+    cache.set("Company", "c2", "company")
+    mocker.patch("external.neo4j.counters.entity_cache", cache)
+
+    session = mocker.MagicMock()
+    session.run.side_effect = lambda query, **params: mocker.MagicMock(
+        value=mocker.MagicMock(return_value=["c1"] if "(h:Company)" in query else [])
+    )
+    mocked_driver = mocker.patch("external.neo4j.counters.get_driver")
+    mocked_driver.return_value.session.return_value.__enter__.return_value = session
+
+    assert counters.reconcile_claim_counters() == {"Person": 0, "Company": 1}
+    assert cache.get("Company", "c1") is None
+    assert cache.get("Company", "c2") == "company"
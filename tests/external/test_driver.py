@@ -0,0 +1,39 @@
+from neomodel import config
+from pytest_mock import MockerFixture
+
+from external.neo4j import driver
+
+
+def test_init_driver_registers_shared_driver_with_neomodel(mocker: MockerFixture):
+    mocker.patch.object(driver, "_driver", None)
+    mocker.patch.object(config, "DRIVER", None)
+    mocked_graph_database = mocker.patch("external.neo4j.driver.GraphDatabase")
+
+    shared_driver = driver.init_driver()
+
+    assert shared_driver is mocked_graph_database.driver.return_value
+    assert driver.get_driver() is shared_driver
+    assert config.DRIVER is shared_driver
+    mocked_graph_database.driver.assert_called_once_with(
+        driver.db_url, auth=driver.db_settings.auth, **driver.db_settings.pool_config
+    )
+
+
+def test_warm_up_pool_holds_connections_concurrently(mocker: MockerFixture):
+    mocked_driver = mocker.MagicMock()
+    mocker.patch.object(driver, "_driver", mocked_driver)
+
+    driver.warm_up_pool(3)
+
+    assert mocked_driver.session.call_count == 3
+    session = mocked_driver.session.return_value.__enter__.return_value
+    assert session.begin_transaction.call_count == 3
+
+
+def test_warm_up_pool_disabled(mocker: MockerFixture):
+    mocked_driver = mocker.MagicMock()
+    mocker.patch.object(driver, "_driver", mocked_driver)
+
+    driver.warm_up_pool(0)
+
+    mocked_driver.session.assert_not_called()
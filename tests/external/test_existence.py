@@ -0,0 +1,94 @@
+import pytest
+from pydantic import ValidationError
+
+from core.settings import DB
+from external.neo4j.existence import BloomFilter, ExistenceFilter
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, false_positive_rate=0.01, max_bytes=1024 * 1024)
+    pids = [f"pid-{i}" for i in range(1000)]
+    for pid in pids:
+        bloom.add(pid)
+
+    assert all(pid in bloom for pid in pids)
+
+
+def test_bloom_filter_false_positive_rate_is_close_to_target():
+    bloom = BloomFilter(capacity=1000, false_positive_rate=0.01, max_bytes=1024 * 1024)
+    for i in range(1000):
+        bloom.add(f"pid-{i}")
+
+    false_positives = sum(f"missing-{i}" in bloom for i in range(10000))
+
+    assert false_positives / 10000 < 0.03
+    assert bloom.estimated_false_positive_rate < 0.02
+
+
+def test_bloom_filter_size_is_capped():
+    bloom = BloomFilter(capacity=1_000_000, false_positive_rate=0.01, max_bytes=1024)
+
+    assert bloom.stats()["size_bytes"] == 1024
+
+
+def test_existence_filter_without_built_label_might_contain_anything():
+    existence_filter = ExistenceFilter(false_positive_rate=0.01, max_bytes=1024)
+
+    assert existence_filter.might_contain("Person", "p1")
+
+
+def test_disabled_existence_filter_might_contain_anything():
+    existence_filter = ExistenceFilter(
+        false_positive_rate=0.01, max_bytes=1024, enabled=False
+    )
+    existence_filter.build("Person", count=1, pids=["p1"])
+
+    assert existence_filter.might_contain("Person", "p2")
+
+
+def test_existence_filter_counts_misses_and_learns_missed_pids():
+    existence_filter = ExistenceFilter(false_positive_rate=0.01, max_bytes=1024)
+    existence_filter.build("Person", count=1, pids=["p1"])
+
+    assert existence_filter.might_contain("Person", "p1")
+    assert not existence_filter.might_contain("Person", "p2")
+
+    existence_filter.add_missed("Person", "p2")
+
+    assert existence_filter.might_contain("Person", "p2")
+    assert existence_filter.stats()["misses"] == 1
+    assert existence_filter.stats()["false_negatives"] == 1
+
+
+def test_existence_filter_learns_created_pids():
+    existence_filter = ExistenceFilter(false_positive_rate=0.01, max_bytes=1024)
+    existence_filter.build("Person", count=1, pids=["p1"])
+
+    existence_filter.add("Person", "p2", "p3")
+
+    assert existence_filter.might_contain("Person", "p2")
+    assert existence_filter.might_contain("Person", "p3")
+
+
+def test_enabled_existence_filter_requires_a_refresh_interval():
+    with pytest.raises(
+        ValidationError, match="DB_EXISTENCE_FILTER_REFRESH_INTERVAL must be positive"
+    ):
+        DB(existence_filter_enabled=True, existence_filter_refresh_interval=0)
+
+    assert DB(existence_filter_enabled=True).existence_filter_refresh_interval > 0
+    assert DB(existence_filter_enabled=False, existence_filter_refresh_interval=0)
+
+
+@pytest.mark.asyncio
+async def test_existence_filter_builds_from_an_async_scan():
+    existence_filter = ExistenceFilter(false_positive_rate=0.01, max_bytes=1024)
+
+    async def pids():
+        for pid in ("p1", "p2"):
+            yield pid
+
+    await existence_filter.abuild("Person", count=2, pids=pids())
+
+    assert existence_filter.might_contain("Person", "p1")
+    assert not existence_filter.might_contain("Person", "p3")
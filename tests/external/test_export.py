@@ -0,0 +1,84 @@
+import gzip
+from pathlib import Path
+
+from commands.bulk_import import read_rows
+from external.neo4j.export import RowEncoder, encode_rows, export_columns, node_row
+from external.neo4j.serializers import Claim, Person
+from views import serializers
+
+
+def test_node_row_exports_dates_as_iso_and_skips_counters_and_unset_properties():
+    node = {
+        "pid": "c1",
+        "claim_number": "#1",
+        "amount": 10.5,
+        "status": "Approved",
+        "submission_date": 1746057600.0,
+        "description": None,
+    }
+
+    assert node_row(Claim, node) == {
+        "pid": "c1",
+        "claim_number": "#1",
+        "amount": 10.5,
+        "status": "Approved",
+        "submission_date": "2025-05-01T00:00:00+00:00",
+    }
+    assert "claim_count" not in export_columns("person")
+    assert node_row(Person, {"pid": "p1", "name": "Jane", "claim_count": 3}) == {
+        "pid": "p1",
+        "name": "Jane",
+    }
+
+
+def test_gzipped_csv_export_is_reimportable(tmp_path: Path):
+    rows = [
+        {
+            "pid": "c1",
+            "claim_number": "#1",
+            "amount": 10.5,
+            "status": "Approved",
+            "submission_date": "2025-05-01",
+        },
+        {
+            "pid": "c2",
+            "claim_number": "#2",
+            "amount": 3.0,
+            "status": "Submitted",
+            "submission_date": "2025-05-02",
+        },
+    ]
+    path = tmp_path / "claim.csv.gz"
+    path.write_bytes(
+        b"".join(
+            encode_rows(rows, RowEncoder("csv", export_columns("claim"), compress=True))
+        )
+    )
+
+    read = list(read_rows(path))
+
+    assert [row for _, row in read] == [
+        {key: str(value) for key, value in row.items()} for row in rows
+    ]
+    assert [serializers.Claim.model_validate(row).pid for _, row in read] == [
+        "c1",
+        "c2",
+    ]
+
+
+def test_jsonl_links_export_round_trip(tmp_path: Path):
+    links = [{"from_id": "p1", "to_id": "c1", "type": "WORKS_FOR"}]
+    path = tmp_path / "links.jsonl"
+    path.write_bytes(
+        b"".join(encode_rows(iter(links), RowEncoder("jsonl", export_columns("links"))))
+    )
+
+    assert [row for _, row in read_rows(path)] == links
+
+
+def test_empty_csv_export_still_has_a_header():
+    data = b"".join(
+        encode_rows([], RowEncoder("csv", export_columns("links"), compress=True))
+    )
+
+    assert gzip.decompress(data) == b"from_id,to_id,type\n"
@@ -0,0 +1,216 @@
+from datetime import datetime
+
+import pytest
+
+from external.memory.repository import InMemoryRepository
+from external.neo4j.exceptions import EntityNotFoundError
+
+
+def _claim(pid: str, day: int, status: str = "Submitted", amount: float = 10.0) -> dict:
+    return {
+        "pid": pid,
+        "claim_number": f"#{day}",
+        "amount": amount,
+        "status": status,
+        "submission_date": datetime(2025, 5, day),
+    }
+
+
+@pytest.fixture
+def repository() -> InMemoryRepository:
+    repository = InMemoryRepository()
+    repository.bulk_create_persons(
+        [{"pid": "p1", "name": "Jane Doe"}, {"pid": "p2", "name": "John Doe"}]
+    )
+    repository.bulk_create_companies(
+        [{"pid": "co1", "name": "Acme", "type": "Insurance"}]
+    )
+    repository.bulk_create_claims(
+        [_claim("c1", 1), _claim("c2", 2, "Approved", 30.0), _claim("c3", 3)]
+    )
+    repository.bulk_create_relationships(
+        [
+            {"from_id": "p1", "to_id": "co1", "type": "WORKS_FOR"},
+            {"from_id": "p1", "to_id": "c1", "type": "SUBMITTED"},
+            {"from_id": "p1", "to_id": "c2", "type": "SUBMITTED"},
+            {"from_id": "p2", "to_id": "c3", "type": "SUBMITTED"},
+            {"from_id": "c1", "to_id": "co1", "type": "HAS_CLAIMANT"},
+        ]
+    )
+    return repository
+
+
+def test_create_and_get_entities(repository: InMemoryRepository):
+    created = repository.create_person(pid="p9", name="New", email=None)
+
+    assert created.pid == "p9"
+    assert repository.get_person("p9").__properties__["name"] == "New"
+    assert repository.get_claim("c1").submission_date == datetime.fromisoformat(
+        "2025-05-01T00:00:00+00:00"
+    )
+    assert [
+        entity and entity.pid
+        for entity in repository.batch_get("Claim", ("c2", "nope"))
+    ] == ["c2", None]
+    with pytest.raises(EntityNotFoundError):
+        repository.get_company("nope")
+
+
+def test_bulk_create_merges_by_pid(repository: InMemoryRepository):
+    results = repository.bulk_create_persons(
+        [{"pid": "p1", "name": "Other"}, {"pid": "p3", "name": "New"}]
+    )
+
+    assert [result.status.value for result in results] == ["exists", "created"]
+    assert repository.get_person("p1").name == "Jane Doe"
+
+
+def test_relationships_update_the_claim_counters(repository: InMemoryRepository):
+    person = repository.get_person("p1")
+    assert (person.claim_count, person.claim_amount, person.claim_count_approved) == (
+        2,
+        40.0,
+        1,
+    )
+
+    # merging an existing relationship counts nothing
+    assert repository.create_person_claim_relationship("p1", "c1") is False
+    repository.update_claim_status("c1", "Approved")
+
+    person, company = repository.get_person("p1"), repository.get_company("co1")
+    assert (
+        person.claim_count,
+        person.claim_count_submitted,
+        person.claim_count_approved,
+    ) == (2, 0, 2)
+    assert (company.claim_count, company.claim_count_approved) == (1, 1)
+
+
+def test_missing_links_are_reported(repository: InMemoryRepository):
+    result = repository.bulk_create_relationships(
+        [{"from_id": "p1", "to_id": "gone", "type": "SENT"}]
+    )
+
+    assert (result.linked, result.skipped, result.not_found) == (
+        0,
+        1,
+        {"Document": ["gone"]},
+    )
+    with pytest.raises(EntityNotFoundError, match="Company with id:gone not found"):
+        repository.create_person_company_relationship("p1", "gone")
+
+
+def test_claims_by_person_pages_in_submission_order(repository: InMemoryRepository):
+    first = repository.get_claims_by_person("p1", limit=1, fields=("status",))
+    second = repository.get_claims_by_person("p1", limit=1, cursor=first.next_cursor)
+
+    assert first.items == [
+        {"status": "Submitted", "submission_date": 1746057600.0, "pid": "c1"}
+    ]
+    assert [claim["pid"] for claim in second.items] == [
+        "c2"
+    ] and second.next_cursor is None
+    with pytest.raises(EntityNotFoundError):
+        repository.get_claims_by_company("nope", limit=10)
+
+
+def test_get_claims_filters_the_window_and_status(repository: InMemoryRepository):
+    page = repository.get_claims(
+        limit=10, since=datetime(2025, 5, 2), status="Submitted"
+    )
+
+    assert [claim["pid"] for claim in page.items] == ["c3"]
+
+
+def test_claims_by_person_pages_past_undated_claims(repository: InMemoryRepository):
+    repository.bulk_create_claims(
+        [
+            {**_claim("u1", 1), "submission_date": None},
+            {**_claim("u2", 1), "submission_date": None},
+        ]
+    )
+    for pid in ("u2", "u1"):
+        repository.create_person_claim_relationship("p1", pid)
+
+    pages = [repository.get_claims_by_person("p1", limit=1)]
+    while pages[-1].next_cursor:
+        pages.append(
+            repository.get_claims_by_person("p1", limit=1, cursor=pages[-1].next_cursor)
+        )
+
+    assert [claim["pid"] for page in pages for claim in page.items] == [
+        "c1",
+        "c2",
+        "u1",
+        "u2",
+    ]
+
+
+def test_claims_by_person_filters_the_window_and_status(repository: InMemoryRepository):
+    page = repository.get_claims_by_person("p1", limit=10, until=datetime(2025, 5, 2))
+    stream = repository.stream_claims_by_person(
+        "p1", status="Approved", fields=("pid", "status")
+    )
+
+    assert [claim["pid"] for claim in page.items] == ["c1"]
+    assert list(stream) == [{"pid": "c2", "status": "Approved"}]
+    # filtered out is an empty listing, not a missing person
+    assert (
+        repository.get_claims_by_person("p1", limit=10, status="Rejected").items == []
+    )
+    assert list(repository.stream_claims_by_person("p1", status="Rejected")) == []
+
+
+def test_search_ranks_by_matched_terms(repository: InMemoryRepository):
+    page = repository.search("Person", "jane doe", limit=1)
+    next_page = repository.search(
+        "Person", "jane doe", limit=1, cursor=page.next_cursor
+    )
+
+    assert [(hit.node["pid"], hit.score) for hit in page.items + next_page.items] == [
+        ("p1", 2.0),
+        ("p2", 1.0),
+    ]
+
+
+def test_claim_stats_grouped_by_company_keeps_the_null_group(
+    repository: InMemoryRepository,
+):
+    stats = repository.get_claim_stats(group_by=("company",))
+
+    assert [(row.group, row.count, row.sum) for row in stats] == [
+        ({"company": "co1"}, 1, 10.0),
+        ({"company": None}, 2, 40.0),
+    ]
+    assert repository.get_claim_stats(group_by=(), person_id="p2")[0].count == 1
+
+
+def test_subgraph_is_capped(repository: InMemoryRepository):
+    subgraph = repository.get_subgraph(
+        "Person",
+        "p1",
+        relationships=("WORKS_FOR", "SUBMITTED"),
+        depth=2,
+        max_nodes=10,
+        max_edges=10,
+    )
+
+    assert {node["pid"] for node in subgraph.nodes} == {"p1", "co1", "c1", "c2"}
+    assert len(subgraph.edges) == 3 and not subgraph.truncated
+    assert repository.get_subgraph(
+        "Person", "p1", ("SUBMITTED",), depth=1, max_nodes=2, max_edges=10
+    ).truncated
+
+
+def test_export_rows_are_importable(repository: InMemoryRepository):
+    rows = list(repository.export_rows("claim"))
+    links = list(repository.export_rows("links"))
+
+    assert (
+        rows[0]["submission_date"] == "2025-05-01T00:00:00+00:00"
+        and "claim_count" not in rows[0]
+    )
+    assert (
+        links[0] == {"from_id": "p1", "to_id": "co1", "type": "WORKS_FOR"}
+        and len(links) == 5
+    )
@@ -1,66 +1,172 @@
+from contextlib import nullcontext
+
 import pytest
+from neo4j.exceptions import ServiceUnavailable
 from pytest_mock import MockerFixture
 
-from external.neo4j.exceptions import EntityNotFoundError
 from external.neo4j import operations
-
-from tests.mocks.db_responses import TestPerson, TestClaim
-from tests.mocks.constants import TEST_COMPANY_ID, TEST_PERSON_ID, TEST_CLAIM_ID
-
-
-def test_create_person_company_relationship_failed_person_not_found(mocker: MockerFixture):
-    mocker.patch("external.neo4j.operations.get_person", return_value=None)
+from external.neo4j.bulk import BulkItemResult, BulkItemStatus
+from external.neo4j.cache import EntityCache
+from external.neo4j.exceptions import DatabaseUnavailableError, EntityNotFoundError
+from external.neo4j.existence import ExistenceFilter
+from external.neo4j.pagination import encode_cursor
+from external.neo4j.query import (
+    ClaimStatusUpdate,
+    MissingLink,
+    RelationshipWriteResult,
+    SearchHit,
+)
+from external.neo4j.retry import RetryPolicy
+from tests.mocks import bodies
+from tests.mocks.constants import TEST_CLAIM_ID, TEST_COMPANY_ID, TEST_PERSON_ID
+from tests.mocks.db_responses import TestClaim, TestPerson
+
+
+@pytest.fixture(autouse=True)
+def mocked_transaction(mocker: MockerFixture):
+    return mocker.patch(
+        "external.neo4j.operations.transaction", return_value=nullcontext()
+    )
+
+
+def test_create_person_company_relationship_success(mocker: MockerFixture):
+    mocked_query = mocker.patch(
+        "external.neo4j.operations.q.create_relationship_by_pid",
+        return_value=RelationshipWriteResult(
+            from_found=True, to_found=True, created=True
+        ),
+    )
+
+    assert operations.create_person_company_relationship(
+        person_id=TEST_PERSON_ID, company_id=TEST_COMPANY_ID
+    )
+    mocked_query.assert_called_once_with(
+        from_label="Person",
+        from_id=TEST_PERSON_ID,
+        to_label="Company",
+        to_id=TEST_COMPANY_ID,
+        relationship="WORKS_FOR",
+    )
+
+
+def test_create_person_company_relationship_already_connected(mocker: MockerFixture):
+    mocker.patch(
+        "external.neo4j.operations.q.create_relationship_by_pid",
+        return_value=RelationshipWriteResult(
+            from_found=True, to_found=True, created=False
+        ),
+    )
+
+    assert (
+        operations.create_person_company_relationship(
+            person_id=TEST_PERSON_ID, company_id=TEST_COMPANY_ID
+        )
+        is False
+    )
+
+
+def test_create_person_company_relationship_failed_person_not_found(
+    mocker: MockerFixture,
+):
+    mocker.patch(
+        "external.neo4j.operations.q.create_relationship_by_pid",
+        return_value=RelationshipWriteResult(
+            from_found=False, to_found=False, created=False
+        ),
+    )
 
     with pytest.raises(EntityNotFoundError) as exc:
-        operations.create_person_company_relationship(person_id=TEST_PERSON_ID, company_id=TEST_COMPANY_ID)
+        operations.create_person_company_relationship(
+            person_id=TEST_PERSON_ID, company_id=TEST_COMPANY_ID
+        )
 
     assert exc.value.args[0] == f"Person with id:{TEST_PERSON_ID} not found"
 
 
-def test_create_person_company_relationship_failed_company_not_found(mocker: MockerFixture):
-    mocker.patch("external.neo4j.operations.get_person", return_value=TestPerson())
-    mocker.patch("external.neo4j.operations.get_company", return_value=None)
+def test_create_person_company_relationship_failed_company_not_found(
+    mocker: MockerFixture,
+):
+    mocker.patch(
+        "external.neo4j.operations.q.create_relationship_by_pid",
+        return_value=RelationshipWriteResult(
+            from_found=True, to_found=False, created=False
+        ),
+    )
 
     with pytest.raises(EntityNotFoundError) as exc:
-        operations.create_person_company_relationship(person_id=TEST_PERSON_ID, company_id=TEST_COMPANY_ID)
+        operations.create_person_company_relationship(
+            person_id=TEST_PERSON_ID, company_id=TEST_COMPANY_ID
+        )
 
     assert exc.value.args[0] == f"Company with id:{TEST_COMPANY_ID} not found"
 
 
-def test_create_person_claim_relationship_failed_person_not_found(mocker: MockerFixture):
-    mocker.patch("external.neo4j.operations.get_person", return_value=None)
+def test_create_person_claim_relationship_failed_person_not_found(
+    mocker: MockerFixture,
+):
+    mocker.patch(
+        "external.neo4j.operations.q.create_relationship_by_pid",
+        return_value=RelationshipWriteResult(
+            from_found=False, to_found=True, created=False
+        ),
+    )
 
     with pytest.raises(EntityNotFoundError) as exc:
-        operations.create_person_claim_relationship(person_id=TEST_PERSON_ID, claim_id=TEST_CLAIM_ID)
+        operations.create_person_claim_relationship(
+            person_id=TEST_PERSON_ID, claim_id=TEST_CLAIM_ID
+        )
 
     assert exc.value.args[0] == f"Person with id:{TEST_PERSON_ID} not found"
 
 
 def test_create_person_claim_relationship_failed_claim_not_found(mocker: MockerFixture):
-    mocker.patch("external.neo4j.operations.get_person", return_value=TestPerson())
-    mocker.patch("external.neo4j.operations.get_claim", return_value=None)
+    mocker.patch(
+        "external.neo4j.operations.q.create_relationship_by_pid",
+        return_value=RelationshipWriteResult(
+            from_found=True, to_found=False, created=False
+        ),
+    )
 
     with pytest.raises(EntityNotFoundError) as exc:
-        operations.create_person_claim_relationship(person_id=TEST_PERSON_ID, claim_id=TEST_CLAIM_ID)
+        operations.create_person_claim_relationship(
+            person_id=TEST_PERSON_ID, claim_id=TEST_CLAIM_ID
+        )
 
     assert exc.value.args[0] == f"Claim with id:{TEST_CLAIM_ID} not found"
 
 
-def test_create_claim_company_relationship_failed_claim_not_found(mocker: MockerFixture):
-    mocker.patch("external.neo4j.operations.get_claim", return_value=None)
+def test_create_claim_company_relationship_failed_claim_not_found(
+    mocker: MockerFixture,
+):
+    mocker.patch(
+        "external.neo4j.operations.q.create_relationship_by_pid",
+        return_value=RelationshipWriteResult(
+            from_found=False, to_found=True, created=False
+        ),
+    )
 
     with pytest.raises(EntityNotFoundError) as exc:
-        operations.create_claim_company_relationship(claim_id=TEST_CLAIM_ID, company_id=TEST_COMPANY_ID)
+        operations.create_claim_company_relationship(
+            claim_id=TEST_CLAIM_ID, company_id=TEST_COMPANY_ID
+        )
 
     assert exc.value.args[0] == f"Claim with id:{TEST_CLAIM_ID} not found"
 
 
-def test_create_claim_company_relationship_failed_company_not_found(mocker: MockerFixture):
-    mocker.patch("external.neo4j.operations.get_claim", return_value=TestClaim())
-    mocker.patch("external.neo4j.operations.get_company", return_value=None)
+def test_create_claim_company_relationship_failed_company_not_found(
+    mocker: MockerFixture,
+):
+    mocker.patch(
+        "external.neo4j.operations.q.create_relationship_by_pid",
+        return_value=RelationshipWriteResult(
+            from_found=True, to_found=False, created=False
+        ),
+    )
 
     with pytest.raises(EntityNotFoundError) as exc:
-        operations.create_claim_company_relationship(claim_id=TEST_CLAIM_ID, company_id=TEST_COMPANY_ID)
+        operations.create_claim_company_relationship(
+            claim_id=TEST_CLAIM_ID, company_id=TEST_COMPANY_ID
+        )
 
     assert exc.value.args[0] == f"Company with id:{TEST_COMPANY_ID} not found"
 
@@ -69,7 +175,7 @@ def test_get_claims_by_person_failed_claim_not_found(mocker: MockerFixture):
     mocker.patch("external.neo4j.operations.q.get_claims_by_person", return_value=None)
 
     with pytest.raises(EntityNotFoundError) as exc:
-        operations.get_claims_by_person(person_id=TEST_PERSON_ID)
+        operations.get_claims_by_person(person_id=TEST_PERSON_ID, limit=10)
 
     assert exc.value.args[0] == f"No claims for person with id:{TEST_PERSON_ID} found"
 
@@ -78,9 +184,90 @@ def test_get_claims_by_company_failed_claim_not_found(mocker: MockerFixture):
     mocker.patch("external.neo4j.operations.q.get_claims_by_company", return_value=None)
 
     with pytest.raises(EntityNotFoundError) as exc:
-        operations.get_claims_by_company(company_id=TEST_COMPANY_ID)
+        operations.get_claims_by_company(company_id=TEST_COMPANY_ID, limit=10)
+
+    assert (
+        exc.value.args[0]
+        == f"No claims associated to Company with id:{TEST_COMPANY_ID} found"
+    )
+
+
+def test_get_claims_by_company_next_page(mocker: MockerFixture):
+    mocked_query = mocker.patch(
+        "external.neo4j.operations.q.get_claims_by_company", return_value=[]
+    )
+
+    page = operations.get_claims_by_company(
+        company_id=TEST_COMPANY_ID, limit=10, cursor=encode_cursor(1.0, "c1")
+    )
+
+    assert page.items == []
+    assert page.next_cursor is None
+    mocked_query.assert_called_once_with(
+        company_id=TEST_COMPANY_ID,
+        limit=11,
+        after_date=1.0,
+        after_pid="c1",
+        fields=None,
+        since=None,
+        until=None,
+        status=None,
+    )
+
+
+def test_get_claims_by_company_filtered_without_match_is_an_empty_page(
+    mocker: MockerFixture,
+):
+    mocked_query = mocker.patch(
+        "external.neo4j.operations.q.get_claims_by_company", return_value=[]
+    )
+
+    page = operations.get_claims_by_company(
+        company_id=TEST_COMPANY_ID, limit=10, status="Approved"
+    )
+
+    assert page.items == [] and page.next_cursor is None
+    assert mocked_query.call_args.kwargs["status"] == "Approved"
+
+
+def test_stream_claims_by_company_failed_claim_not_found(mocker: MockerFixture):
+    mocked_driver = mocker.patch("external.neo4j.operations.get_driver")
+    session = mocked_driver.return_value.session.return_value
+    session.run.return_value.peek.return_value = None
+
+    with pytest.raises(EntityNotFoundError) as exc:
+        operations.stream_claims_by_company(company_id=TEST_COMPANY_ID)
+
+    assert (
+        exc.value.args[0]
+        == f"No claims associated to Company with id:{TEST_COMPANY_ID} found"
+    )
+    session.close.assert_called_once()
+
+
+def test_stream_claims_by_company_iterates_lazily(mocker: MockerFixture):
+    claims = [TestClaim("c1"), TestClaim("c2")]
+    mocked_driver = mocker.patch("external.neo4j.operations.get_driver")
+    session = mocked_driver.return_value.session.return_value
+    session.run.return_value.peek.return_value = [claims[0]]
+    session.run.return_value.__iter__.return_value = iter([[claim] for claim in claims])
+
+    stream = operations.stream_claims_by_company(company_id=TEST_COMPANY_ID)
 
-    assert exc.value.args[0] == f"No claims associated to Company with id:{TEST_COMPANY_ID} found"
+    session.close.assert_not_called()
+    assert list(stream) == claims
+    session.close.assert_called_once()
+
+
+def test_closing_an_unread_stream_closes_its_session(mocker: MockerFixture):
+    mocked_driver = mocker.patch("external.neo4j.operations.get_driver")
+    session = mocked_driver.return_value.session.return_value
+    session.run.return_value.peek.return_value = [TestClaim("c1")]
+
+    # a client disconnecting before the first chunk
+    operations.stream_claims_by_company(company_id=TEST_COMPANY_ID).close()
+
+    session.close.assert_called_once()
 
 
 def test_get_company_by_person_failed_claim_not_found(mocker: MockerFixture):
@@ -89,4 +276,350 @@ def test_get_company_by_person_failed_claim_not_found(mocker: MockerFixture):
     with pytest.raises(EntityNotFoundError) as exc:
         operations.get_company_by_person(person_id=TEST_PERSON_ID)
 
-    assert exc.value.args[0] == f"Person with id:{TEST_PERSON_ID} is not assiociated with any Company"
+    assert (
+        exc.value.args[0]
+        == f"Person with id:{TEST_PERSON_ID} is not assiociated with any Company"
+    )
+
+
+def test_bulk_create_persons_writes_one_transaction_per_batch(mocker: MockerFixture):
+    mocker.patch.object(operations.db_settings, "bulk_batch_size", 2)
+    mocked_write = mocker.patch(
+        "external.neo4j.operations._write",
+        side_effect=[{"p1": True, "p2": False}, {"p3": True}],
+    )
+    items = [bodies.create_person_request(pid) for pid in ("p1", "p2", "p3")]
+
+    results = operations.bulk_create_persons(items=items)
+
+    assert mocked_write.call_count == 2
+    assert [len(call.kwargs["rows"]) for call in mocked_write.call_args_list] == [2, 1]
+    assert all(call.kwargs["label"] == "Person" for call in mocked_write.call_args_list)
+    assert results == [
+        BulkItemResult("p1", BulkItemStatus.CREATED),
+        BulkItemResult("p2", BulkItemStatus.EXISTS),
+        BulkItemResult("p3", BulkItemStatus.CREATED),
+    ]
+
+
+def test_bulk_create_relationships_groups_by_type(mocker: MockerFixture):
+    mocked_write = mocker.patch(
+        "external.neo4j.operations._write",
+        side_effect=[
+            [MissingLink("p2", TEST_COMPANY_ID, from_found=False, to_found=True)],
+            [],
+        ],
+    )
+    links = [
+        {"from_id": TEST_PERSON_ID, "to_id": TEST_COMPANY_ID, "type": "WORKS_FOR"},
+        {"from_id": "p2", "to_id": TEST_COMPANY_ID, "type": "WORKS_FOR"},
+        {"from_id": TEST_CLAIM_ID, "to_id": TEST_COMPANY_ID, "type": "HAS_CLAIMANT"},
+    ]
+
+    result = operations.bulk_create_relationships(links=links)
+
+    assert [
+        (
+            call.kwargs["from_label"],
+            call.kwargs["to_label"],
+            call.kwargs["relationship"],
+            len(call.kwargs["links"]),
+        )
+        for call in mocked_write.call_args_list
+    ] == [
+        ("Person", "Company", "WORKS_FOR", 2),
+        ("Claim", "Company", "HAS_CLAIMANT", 1),
+    ]
+    assert result.linked == 2
+    assert result.skipped == 1
+    assert result.not_found == {"Person": ["p2"]}
+
+
+def test_create_relationship_invalidates_cached_endpoints(mocker: MockerFixture):
+    mocker.patch(
+        "external.neo4j.operations.q.create_relationship_by_pid",
+        return_value=RelationshipWriteResult(
+            from_found=True, to_found=True, created=True
+        ),
+    )
+    invalidate = mocker.patch("external.neo4j.operations.entity_cache.invalidate")
+
+    operations.create_person_claim_relationship(
+        person_id=TEST_PERSON_ID, claim_id=TEST_CLAIM_ID
+    )
+
+    invalidate.assert_any_call("Person", TEST_PERSON_ID)
+    invalidate.assert_any_call("Claim", TEST_CLAIM_ID)
+
+
+def test_get_person_uses_entity_cache(mocker: MockerFixture):
+    mocker.patch(
+        "external.neo4j.operations.entity_cache", EntityCache(max_size=10, ttl=60)
+    )
+    nodes = mocker.patch.object(operations.Person, "nodes")
+    nodes.get_or_none.return_value = TestPerson()
+
+    first = operations.get_person(person_id=TEST_PERSON_ID)
+    second = operations.get_person(person_id=TEST_PERSON_ID)
+
+    assert first is second
+    nodes.get_or_none.assert_called_once_with(pid=TEST_PERSON_ID)
+
+
+def test_get_person_projects_fields_in_the_query_without_entity_cache(
+    mocker: MockerFixture,
+):
+    mocker.patch(
+        "external.neo4j.operations.entity_cache",
+        EntityCache(max_size=10, ttl=60, enabled=False),
+    )
+    get_node_by_pid = mocker.patch(
+        "external.neo4j.operations.q.get_node_by_pid",
+        return_value={"pid": TEST_PERSON_ID, "name": "A"},
+    )
+    nodes = mocker.patch.object(operations.Person, "nodes")
+
+    person = operations.get_person(person_id=TEST_PERSON_ID, fields=("pid", "name"))
+
+    assert person == {"pid": TEST_PERSON_ID, "name": "A"}
+    get_node_by_pid.assert_called_once_with("Person", TEST_PERSON_ID, ("pid", "name"))
+    nodes.get_or_none.assert_not_called()
+
+
+def test_get_person_missed_by_existence_filter_is_read_from_db(mocker: MockerFixture):
+    existence_filter = ExistenceFilter(false_positive_rate=0.01, max_bytes=1024)
+    existence_filter.build("Person", count=1, pids=["other-person"])
+    mocker.patch("external.neo4j.operations.existence_filter", existence_filter)
+    nodes = mocker.patch.object(
+        operations.Person, "nodes", new_callable=mocker.MagicMock
+    )
+
+    # created by another process since the filter was built
+    assert (
+        operations.get_person(person_id=TEST_PERSON_ID)
+        is nodes.get_or_none.return_value
+    )
+
+    nodes.get_or_none.assert_called_once_with(pid=TEST_PERSON_ID)
+    assert existence_filter.might_contain("Person", TEST_PERSON_ID)
+    assert existence_filter.stats()["false_negatives"] == 1
+
+
+def test_create_relationship_runs_in_write_transaction(
+    mocker: MockerFixture, mocked_transaction
+):
+    mocker.patch(
+        "external.neo4j.operations.q.create_relationship_by_pid",
+        return_value=RelationshipWriteResult(
+            from_found=True, to_found=True, created=True
+        ),
+    )
+
+    operations.create_person_claim_relationship(
+        person_id=TEST_PERSON_ID, claim_id=TEST_CLAIM_ID
+    )
+
+    mocked_transaction.assert_called_once_with("WRITE")
+
+
+def test_get_company_by_person_runs_in_read_transaction(
+    mocker: MockerFixture, mocked_transaction
+):
+    mocker.patch(
+        "external.neo4j.operations.q.get_company_by_person", return_value=TestPerson()
+    )
+
+    operations.get_company_by_person(person_id=TEST_PERSON_ID)
+
+    mocked_transaction.assert_called_once_with("READ")
+
+
+def test_get_subgraph_failed_root_not_found(mocker: MockerFixture):
+    mocker.patch("external.neo4j.operations.q.get_subgraph", return_value=None)
+
+    with pytest.raises(EntityNotFoundError) as exc:
+        operations.get_subgraph(
+            label="Person",
+            pid=TEST_PERSON_ID,
+            relationships=("WORKS_FOR",),
+            depth=2,
+            max_nodes=10,
+            max_edges=10,
+        )
+
+    assert exc.value.args[0] == f"Person with id:{TEST_PERSON_ID} not found"
+
+
+def test_update_claim_status_failed_claim_not_found(mocker: MockerFixture):
+    mocker.patch("external.neo4j.operations._write", return_value=None)
+
+    with pytest.raises(EntityNotFoundError) as exc:
+        operations.update_claim_status(claim_id=TEST_CLAIM_ID, status="Approved")
+
+    assert exc.value.args[0] == f"Claim with id:{TEST_CLAIM_ID} not found"
+
+
+def test_update_claim_status_invalidates_holders(mocker: MockerFixture):
+    mocker.patch(
+        "external.neo4j.operations._write",
+        return_value=ClaimStatusUpdate(
+            claim=mocker.sentinel.node, holders=[("Company", TEST_COMPANY_ID)]
+        ),
+    )
+    mocker.patch.object(operations.Claim, "inflate", return_value=TestClaim())
+    invalidate = mocker.patch("external.neo4j.operations.entity_cache.invalidate")
+
+    operations.update_claim_status(claim_id=TEST_CLAIM_ID, status="Approved")
+
+    invalidate.assert_any_call("Claim", TEST_CLAIM_ID)
+    invalidate.assert_any_call("Company", TEST_COMPANY_ID)
+
+
+def test_search_next_page(mocker: MockerFixture):
+    hits = [SearchHit(node={"pid": f"p{i}"}, score=3.0 - i) for i in range(3)]
+    search_nodes = mocker.patch(
+        "external.neo4j.operations.q.search_nodes", return_value=hits
+    )
+
+    page = operations.search(
+        label="Person", text="jane", limit=2, cursor=encode_cursor(3.5, "p")
+    )
+
+    search_nodes.assert_called_once_with(
+        index="fulltext_Person", text="jane", limit=3, after_score=3.5, after_pid="p"
+    )
+    assert page.items == hits[:2]
+    assert page.next_cursor == encode_cursor(2.0, "p1")
+
+
+def test_get_claims_next_page(mocker: MockerFixture):
+    claims = [{"pid": f"c{i}", "submission_date": 1000.0 + i} for i in range(3)]
+    get_submitted_nodes = mocker.patch(
+        "external.neo4j.operations.q.get_submitted_nodes", return_value=claims
+    )
+
+    page = operations.get_claims(
+        limit=2, cursor=encode_cursor(999.0, "c"), status="Approved"
+    )
+
+    get_submitted_nodes.assert_called_once_with(
+        "Claim",
+        limit=3,
+        after_date=999.0,
+        after_pid="c",
+        fields=None,
+        since=None,
+        until=None,
+        status="Approved",
+    )
+    assert page.items == claims[:2]
+    assert page.next_cursor == encode_cursor(1001.0, "c1")
+
+
+def test_get_documents_empty_window(mocker: MockerFixture):
+    mocker.patch("external.neo4j.operations.q.get_submitted_nodes", return_value=[])
+
+    page = operations.get_documents(limit=2)
+
+    assert page.items == [] and page.next_cursor is None
+
+
+def test_batch_get_preserves_order_and_skips_cached_pids(mocker: MockerFixture):
+    cache = EntityCache(max_size=10, ttl=60)
+    cache.set("Claim", "cached", "cached-claim")
+    existence_filter = ExistenceFilter(false_positive_rate=0.01, max_bytes=1024)
+    existence_filter.build("Claim", count=3, pids=["cached", "c1", "gone"])
+    mocker.patch("external.neo4j.operations.entity_cache", cache)
+    mocker.patch("external.neo4j.operations.existence_filter", existence_filter)
+    get_nodes_by_pids = mocker.patch(
+        "external.neo4j.operations.q.get_nodes_by_pids",
+        return_value=[{"pid": "c1"}, {"pid": "fresh"}],
+    )
+    mocker.patch.object(
+        operations.Claim, "inflate", side_effect=lambda node: f"claim-{node['pid']}"
+    )
+
+    entities = operations.batch_get(
+        label="Claim", pids=("c1", "unknown", "cached", "gone", "fresh")
+    )
+
+    get_nodes_by_pids.assert_called_once_with(
+        "Claim", ["c1", "unknown", "gone", "fresh"]
+    )
+    assert entities == ["claim-c1", None, "cached-claim", None, "claim-fresh"]
+    assert existence_filter.stats()["false_negatives"] == 1
+
+
+def test_export_rows_pages_through_the_label(mocker: MockerFixture):
+    pages = [
+        [{"pid": "p1", "name": "A"}, {"pid": "p2", "name": "B"}],
+        [{"pid": "p3", "name": "C"}],
+    ]
+    get_nodes_page = mocker.patch(
+        "external.neo4j.operations.q.get_nodes_page", side_effect=pages
+    )
+
+    rows = list(operations.export_rows("person", page_size=2))
+
+    assert [row["pid"] for row in rows] == ["p1", "p2", "p3"]
+    assert get_nodes_page.call_args_list == [
+        mocker.call("Person", after="", limit=2),
+        mocker.call("Person", after="p2", limit=2),
+    ]
+
+
+def test_export_rows_pages_through_every_relationship_type(mocker: MockerFixture):
+    pages = {
+        "WORKS_FOR": [[("p1", "c1"), ("p1", "c2")], []],
+        "SUBMITTED": [[("p2", "cl1")]],
+    }
+    calls = []
+
+    def get_links_page(from_label, to_label, relationship, after_from, after_to, limit):
+        calls.append((relationship, after_from, after_to))
+        return pages.setdefault(relationship, [[]]).pop(0)
+
+    mocker.patch(
+        "external.neo4j.operations.q.get_links_page", side_effect=get_links_page
+    )
+
+    rows = list(operations.export_rows("links", page_size=2))
+
+    assert rows == [
+        {"from_id": "p1", "to_id": "c1", "type": "WORKS_FOR"},
+        {"from_id": "p1", "to_id": "c2", "type": "WORKS_FOR"},
+        {"from_id": "p2", "to_id": "cl1", "type": "SUBMITTED"},
+    ]
+    assert calls == [
+        ("WORKS_FOR", "", ""),
+        ("WORKS_FOR", "p1", "c2"),
+        ("SUBMITTED", "", ""),
+        ("SENT", "", ""),
+        ("HAS_CLAIMANT", "", ""),
+    ]
+
+
+def test_deprecated_operations_retry_transient_errors(mocker: MockerFixture):
+    session = mocker.patch(
+        "external.neo4j.operations.get_driver"
+    ).return_value.session.return_value.__enter__()
+    session.execute_read.side_effect = ServiceUnavailable("no leader")
+    session.execute_write.side_effect = [
+        ServiceUnavailable("leader switch"),
+        {"pid": "p1"},
+    ]
+    mocker.patch.object(
+        operations,
+        "transaction_retry",
+        RetryPolicy(3, initial_delay=0, max_delay=0, deadline=10),
+    )
+
+    with pytest.deprecated_call(), pytest.raises(DatabaseUnavailableError):
+        operations.get_entity("Person", "p1")
+    with pytest.deprecated_call():
+        assert operations.create_relationship(
+            "Person", "p1", "Company", "c1", "WORKS_FOR"
+        ) == {"pid": "p1"}
+
+    assert session.execute_read.call_count == 3
+    assert session.execute_write.call_count == 2
@@ -0,0 +1,47 @@
+import pytest
+
+from external.neo4j.exceptions import InvalidCursorError
+from external.neo4j.pagination import (
+    Page,
+    build_page,
+    claim_cursor_key,
+    decode_cursor,
+    encode_cursor,
+    keyset_fields,
+)
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(1748361728.0, "f3055331")
+
+    assert decode_cursor(cursor, size=2) == [1748361728.0, "f3055331"]
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not-a-cursor", encode_cursor("only-one-value"), encode_cursor(1, 2, 3)]
+)
+def test_decode_cursor_invalid(cursor: str):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, size=2)
+
+
+def test_build_page_with_next_page():
+    claims = [{"submission_date": float(i), "pid": f"c{i}"} for i in range(3)]
+
+    page = build_page(claims, limit=2, cursor_key=claim_cursor_key)
+
+    assert page.items == claims[:2]
+    assert decode_cursor(page.next_cursor, size=2) == [1.0, "c1"]
+
+
+def test_build_page_last_page():
+    claims = [{"submission_date": 1.0, "pid": "c1"}]
+
+    assert build_page(claims, limit=2, cursor_key=claim_cursor_key) == Page(
+        items=claims, next_cursor=None
+    )
+
+
+def test_keyset_fields_adds_the_cursor_properties():
+    assert keyset_fields(None) is None
+    assert keyset_fields(("pid", "status")) == ("pid", "status", "submission_date")
@@ -0,0 +1,229 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+from pytest_mock import MockerFixture
+
+from external.neo4j import query as q
+from external.neo4j.pagination import UNDATED
+from external.neo4j.query import ClaimStats
+
+
+def test_claim_stats_query_groups_by_status():
+    query = q.claim_stats_query(["status"])
+
+    assert "cl.status AS status" in query
+    assert "ORDER BY status" in query
+    assert "Company" not in query
+    assert "Person" not in query
+
+
+def test_claim_stats_query_filters_by_company_and_groups_by_person():
+    query = q.claim_stats_query(["person"], by_company=True)
+
+    assert "MATCH (cl)-[:HAS_CLAIMANT]->(co:Company {pid: $company_id})" in query
+    assert "OPTIONAL MATCH (pe:Person)-[:SUBMITTED]->(cl)" in query
+    assert "pe.pid AS person" in query
+
+
+def test_claim_stats_from_row():
+    stats = ClaimStats.from_row(
+        ["status", "company"], ["Approved", "c1", 2, 30.0, 10.0, 20.0, 15.0]
+    )
+
+    assert stats == ClaimStats(
+        {"status": "Approved", "company": "c1"}, 2, 30.0, 10.0, 20.0, 15.0
+    )
+
+
+def test_subgraph_query_interpolates_types_and_depth():
+    query = q.subgraph_query("Person", ["SUBMITTED", "WORKS_FOR"], depth=3)
+
+    assert "MATCH (root:Person {pid: $pid})" in query
+    assert "[:SUBMITTED|WORKS_FOR*1..3]" in query
+
+
+def test_search_text_escapes_lucene_syntax():
+    assert q.search_text('  jane  doe+1 "x" ') == 'jane doe\\+1 \\"x\\"'
+    assert q.search_text("a && b || c:d") == "a \\&& b \\|| c\\:d"
+
+
+def test_search_text_treats_operators_as_terms():
+    assert q.search_text("Smith AND NOT Jones") == "Smith and not Jones"
+
+
+def test_submitted_nodes_statement_only_writes_used_filters():
+    query, params = q.submitted_nodes_statement("Document", limit=11)
+
+    assert "n.submission_date IS NOT NULL" in query
+    assert (
+        "$until" not in query and "$after_date" not in query and "$status" not in query
+    )
+    assert params["limit"] == 11 and params["since"] is None
+
+
+def test_submitted_nodes_statement_window_status_and_cursor():
+    query, params = q.submitted_nodes_statement(
+        "Claim",
+        limit=3,
+        since=datetime(2025, 5, 1),
+        until=datetime(2025, 6, 1, 2, tzinfo=timezone(timedelta(hours=2))),
+        status="Approved",
+        after_date=1746057600.0,
+        after_pid="c1",
+    )
+
+    assert "MATCH (n:Claim)" in query
+    for predicate in [
+        "n.submission_date >= $since",
+        "n.submission_date < $until",
+        "n.submission_date >= $after_date",
+        "n.status = $status",
+    ]:
+        assert predicate in query
+    assert "ORDER BY n.submission_date, n.pid" in query
+    assert params["since"] == 1746057600.0
+    assert params["until"] == 1748736000.0
+    assert (params["status"], params["after_date"], params["after_pid"]) == (
+        "Approved",
+        1746057600.0,
+        "c1",
+    )
+
+
+def test_node_by_pid_query_projects_fields():
+    assert (
+        q.node_by_pid_query("Person") == "MATCH (n:Person {pid: $pid}) RETURN n LIMIT 1"
+    )
+    assert q.node_by_pid_query("Person", ("pid", "name")) == (
+        "MATCH (n:Person {pid: $pid}) RETURN n {.pid, .name} AS n_fields LIMIT 1"
+    )
+
+
+def test_claims_by_holder_query_projects_fields():
+    assert "RETURN cl\n" in q.claims_by_holder_query("person")
+    assert "RETURN cl {.pid, .status} AS cl_fields\n" in q.claims_by_holder_query(
+        "person", ("pid", "status"), stream=True
+    )
+    assert "ORDER BY" not in q.claims_by_holder_query("person", stream=True)
+
+
+def test_claims_page_is_read_from_the_claim_index_and_filtered_by_holder():
+    first = q.claims_by_holder_query("company")
+    following = q.claims_by_holder_query("company", after=True)
+
+    for query in (first, following):
+        assert "MATCH (cl:Claim)\n" in query
+        assert (
+            "AND EXISTS { (cl:Claim)-[:HAS_CLAIMANT]->(:Company {pid: $company_id}) }"
+            in query
+        )
+        assert "ORDER BY cl.submission_date, cl.pid" in query
+    assert "$after_date" not in first and "$after_pid" not in first
+    assert "$after_date IS NULL" not in following
+    assert "AND cl.submission_date >= $after_date\n" in following
+    assert (
+        "AND (cl.submission_date > $after_date OR cl.pid > $after_pid)\n" in following
+    )
+    assert "$after_date" not in q.claims_by_holder_query(
+        "person", stream=True, after=True
+    )
+
+
+def test_undated_claims_page_by_pid_from_the_holder():
+    query = q.claims_by_holder_query("person", undated=True, after=True)
+
+    assert "MATCH (:Person {pid: $person_id})-[:SUBMITTED]->(cl:Claim)" in query
+    assert (
+        "WHERE cl.submission_date IS NULL\n" in query
+        and "AND cl.pid > $after_pid\n" in query
+    )
+    assert "ORDER BY cl.pid\n" in query and "$after_date" not in query
+
+
+def test_claims_by_holder_statements_list_the_undated_claims_last():
+    first = list(q.claims_by_holder_statements("person", "p1", 11))
+    dated = list(
+        q.claims_by_holder_statements(
+            "person", "p1", 11, after_date=5.0, after_pid="c1"
+        )
+    )
+    undated = list(
+        q.claims_by_holder_statements(
+            "person", "p1", 11, after_date=UNDATED, after_pid="c1"
+        )
+    )
+    window = list(
+        q.claims_by_holder_statements(
+            "person", "p1", 11, since=datetime(2025, 5, 1, tzinfo=UTC)
+        )
+    )
+
+    assert ["IS NULL" in query for query, _ in first] == [False, True]
+    # the undated claims are all after a dated cursor
+    assert dated[1][1]["after_pid"] is None and dated[0][1]["after_pid"] == "c1"
+    assert (
+        len(undated) == 1
+        and undated[0][1]["after_pid"] == "c1"
+        and "IS NULL" in undated[0][0]
+    )
+    assert len(window) == 1 and "IS NULL" not in window[0][0]
+
+
+def test_get_claims_by_holder_fills_the_page_with_undated_claims(mocker: MockerFixture):
+    cypher_query = mocker.patch(
+        "external.neo4j.query.db.cypher_query",
+        side_effect=[([["c1"], ["c2"]], None), ([["u1"]], None)],
+    )
+
+    assert q.get_claims_by_holder("person", "p1", limit=4) == ["c1", "c2", "u1"]
+    assert [call.kwargs["params"]["limit"] for call in cypher_query.call_args_list] == [
+        4,
+        2,
+    ]
+
+    cypher_query.reset_mock(side_effect=True)
+    cypher_query.return_value = ([["c3"], ["c4"]], None)
+    assert q.get_claims_by_holder("person", "p1", limit=2) == ["c3", "c4"]
+    cypher_query.assert_called_once()
+
+
+def test_claims_by_holder_statement_writes_only_the_filters_in_use():
+    query, params = q.claims_by_holder_statement(
+        "person",
+        "p1",
+        limit=11,
+        since=datetime(2025, 5, 1, tzinfo=UTC),
+        status="Approved",
+    )
+
+    assert (
+        "WHERE cl.submission_date >= $since\n" in query
+        and "AND cl.status = $status\n" in query
+    )
+    assert "$until" not in query and "$after_date" not in query
+    assert params == {
+        "person_id": "p1",
+        "limit": 11,
+        "since": 1746057600.0,
+        "until": None,
+        "status": "Approved",
+        "after_date": None,
+        "after_pid": None,
+    }
+    stream, _ = q.claims_by_holder_statement(
+        "company", "c1", status="Approved", after_pid="x", stream=True
+    )
+    assert (
+        "cl.status = $status\n" in stream
+        and "ORDER BY" not in stream
+        and "$after_pid" not in stream
+    )
+
+
+def test_links_page_query_resumes_after_the_last_pair():
+    query = q.links_page_query("Person", "Company", "WORKS_FOR")
+
+    assert "MATCH (a:Person)-[:WORKS_FOR]->(b:Company)" in query
+    assert (
+        "a.pid >= $after_from AND (a.pid > $after_from OR b.pid > $after_to)" in query
+    )
+    assert "ORDER BY a.pid, b.pid" in query
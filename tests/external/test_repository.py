@@ -0,0 +1,29 @@
+import inspect
+
+import pytest
+
+from external.memory.repository import InMemoryRepository
+from external.neo4j import async_operations, operations
+from external.repository import Repository
+
+
+@pytest.mark.parametrize("backend", [operations, async_operations])
+def test_neo4j_operations_implement_the_repository(backend):
+    for name, member in inspect.getmembers(Repository, inspect.isfunction):
+        if name.startswith("_"):
+            continue
+        expected = [p for p in inspect.signature(member).parameters if p != "self"]
+        assert list(inspect.signature(getattr(backend, name)).parameters) == expected, (
+            name
+        )
+
+
+def test_in_memory_repository_implements_it():
+    for name, member in inspect.getmembers(Repository, inspect.isfunction):
+        if name.startswith("_"):
+            continue
+        expected = list(inspect.signature(member).parameters)
+        assert (
+            list(inspect.signature(getattr(InMemoryRepository, name)).parameters)
+            == expected
+        ), name
@@ -0,0 +1,130 @@
+import contextvars
+
+import pytest
+from neo4j.exceptions import ClientError, ServiceUnavailable, TransientError
+from pytest_mock import MockerFixture
+
+from external.neo4j.exceptions import DatabaseUnavailableError
+from external.neo4j.retry import RetryPolicy, bind_request_deadline
+
+
+@pytest.fixture
+def policy() -> RetryPolicy:
+    return RetryPolicy(max_attempts=3, initial_delay=0.1, max_delay=1, deadline=10)
+
+
+@pytest.fixture(autouse=True)
+def mocked_sleep(mocker: MockerFixture):
+    return mocker.patch("external.neo4j.retry.time.sleep")
+
+
+def test_transient_error_is_retried(policy: RetryPolicy, mocked_sleep):
+    attempts = []
+
+    def fn():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise TransientError("deadlock")
+        return "ok"
+
+    assert policy.run(fn) == "ok"
+    assert len(attempts) == 3
+    assert mocked_sleep.call_count == 2
+    assert policy.stats()["retries"] == 2
+    assert policy.stats()["failures"] == 0
+
+
+def test_backoff_is_bounded_and_jittered(
+    policy: RetryPolicy, mocked_sleep, mocker: MockerFixture
+):
+    uniform = mocker.patch(
+        "external.neo4j.retry.random.uniform", side_effect=lambda low, high: high
+    )
+    policy.max_attempts = 6
+
+    def fn():
+        raise ServiceUnavailable("leader switch")
+
+    with pytest.raises(DatabaseUnavailableError):
+        policy.run(fn)
+
+    assert [call.args for call in uniform.call_args_list] == [
+        (0, 0.1),
+        (0, 0.2),
+        (0, 0.4),
+        (0, 0.8),
+        (0, 1),
+    ]
+
+
+def test_non_transient_error_is_not_retried(policy: RetryPolicy, mocked_sleep):
+    def fn():
+        raise ClientError("syntax error")
+
+    with pytest.raises(ClientError):
+        policy.run(fn)
+
+    mocked_sleep.assert_not_called()
+    assert policy.stats()["failures"] == 0
+
+
+def test_exhausted_retries_raise_database_unavailable(policy: RetryPolicy):
+    def fn():
+        raise ServiceUnavailable("no leader")
+
+    with pytest.raises(DatabaseUnavailableError) as exc:
+        policy.run(fn)
+
+    assert isinstance(exc.value.__cause__, ServiceUnavailable)
+    assert policy.stats()["retries"] == 2
+    assert policy.stats()["failures"] == 1
+
+
+def test_deadline_stops_retries(policy: RetryPolicy, mocker: MockerFixture):
+    mocker.patch("external.neo4j.retry.time.monotonic", side_effect=[0.0, 20.0])
+
+    def fn():
+        raise TransientError("deadlock")
+
+    with pytest.raises(DatabaseUnavailableError):
+        policy.run(fn)
+
+    assert policy.stats()["retries"] == 0
+
+
+def test_request_deadline_is_shared_by_its_operations(
+    policy: RetryPolicy, mocker: MockerFixture
+):
+    monotonic = mocker.patch("external.neo4j.retry.time.monotonic", return_value=0.0)
+    mocker.patch("external.neo4j.retry.random.uniform", return_value=0.1)
+
+    def fn():
+        raise TransientError("deadlock")
+
+    def request():
+        bind_request_deadline(10)
+        # a previous operation of the request already spent most of the deadline
+        monotonic.return_value = 9.95
+        with pytest.raises(DatabaseUnavailableError):
+            policy.run(fn)
+
+    contextvars.copy_context().run(request)
+
+    assert policy.stats()["retries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_async_transient_error_is_retried(
+    policy: RetryPolicy, mocker: MockerFixture
+):
+    mocker.patch("external.neo4j.retry.asyncio.sleep")
+    attempts = []
+
+    async def fn():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise TransientError("deadlock")
+        return "ok"
+
+    assert await policy.arun(fn) == "ok"
+    assert policy.stats()["retries"] == 1
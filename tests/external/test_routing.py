@@ -0,0 +1,49 @@
+import pytest
+from neo4j import Bookmarks
+
+from external.neo4j import routing
+
+
+@pytest.fixture(autouse=True)
+def unbind_bookmarks():
+    yield
+    routing.bind_bookmarks([])
+
+
+def test_session_config_waits_for_request_bookmarks():
+    routing.bind_bookmarks(["FB:1"])
+
+    config = routing.session_config(routing.READ_ACCESS)
+
+    assert config["default_access_mode"] == routing.READ_ACCESS
+    assert config["bookmarks"].raw_values == frozenset({"FB:1"})
+
+
+def test_session_config_without_bookmarks():
+    routing.bind_bookmarks([])
+
+    assert routing.session_config(routing.WRITE_ACCESS)["bookmarks"] is None
+
+
+def test_record_bookmarks_replaces_request_bookmarks():
+    holder = routing.bind_bookmarks(["FB:1", "FB:2"])
+
+    routing.record_bookmarks(Bookmarks.from_raw_values(["FB:3"]))
+
+    assert holder.values == frozenset({"FB:3"})
+
+
+def test_record_empty_bookmarks_keeps_request_bookmarks():
+    holder = routing.bind_bookmarks(["FB:1"])
+
+    routing.record_bookmarks(Bookmarks())
+
+    assert holder.values == frozenset({"FB:1"})
+
+
+def test_bookmarks_header_round_trip():
+    header = routing.format_bookmarks_header(["FB:2", "FB:1"])
+
+    assert header == "FB:1,FB:2"
+    assert routing.parse_bookmarks_header(header) == ["FB:1", "FB:2"]
+    assert routing.parse_bookmarks_header(None) == []
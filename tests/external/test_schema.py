@@ -0,0 +1,67 @@
+from pytest_mock import MockerFixture
+
+from external.neo4j import schema
+
+
+def _mock_session(mocker: MockerFixture, constraints: list[str], indexes: list[dict]):
+    session = mocker.MagicMock()
+
+    def run(statement: str):
+        result = mocker.MagicMock()
+        if statement.startswith("SHOW CONSTRAINTS"):
+            result.value.return_value = constraints
+        else:
+            result.__iter__.return_value = iter(indexes)
+        return result
+
+    session.run.side_effect = run
+    mocked_driver = mocker.patch("external.neo4j.schema.get_driver")
+    mocked_driver.return_value.session.return_value.__enter__.return_value = session
+    return session
+
+
+def test_check_schema_ready(mocker: MockerFixture):
+    names = [item.name for item in schema.SCHEMA]
+    _mock_session(
+        mocker,
+        constraints=names,
+        indexes=[
+            {"name": name, "state": "ONLINE", "populationPercent": 100.0}
+            for name in names
+        ],
+    )
+
+    report = schema.check_schema()
+
+    assert report.is_ready
+    assert report == schema.SchemaReport(missing=[], populating={}, failed=[])
+
+
+def test_check_schema_reports_missing_populating_and_failed(mocker: MockerFixture):
+    person, company, claim, document = (item.name for item in schema.SCHEMA[:4])
+    _mock_session(
+        mocker,
+        constraints=[company, claim, document],
+        indexes=[
+            {"name": company, "state": "POPULATING", "populationPercent": 42.0},
+            {"name": claim, "state": "FAILED", "populationPercent": 0.0},
+            {"name": document, "state": "ONLINE", "populationPercent": 100.0},
+        ],
+    )
+
+    report = schema.check_schema()
+
+    assert not report.is_ready
+    assert person in report.missing
+    assert report.populating == {company: 42.0}
+    assert report.failed == [claim]
+
+
+def test_apply_schema_runs_every_statement(mocker: MockerFixture):
+    session = _mock_session(mocker, constraints=[], indexes=[])
+
+    schema.apply_schema()
+
+    assert [call.args[0] for call in session.run.call_args_list] == [
+        item.statement for item in schema.SCHEMA
+    ]
@@ -0,0 +1,58 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
+from structlog.testing import LogCapture
+
+from tests.mocks.constants import TEST_CLAIM_ID
+from tests.mocks.db_responses import TestClaim
+
+
+def test_batch_get_claims(
+    client_with_auth: TestClient, mocker: MockerFixture, log_output: LogCapture
+):
+    batch_get = mocker.patch(
+        "views.batch.operations.batch_get",
+        return_value=[None, TestClaim(), TestClaim("c2")],
+    )
+
+    response = client_with_auth.post(
+        "/v1/claim/batch-get", json=["missing", TEST_CLAIM_ID, "c2", TEST_CLAIM_ID]
+    )
+
+    batch_get.assert_called_once_with(
+        label="Claim", pids=("missing", TEST_CLAIM_ID, "c2")
+    )
+    log_out = log_output.entries[0]
+    assert log_out["claim"]["method"] == "batch_get"
+    assert log_out["message"] == "Successfully retrieved 2 of 3 claim entities"
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "items": [TestClaim().properties, TestClaim("c2").properties],
+        "missing": ["missing"],
+    }
+
+
+def test_batch_get_none_found(client_with_auth: TestClient, mocker: MockerFixture):
+    mocker.patch("views.batch.operations.batch_get", return_value=[None])
+
+    response = client_with_auth.post("/v1/person/batch-get", json=["missing"])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"items": [], "missing": ["missing"]}
+
+
+def test_batch_get_too_many_ids(client_with_auth: TestClient, mocker: MockerFixture):
+    batch_get = mocker.patch("views.batch.operations.batch_get")
+
+    response = client_with_auth.post(
+        "/v1/person/batch-get", json=[f"p{i}" for i in range(1001)]
+    )
+
+    batch_get.assert_not_called()
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_batch_get_empty(client_with_auth: TestClient):
+    response = client_with_auth.post("/v1/company/batch-get", json=[])
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -1,12 +1,16 @@
+from datetime import UTC, datetime
+
 from fastapi import status
 from fastapi.testclient import TestClient
 from pytest_mock import MockerFixture
 from structlog.testing import LogCapture
 
 from core.logging.serializers import RequestContext
+from external.neo4j.pagination import Page
+from external.neo4j.query import ClaimStats
 from tests.mocks import bodies
+from tests.mocks.constants import TEST_CLAIM_ID, TEST_COMPANY_ID
 from tests.mocks.db_responses import TestClaim
-from tests.mocks.constants import TEST_CLAIM_ID
 
 
 def test_create_claim_success(
@@ -56,7 +60,9 @@ def test_get_claim_success(
     assert log_out["http"]["status_code"] == status.HTTP_200_OK
 
     assert log_out["level"] == "info"
-    assert log_out["message"] == f"Successfully retrieved claim with ID: {TEST_CLAIM_ID}"
+    assert (
+        log_out["message"] == f"Successfully retrieved claim with ID: {TEST_CLAIM_ID}"
+    )
 
     assert response.status_code == status.HTTP_200_OK
     json_response = response.json()
@@ -68,7 +74,9 @@ def test_create_claim_failed_bad_request(
     log_output: LogCapture,
     mocked_log_context: RequestContext,
 ):
-    response = client_with_auth.post("/v1/claim", json=bodies.create_claim_request().pop("amount"))
+    response = client_with_auth.post(
+        "/v1/claim", json=bodies.create_claim_request().pop("amount")
+    )
 
     assert mocked_log_context.log.error is not None
 
@@ -86,3 +94,201 @@ def test_create_claim_failed_bad_request(
             "Invalid request (('body',)): Input should be a valid dictionary or object to extract fields from"
         ),
     }
+
+
+def test_get_claim_stats_success(
+    client_with_auth: TestClient, mocker: MockerFixture, log_output: LogCapture
+):
+    stats = [
+        ClaimStats(
+            group={"status": "Approved"},
+            count=2,
+            sum=300.0,
+            min=100.0,
+            max=200.0,
+            avg=150.0,
+        ),
+        ClaimStats(
+            group={"status": "Submitted"},
+            count=1,
+            sum=50.0,
+            min=50.0,
+            max=50.0,
+            avg=50.0,
+        ),
+    ]
+    get_claim_stats = mocker.patch(
+        "views.claim.operations.get_claim_stats", return_value=stats
+    )
+
+    response = client_with_auth.get(
+        "/v1/claims/stats", params={"company_id": TEST_COMPANY_ID}
+    )
+
+    get_claim_stats.assert_called_once_with(
+        group_by=("status",), company_id=TEST_COMPANY_ID, person_id=None
+    )
+    assert (
+        log_output.entries[0]["message"]
+        == "Successfully computed claim statistics for 2 groups"
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "groups": [
+            {
+                "status": "Approved",
+                "count": 2,
+                "sum": 300.0,
+                "min": 100.0,
+                "max": 200.0,
+                "avg": 150.0,
+            },
+            {
+                "status": "Submitted",
+                "count": 1,
+                "sum": 50.0,
+                "min": 50.0,
+                "max": 50.0,
+                "avg": 50.0,
+            },
+        ]
+    }
+
+
+def test_get_claim_stats_grouped_by_company_and_person(
+    client_with_auth: TestClient, mocker: MockerFixture
+):
+    get_claim_stats = mocker.patch(
+        "views.claim.operations.get_claim_stats", return_value=[]
+    )
+
+    response = client_with_auth.get(
+        "/v1/claims/stats", params={"group_by": ["company", "person", "company"]}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"groups": []}
+    get_claim_stats.assert_called_once_with(
+        group_by=("company", "person"), company_id=None, person_id=None
+    )
+
+
+def test_get_claim_stats_invalid_group(client_with_auth: TestClient):
+    response = client_with_auth.get("/v1/claims/stats", params={"group_by": "amount"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_update_claim_status_success(
+    client_with_auth: TestClient, mocker: MockerFixture, log_output: LogCapture
+):
+    update_claim_status = mocker.patch(
+        "views.claim.operations.update_claim_status", return_value=TestClaim()
+    )
+
+    response = client_with_auth.patch(
+        f"/v1/claim/{TEST_CLAIM_ID}/status", json={"status": "Approved"}
+    )
+
+    update_claim_status.assert_called_once_with(
+        claim_id=TEST_CLAIM_ID, status="Approved"
+    )
+    message = log_output.entries[0]["message"]
+    assert (
+        message
+        == f"Successfully changed the status of claim with ID: {TEST_CLAIM_ID} to Approved"
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == TestClaim().properties
+
+
+def test_update_claim_status_invalid_status(client_with_auth: TestClient):
+    response = client_with_auth.patch(
+        f"/v1/claim/{TEST_CLAIM_ID}/status", json={"status": "Closed"}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_claims_in_window(
+    client_with_auth: TestClient, mocker: MockerFixture, log_output: LogCapture
+):
+    mocked_operation = mocker.patch(
+        "views.claim.operations.get_claims",
+        return_value=Page(items=[TestClaim()], next_cursor="next"),
+    )
+    response = client_with_auth.get(
+        "/v1/claims",
+        params={
+            "from": "2025-05-01T00:00:00",
+            "to": "2025-06-01T00:00:00+02:00",
+            "status": "Submitted",
+            "limit": 1,
+        },
+    )
+
+    mocked_operation.assert_called_once_with(
+        limit=1,
+        cursor=None,
+        since=datetime(2025, 5, 1, tzinfo=UTC),
+        until=datetime.fromisoformat("2025-06-01T00:00:00+02:00"),
+        status="Submitted",
+        fields=None,
+    )
+    assert log_output.entries[0]["claim"]["method"] == "get_claims"
+    assert log_output.entries[0]["message"] == "Successfully retrieved 1 claims"
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"items": [TestClaim().properties], "next_cursor": "next"}
+
+
+def test_get_claims_without_filters(
+    client_with_auth: TestClient, mocker: MockerFixture
+):
+    mocked_operation = mocker.patch(
+        "views.claim.operations.get_claims",
+        return_value=Page(items=[], next_cursor=None),
+    )
+
+    response = client_with_auth.get("/v1/claims", params={"cursor": "current"})
+
+    mocked_operation.assert_called_once_with(
+        limit=100, cursor="current", since=None, until=None, status=None, fields=None
+    )
+    assert response.json() == {"items": [], "next_cursor": None}
+
+
+def test_get_claims_invalid_window(client_with_auth: TestClient, mocker: MockerFixture):
+    mocked_operation = mocker.patch("views.claim.operations.get_claims")
+
+    response = client_with_auth.get(
+        "/v1/claims", params={"from": "2025-06-01", "to": "2025-05-01"}
+    )
+
+    mocked_operation.assert_not_called()
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_claims_invalid_status(client_with_auth: TestClient):
+    response = client_with_auth.get("/v1/claims", params={"status": "Lost"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_claims_with_repeated_fields(
+    client_with_auth: TestClient, mocker: MockerFixture
+):
+    mocked_operation = mocker.patch(
+        "views.claim.operations.get_claims",
+        return_value=Page(items=[], next_cursor=None),
+    )
+
+    response = client_with_auth.get("/v1/claims?fields=status,amount&fields=status")
+
+    assert mocked_operation.call_args.kwargs["fields"] == ("pid", "status", "amount")
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_get_claims_with_unknown_fields(client_with_auth: TestClient):
+    response = client_with_auth.get("/v1/claims", params={"fields": "name"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
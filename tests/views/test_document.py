@@ -1,12 +1,15 @@
+from datetime import UTC, datetime
+
 from fastapi import status
 from fastapi.testclient import TestClient
 from pytest_mock import MockerFixture
 from structlog.testing import LogCapture
 
 from core.logging.serializers import RequestContext
+from external.neo4j.pagination import Page
 from tests.mocks import bodies
-from tests.mocks.db_responses import TestDocument
 from tests.mocks.constants import TEST_DOCUMENT_ID
+from tests.mocks.db_responses import TestDocument
 
 
 def test_create_document_success(
@@ -17,8 +20,12 @@ def test_create_document_success(
 ):
     mock_db_document = TestDocument()
 
-    mocker.patch("views.document.operations.create_document", return_value=TestDocument())
-    response = client_with_auth.post("/v1/document", json=bodies.create_document_request())
+    mocker.patch(
+        "views.document.operations.create_document", return_value=TestDocument()
+    )
+    response = client_with_auth.post(
+        "/v1/document", json=bodies.create_document_request()
+    )
 
     assert mocked_log_context.log.error is None
 
@@ -29,7 +36,10 @@ def test_create_document_success(
     assert log_out["http"]["status_code"] == status.HTTP_201_CREATED
 
     assert log_out["level"] == "info"
-    assert log_out["message"] == f"Successfully created document with ID: {TEST_DOCUMENT_ID}"
+    assert (
+        log_out["message"]
+        == f"Successfully created document with ID: {TEST_DOCUMENT_ID}"
+    )
 
     assert response.status_code == status.HTTP_201_CREATED
     json_response = response.json()
@@ -56,7 +66,10 @@ def test_get_document_success(
     assert log_out["http"]["status_code"] == status.HTTP_200_OK
 
     assert log_out["level"] == "info"
-    assert log_out["message"] == f"Successfully retrieved document with ID: {TEST_DOCUMENT_ID}"
+    assert (
+        log_out["message"]
+        == f"Successfully retrieved document with ID: {TEST_DOCUMENT_ID}"
+    )
 
     assert response.status_code == status.HTTP_200_OK
     json_response = response.json()
@@ -68,7 +81,9 @@ def test_create_document_failed_bad_request(
     log_output: LogCapture,
     mocked_log_context: RequestContext,
 ):
-    response = client_with_auth.post("/v1/document", json=bodies.create_document_request().pop("submission_date"))
+    response = client_with_auth.post(
+        "/v1/document", json=bodies.create_document_request().pop("submission_date")
+    )
 
     assert mocked_log_context.log.error is not None
 
@@ -86,3 +101,37 @@ def test_create_document_failed_bad_request(
             "Invalid request (('body',)): Input should be a valid dictionary or object to extract fields from"
         ),
     }
+
+
+def test_get_documents_in_window(
+    client_with_auth: TestClient, mocker: MockerFixture, log_output: LogCapture
+):
+    mocked_operation = mocker.patch(
+        "views.document.operations.get_documents",
+        return_value=Page(items=[TestDocument()], next_cursor=None),
+    )
+    response = client_with_auth.get(
+        "/v1/documents", params={"from": "2025-05-01T00:00:00"}
+    )
+
+    mocked_operation.assert_called_once_with(
+        limit=100,
+        cursor=None,
+        since=datetime(2025, 5, 1, tzinfo=UTC),
+        until=None,
+        fields=None,
+    )
+    assert log_output.entries[0]["document"]["method"] == "get_documents"
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "items": [TestDocument().properties],
+        "next_cursor": None,
+    }
+
+
+def test_get_documents_empty_window(client_with_auth: TestClient):
+    response = client_with_auth.get(
+        "/v1/documents", params={"from": "2025-05-01", "to": "2025-05-01"}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
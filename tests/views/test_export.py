@@ -0,0 +1,50 @@
+import gzip
+import json
+
+from fastapi import status
+from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
+from structlog.testing import LogCapture
+
+
+def test_export_persons_as_jsonl(
+    client_with_auth: TestClient, mocker: MockerFixture, log_output: LogCapture
+):
+    rows = [{"pid": "p1", "name": "A"}, {"pid": "p2", "name": "B", "email": "b@x.io"}]
+    export_rows = mocker.patch(
+        "views.export.operations.export_rows", return_value=iter(rows)
+    )
+
+    response = client_with_auth.get("/v1/export/person")
+
+    export_rows.assert_called_once_with(kind="person")
+    assert log_output.entries[0]["message"] == "Exporting person as jsonl"
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert (
+        response.headers["content-disposition"] == 'attachment; filename="person.jsonl"'
+    )
+    assert [json.loads(line) for line in response.text.splitlines()] == rows
+
+
+def test_export_links_as_gzipped_csv(
+    client_with_auth: TestClient, mocker: MockerFixture
+):
+    links = [{"from_id": "p1", "to_id": "c1", "type": "WORKS_FOR"}]
+    mocker.patch("views.export.operations.export_rows", return_value=iter(links))
+
+    response = client_with_auth.get(
+        "/v1/export/links", params={"format": "csv", "gzip": True}
+    )
+
+    assert response.headers["content-type"] == "application/gzip"
+    assert (
+        response.headers["content-disposition"] == 'attachment; filename="links.csv.gz"'
+    )
+    assert gzip.decompress(response.content) == b"from_id,to_id,type\np1,c1,WORKS_FOR\n"
+
+
+def test_export_unknown_kind(client_with_auth: TestClient):
+    response = client_with_auth.get("/v1/export/invoice")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,117 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
+from structlog.testing import LogCapture
+
+from core.logging.serializers import RequestContext
+from external.neo4j.exceptions import EntityNotFoundError
+from external.neo4j.query import Subgraph, SubgraphEdge
+from tests.mocks.constants import TEST_CLAIM_ID, TEST_COMPANY_ID, TEST_PERSON_ID
+from tests.mocks.db_responses import TestClaim, TestCompany, TestPerson
+
+
+def test_get_subgraph_success(
+    client_with_auth: TestClient,
+    mocker: MockerFixture,
+    log_output: LogCapture,
+    mocked_log_context: RequestContext,
+):
+    subgraph = Subgraph(
+        nodes=[TestPerson(), TestCompany(), TestClaim()],
+        edges=[
+            SubgraphEdge(TEST_PERSON_ID, "WORKS_FOR", TEST_COMPANY_ID),
+            SubgraphEdge(TEST_PERSON_ID, "SUBMITTED", TEST_CLAIM_ID),
+        ],
+        truncated=False,
+    )
+    get_subgraph = mocker.patch(
+        "views.graph.operations.get_subgraph", return_value=subgraph
+    )
+
+    response = client_with_auth.get(f"/v1/person/{TEST_PERSON_ID}/subgraph")
+
+    assert mocked_log_context.log.error is None
+    log_out = log_output.entries[0]
+    assert log_out["person"]["person_id"] == TEST_PERSON_ID
+    assert log_out["person"]["method"] == "get_subgraph"
+    assert (
+        log_out["message"]
+        == f"Successfully retrieved 3 nodes and 2 edges around person with ID: {TEST_PERSON_ID}"
+    )
+
+    get_subgraph.assert_called_once_with(
+        label="Person",
+        pid=TEST_PERSON_ID,
+        relationships=("HAS_CLAIMANT", "SENT", "SUBMITTED", "WORKS_FOR"),
+        depth=2,
+        max_nodes=1000,
+        max_edges=5000,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "nodes": [
+            TestPerson().properties,
+            TestCompany().properties,
+            TestClaim().properties,
+        ],
+        "edges": [
+            {"from": TEST_PERSON_ID, "type": "WORKS_FOR", "to": TEST_COMPANY_ID},
+            {"from": TEST_PERSON_ID, "type": "SUBMITTED", "to": TEST_CLAIM_ID},
+        ],
+        "truncated": False,
+    }
+
+
+def test_get_subgraph_with_filters(client_with_auth: TestClient, mocker: MockerFixture):
+    get_subgraph = mocker.patch(
+        "views.graph.operations.get_subgraph",
+        return_value=Subgraph(nodes=[TestClaim()], edges=[], truncated=True),
+    )
+
+    response = client_with_auth.get(
+        f"/v1/claim/{TEST_CLAIM_ID}/subgraph",
+        params={
+            "depth": 3,
+            "types": ["SUBMITTED", "HAS_CLAIMANT", "SUBMITTED"],
+            "max_nodes": 10,
+            "max_edges": 20,
+        },
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["truncated"] is True
+    get_subgraph.assert_called_once_with(
+        label="Claim",
+        pid=TEST_CLAIM_ID,
+        relationships=("HAS_CLAIMANT", "SUBMITTED"),
+        depth=3,
+        max_nodes=10,
+        max_edges=20,
+    )
+
+
+def test_get_subgraph_depth_too_large(client_with_auth: TestClient):
+    response = client_with_auth.get(
+        f"/v1/person/{TEST_PERSON_ID}/subgraph", params={"depth": 5}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_subgraph_unknown_relationship_type(client_with_auth: TestClient):
+    response = client_with_auth.get(
+        f"/v1/person/{TEST_PERSON_ID}/subgraph", params={"types": "KNOWS"}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_subgraph_not_found(client_with_auth: TestClient, mocker: MockerFixture):
+    mocker.patch(
+        "views.graph.operations.get_subgraph",
+        side_effect=EntityNotFoundError(f"Person with id:{TEST_PERSON_ID} not found"),
+    )
+
+    response = client_with_auth.get(f"/v1/person/{TEST_PERSON_ID}/subgraph")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -1,12 +1,18 @@
 from fastapi import status
 from fastapi.testclient import TestClient
+from neo4j import Bookmarks
 from pytest_mock import MockerFixture
 from structlog.testing import LogCapture
 
 from core.logging.serializers import RequestContext
+from core.settings import get_settings
+from external.memory.repository import InMemoryRepository
+from external.neo4j import routing
+from external.neo4j.bulk import BulkItemResult, BulkItemStatus
+from external.neo4j.exceptions import DatabaseUnavailableError
 from tests.mocks import bodies
-from tests.mocks.db_responses import TestPerson
 from tests.mocks.constants import TEST_PERSON_ID
+from tests.mocks.db_responses import TestPerson
 
 
 def test_create_person_success(
@@ -29,7 +35,9 @@ def test_create_person_success(
     assert log_out["http"]["status_code"] == status.HTTP_201_CREATED
 
     assert log_out["level"] == "info"
-    assert log_out["message"] == f"Successfully created person with ID: {TEST_PERSON_ID}"
+    assert (
+        log_out["message"] == f"Successfully created person with ID: {TEST_PERSON_ID}"
+    )
 
     assert response.status_code == status.HTTP_201_CREATED
     json_response = response.json()
@@ -56,7 +64,34 @@ def test_get_person_success(
     assert log_out["http"]["status_code"] == status.HTTP_200_OK
 
     assert log_out["level"] == "info"
-    assert log_out["message"] == f"Successfully retrieved person with ID: {TEST_PERSON_ID}"
+    assert (
+        log_out["message"] == f"Successfully retrieved person with ID: {TEST_PERSON_ID}"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    json_response = response.json()
+    assert json_response == mock_db_person.properties
+
+
+def test_get_person_async_driver_success(
+    client_with_auth: TestClient,
+    mocker: MockerFixture,
+    log_output: LogCapture,
+    mocked_log_context: RequestContext,
+):
+    mock_db_person = TestPerson()
+
+    mocker.patch.object(get_settings().db_settings, "driver_mode", "async")
+    async_operation = mocker.patch(
+        "views.helpers.async_operations.get_person", return_value=TestPerson()
+    )
+    response = client_with_auth.get(f"/v1/person/{TEST_PERSON_ID}")
+
+    async_operation.assert_awaited_once_with(person_id=TEST_PERSON_ID, fields=None)
+
+    log_out = log_output.entries[0]
+    assert log_out["person"]["person_id"] == TEST_PERSON_ID
+    assert log_out["person"]["method"] == "get_person"
 
     assert response.status_code == status.HTTP_200_OK
     json_response = response.json()
@@ -68,7 +103,9 @@ def test_create_person_failed_bad_request(
     log_output: LogCapture,
     mocked_log_context: RequestContext,
 ):
-    response = client_with_auth.post("/v1/person", json=bodies.create_person_request().pop("name"))
+    response = client_with_auth.post(
+        "/v1/person", json=bodies.create_person_request().pop("name")
+    )
 
     assert mocked_log_context.log.error is not None
 
@@ -86,3 +123,166 @@ def test_create_person_failed_bad_request(
             "Invalid request (('body',)): Input should be a valid dictionary or object to extract fields from"
         ),
     }
+
+
+def test_bulk_create_persons_success(
+    client_with_auth: TestClient,
+    mocker: MockerFixture,
+    log_output: LogCapture,
+    mocked_log_context: RequestContext,
+):
+    mocker.patch(
+        "views.person.operations.bulk_create_persons",
+        return_value=[
+            BulkItemResult("p1", BulkItemStatus.CREATED),
+            BulkItemResult("p2", BulkItemStatus.EXISTS),
+            BulkItemResult("p1", BulkItemStatus.DUPLICATE),
+        ],
+    )
+    response = client_with_auth.post(
+        "/v1/person/bulk",
+        json=[
+            bodies.create_person_request(person_id) for person_id in ("p1", "p2", "p1")
+        ],
+    )
+
+    assert mocked_log_context.log.error is None
+
+    log_out = log_output.entries[0]
+    assert log_out["person"]["method"] == "bulk_create_persons"
+    assert log_out["http"]["status_code"] == status.HTTP_200_OK
+    assert log_out["message"] == "Successfully created 1 of 3 persons"
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "created": 1,
+        "exists": 1,
+        "duplicate": 1,
+        "results": [
+            {"pid": "p1", "status": "created"},
+            {"pid": "p2", "status": "exists"},
+            {"pid": "p1", "status": "duplicate"},
+        ],
+    }
+
+
+def test_bulk_create_persons_failed_bad_request(
+    client_with_auth: TestClient,
+    log_output: LogCapture,
+):
+    response = client_with_auth.post(
+        "/v1/person/bulk", json=[bodies.create_person_request(), {"pid": "p2"}]
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert log_output.entries[0]["message"] == "Request Validation Error"
+
+
+def test_create_person_returns_write_bookmarks(
+    client_with_auth: TestClient, mocker: MockerFixture
+):
+    def create_person(**kwargs):
+        routing.record_bookmarks(Bookmarks.from_raw_values(["FB:write"]))
+        return TestPerson()
+
+    mocker.patch("views.person.operations.create_person", side_effect=create_person)
+    response = client_with_auth.post(
+        "/v1/person",
+        json=bodies.create_person_request(),
+        headers={routing.BOOKMARKS_HEADER: "FB:read"},
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.headers[routing.BOOKMARKS_HEADER] == "FB:write"
+
+
+def test_get_person_echoes_request_bookmarks(
+    client_with_auth: TestClient, mocker: MockerFixture
+):
+    mocker.patch("views.person.operations.get_person", return_value=TestPerson())
+
+    response = client_with_auth.get(
+        f"/v1/person/{TEST_PERSON_ID}", headers={routing.BOOKMARKS_HEADER: "FB:read"}
+    )
+
+    assert response.headers[routing.BOOKMARKS_HEADER] == "FB:read"
+
+
+def test_get_person_without_bookmarks(
+    client_with_auth: TestClient, mocker: MockerFixture
+):
+    mocker.patch("views.person.operations.get_person", return_value=TestPerson())
+
+    response = client_with_auth.get(f"/v1/person/{TEST_PERSON_ID}")
+
+    assert routing.BOOKMARKS_HEADER not in response.headers
+
+
+def test_get_person_database_unavailable(
+    client_with_auth: TestClient,
+    mocker: MockerFixture,
+    log_output: LogCapture,
+    mocked_log_context: RequestContext,
+):
+    mocker.patch(
+        "views.person.operations.get_person",
+        side_effect=DatabaseUnavailableError(
+            "Database unavailable after 5 attempts: no leader"
+        ),
+    )
+    response = client_with_auth.get(f"/v1/person/{TEST_PERSON_ID}")
+
+    log_out = log_output.entries[0]
+    assert log_out["http"]["status_code"] == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert log_out["level"] == "error"
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "10"
+    assert response.json()["responseCode"] == "SERVICE_UNAVAILABLE"
+
+
+def test_get_person_with_fields(client_with_auth: TestClient, mocker: MockerFixture):
+    mocker.patch("views.person.operations.get_person", return_value=TestPerson())
+
+    response = client_with_auth.get(
+        f"/v1/person/{TEST_PERSON_ID}", params={"fields": "name,email"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "pid": TEST_PERSON_ID,
+        "name": "Test Name",
+        "email": "test_email",
+    }
+
+
+def test_get_person_with_unknown_fields(
+    client_with_auth: TestClient, mocker: MockerFixture
+):
+    get_person = mocker.patch("views.person.operations.get_person")
+
+    response = client_with_auth.get(
+        f"/v1/person/{TEST_PERSON_ID}", params={"fields": "name,password"}
+    )
+
+    get_person.assert_not_called()
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Unknown fields: password" in response.json()["responseMessage"]
+
+
+def test_person_round_trip_on_memory_backend(
+    client_with_auth: TestClient, mocker: MockerFixture
+):
+    mocker.patch.object(get_settings().db_settings, "backend", "memory")
+    mocker.patch("views.helpers.memory_repository", InMemoryRepository())
+
+    created = client_with_auth.post("/v1/person", json=bodies.create_person_request())
+    response = client_with_auth.get(
+        f"/v1/person/{TEST_PERSON_ID}", params={"fields": "name"}
+    )
+    missing = client_with_auth.get("/v1/person/unknown")
+
+    assert created.status_code == status.HTTP_201_CREATED
+    assert created.json()["email"] == "test_email"
+    assert response.json() == {"pid": TEST_PERSON_ID, "name": "Test Name"}
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
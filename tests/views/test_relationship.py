@@ -1,11 +1,24 @@
+import json
+from datetime import UTC, datetime
+
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 from pytest_mock import MockerFixture
 from structlog.testing import LogCapture
 
 from core.logging.serializers import RequestContext
-from tests.mocks.db_responses import TestCompany, TestClaim
-from tests.mocks.constants import TEST_COMPANY_ID, TEST_PERSON_ID, TEST_CLAIM_ID, TEST_DOCUMENT_ID
+from core.settings import get_settings
+from external.neo4j.bulk import BulkLinkResult
+from external.neo4j.pagination import Page
+from tests.mocks.constants import (
+    TEST_CLAIM_ID,
+    TEST_COMPANY_ID,
+    TEST_DOCUMENT_ID,
+    TEST_PERSON_ID,
+)
+from tests.mocks.db_responses import TestClaim, TestCompany
+from views.helpers import ndjson_response
 
 
 def test_create_person_company_relationship_success(
@@ -14,8 +27,12 @@ def test_create_person_company_relationship_success(
     log_output: LogCapture,
     mocked_log_context: RequestContext,
 ):
-    mocker.patch("views.company.operations.create_person_company_relationship", return_value=True)
-    response = client_with_auth.post(f"/v1/person/{TEST_PERSON_ID}/company/{TEST_COMPANY_ID}")
+    mocker.patch(
+        "views.company.operations.create_person_company_relationship", return_value=True
+    )
+    response = client_with_auth.post(
+        f"/v1/person/{TEST_PERSON_ID}/company/{TEST_COMPANY_ID}"
+    )
 
     assert mocked_log_context.log.error is None
 
@@ -25,16 +42,16 @@ def test_create_person_company_relationship_success(
     assert log_out["company"]["company_id"] == TEST_COMPANY_ID
     assert log_out["company"]["method"] == "create_person_company_relationship"
 
-    assert log_out["http"]["status_code"] == status.HTTP_200_OK
+    assert log_out["http"]["status_code"] == status.HTTP_201_CREATED
 
     assert log_out["level"] == "info"
     assert log_out["message"] == (
         f"Successfully connected company with ID: {TEST_COMPANY_ID} with person with ID: {TEST_PERSON_ID}"
     )
 
-    assert response.status_code == status.HTTP_200_OK
+    assert response.status_code == status.HTTP_201_CREATED
     json_response = response.json()
-    assert json_response == {"isConnected": True}
+    assert json_response == {"isConnected": True, "created": True}
 
 
 def test_create_person_claim_relationship_success(
@@ -43,8 +60,12 @@ def test_create_person_claim_relationship_success(
     log_output: LogCapture,
     mocked_log_context: RequestContext,
 ):
-    mocker.patch("views.company.operations.create_person_claim_relationship", return_value=True)
-    response = client_with_auth.post(f"/v1/person/{TEST_PERSON_ID}/claim/{TEST_CLAIM_ID}")
+    mocker.patch(
+        "views.company.operations.create_person_claim_relationship", return_value=True
+    )
+    response = client_with_auth.post(
+        f"/v1/person/{TEST_PERSON_ID}/claim/{TEST_CLAIM_ID}"
+    )
 
     assert mocked_log_context.log.error is None
 
@@ -54,16 +75,16 @@ def test_create_person_claim_relationship_success(
     assert log_out["claim"]["claim_id"] == TEST_CLAIM_ID
     assert log_out["claim"]["method"] == "create_person_claim_relationship"
 
-    assert log_out["http"]["status_code"] == status.HTTP_200_OK
+    assert log_out["http"]["status_code"] == status.HTTP_201_CREATED
 
     assert log_out["level"] == "info"
     assert log_out["message"] == (
         f"Successfully connected claim with ID: {TEST_CLAIM_ID} with person with ID: {TEST_PERSON_ID}"
     )
 
-    assert response.status_code == status.HTTP_200_OK
+    assert response.status_code == status.HTTP_201_CREATED
     json_response = response.json()
-    assert json_response == {"isConnected": True}
+    assert json_response == {"isConnected": True, "created": True}
 
 
 def test_create_person_document_relationship_success(
@@ -72,8 +93,13 @@ def test_create_person_document_relationship_success(
     log_output: LogCapture,
     mocked_log_context: RequestContext,
 ):
-    mocker.patch("views.company.operations.create_person_document_relationship", return_value=True)
-    response = client_with_auth.post(f"/v1/person/{TEST_PERSON_ID}/document/{TEST_DOCUMENT_ID}")
+    mocker.patch(
+        "views.company.operations.create_person_document_relationship",
+        return_value=True,
+    )
+    response = client_with_auth.post(
+        f"/v1/person/{TEST_PERSON_ID}/document/{TEST_DOCUMENT_ID}"
+    )
 
     assert mocked_log_context.log.error is None
 
@@ -83,16 +109,16 @@ def test_create_person_document_relationship_success(
     assert log_out["document"]["document_id"] == TEST_DOCUMENT_ID
     assert log_out["document"]["method"] == "create_person_document_relationship"
 
-    assert log_out["http"]["status_code"] == status.HTTP_200_OK
+    assert log_out["http"]["status_code"] == status.HTTP_201_CREATED
 
     assert log_out["level"] == "info"
     assert log_out["message"] == (
         f"Successfully connected document with ID: {TEST_DOCUMENT_ID} with person with ID: {TEST_PERSON_ID}"
     )
 
-    assert response.status_code == status.HTTP_200_OK
+    assert response.status_code == status.HTTP_201_CREATED
     json_response = response.json()
-    assert json_response == {"isConnected": True}
+    assert json_response == {"isConnected": True, "created": True}
 
 
 def test_get_claims_by_person_success(
@@ -106,7 +132,7 @@ def test_get_claims_by_person_success(
 
     mocker.patch(
         "views.company.operations.get_claims_by_person",
-        return_value=[mock_db_claim_1, mock_db_claim_2],
+        return_value=Page(items=[mock_db_claim_1, mock_db_claim_2], next_cursor=None),
     )
     response = client_with_auth.get(f"/v1/person/{TEST_PERSON_ID}/claims")
 
@@ -119,11 +145,17 @@ def test_get_claims_by_person_success(
     assert log_out["http"]["status_code"] == status.HTTP_200_OK
 
     assert log_out["level"] == "info"
-    assert log_out["message"] == f"Successfully retrieved claims by person with ID: {TEST_PERSON_ID}"
+    assert (
+        log_out["message"]
+        == f"Successfully retrieved claims by person with ID: {TEST_PERSON_ID}"
+    )
 
     assert response.status_code == status.HTTP_200_OK
     json_response = response.json()
-    assert json_response == [mock_db_claim_1.properties, mock_db_claim_2.properties]
+    assert json_response == {
+        "items": [mock_db_claim_1.properties, mock_db_claim_2.properties],
+        "next_cursor": None,
+    }
 
 
 def test_get_claims_by_company_success(
@@ -137,7 +169,7 @@ def test_get_claims_by_company_success(
 
     mocker.patch(
         "views.company.operations.get_claims_by_company",
-        return_value=[mock_db_claim_1, mock_db_claim_2],
+        return_value=Page(items=[mock_db_claim_1, mock_db_claim_2], next_cursor=None),
     )
     response = client_with_auth.get(f"/v1/claims/company/{TEST_COMPANY_ID}")
 
@@ -150,11 +182,190 @@ def test_get_claims_by_company_success(
     assert log_out["http"]["status_code"] == status.HTTP_200_OK
 
     assert log_out["level"] == "info"
-    assert log_out["message"] == f"Successfully retrieved claims by company with ID: {TEST_COMPANY_ID}"
+    assert (
+        log_out["message"]
+        == f"Successfully retrieved claims by company with ID: {TEST_COMPANY_ID}"
+    )
 
     assert response.status_code == status.HTTP_200_OK
     json_response = response.json()
-    assert json_response == [mock_db_claim_1.properties, mock_db_claim_2.properties]
+    assert json_response == {
+        "items": [mock_db_claim_1.properties, mock_db_claim_2.properties],
+        "next_cursor": None,
+    }
+
+
+def test_get_claims_by_company_with_cursor(
+    client_with_auth: TestClient,
+    mocker: MockerFixture,
+):
+    mocked_operation = mocker.patch(
+        "views.relationship.operations.get_claims_by_company",
+        return_value=Page(items=[TestClaim()], next_cursor="next"),
+    )
+    response = client_with_auth.get(
+        f"/v1/claims/company/{TEST_COMPANY_ID}?limit=1&cursor=current"
+    )
+
+    mocked_operation.assert_called_once_with(
+        company_id=TEST_COMPANY_ID,
+        limit=1,
+        cursor="current",
+        fields=None,
+        since=None,
+        until=None,
+        status=None,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"items": [TestClaim().properties], "next_cursor": "next"}
+
+
+def test_get_claims_by_person_filtered_by_window_and_status(
+    client_with_auth: TestClient, mocker: MockerFixture
+):
+    mocked_operation = mocker.patch(
+        "views.relationship.operations.get_claims_by_person",
+        return_value=Page(items=[], next_cursor=None),
+    )
+    response = client_with_auth.get(
+        f"/v1/person/{TEST_PERSON_ID}/claims?from=2025-05-01T00:00:00&to=2025-06-01T00:00:00&status=Approved"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"items": [], "next_cursor": None}
+    mocked_operation.assert_called_once_with(
+        person_id=TEST_PERSON_ID,
+        limit=100,
+        cursor=None,
+        fields=None,
+        since=datetime(2025, 5, 1, tzinfo=UTC),
+        until=datetime(2025, 6, 1, tzinfo=UTC),
+        status="Approved",
+    )
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "from=2025-06-01T00:00:00&to=2025-05-01T00:00:00",
+        "status=Unknown",
+        "from=yesterday",
+    ],
+)
+def test_get_claims_by_company_failed_invalid_filters(
+    client_with_auth: TestClient, query: str
+):
+    response = client_with_auth.get(f"/v1/claims/company/{TEST_COMPANY_ID}?{query}")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_claims_by_company_failed_invalid_cursor(
+    client_with_auth: TestClient,
+    mocker: MockerFixture,
+    log_output: LogCapture,
+):
+    mocker.patch("views.relationship.operations.q.get_claims_by_company")
+    response = client_with_auth.get(
+        f"/v1/claims/company/{TEST_COMPANY_ID}?cursor=not-a-cursor"
+    )
+
+    assert log_output.entries[0]["error"]["kind"] == "InvalidCursorError"
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {
+        "responseCode": "BAD_REQUEST",
+        "responseMessage": "Invalid cursor: not-a-cursor",
+    }
+
+
+def test_get_claims_by_company_failed_limit_too_large(
+    client_with_auth: TestClient, settings
+):
+    response = client_with_auth.get(
+        f"/v1/claims/company/{TEST_COMPANY_ID}?limit={settings.page_max_limit + 1}"
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_claims_by_company_ndjson_stream(
+    client_with_auth: TestClient,
+    mocker: MockerFixture,
+    log_output: LogCapture,
+    mocked_log_context: RequestContext,
+):
+    mock_db_claim_1 = TestClaim(claim_id="f3055331-8486-4db4-8840-2d03266969dd")
+    mock_db_claim_2 = TestClaim(claim_id="f4055331-8486-4db4-8840-2d03266969dd")
+    mocker.patch(
+        "views.relationship.operations.stream_claims_by_company",
+        return_value=iter([mock_db_claim_1, mock_db_claim_2]),
+    )
+    response = client_with_auth.get(
+        f"/v1/claims/company/{TEST_COMPANY_ID}",
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    log_out = log_output.entries[0]
+    assert log_out["company"]["method"] == "stream_claims_by_company"
+    assert (
+        log_out["message"] == f"Streaming claims by company with ID: {TEST_COMPANY_ID}"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.iter_lines()] == [
+        mock_db_claim_1.properties,
+        mock_db_claim_2.properties,
+    ]
+
+
+def test_get_claims_by_person_ndjson_stream_async_driver(
+    client_with_auth: TestClient, mocker: MockerFixture
+):
+    async def stream_claims(
+        person_id: str, fields: tuple[str, ...] | None = None, **filters
+    ):
+        async def claims():
+            yield TestClaim()
+
+        return claims()
+
+    mocker.patch.object(get_settings().db_settings, "driver_mode", "async")
+    mocker.patch(
+        "views.helpers.async_operations.stream_claims_by_person",
+        side_effect=stream_claims,
+    )
+    response = client_with_auth.get(
+        f"/v1/person/{TEST_PERSON_ID}/claims",
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [json.loads(line) for line in response.iter_lines()] == [
+        TestClaim().properties
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_stream_closes_the_entities_when_the_client_stops_reading(
+    mocker: MockerFixture,
+):
+    mocker.patch.object(get_settings(), "stream_chunk_size", 1)
+    closed = []
+
+    def claims():
+        try:
+            yield TestClaim("c1")
+            yield TestClaim("c2")
+        finally:
+            closed.append(True)
+
+    content = ndjson_response(claims()).body_iterator
+    assert json.loads(await anext(content)) == TestClaim("c1").properties
+    # what starlette does to the response body when the client disconnects
+    await content.aclose()
+
+    assert closed == [True]
 
 
 def test_get_company_by_person_success(
@@ -164,7 +375,9 @@ def test_get_company_by_person_success(
     mocked_log_context: RequestContext,
 ):
     mock_db_company = TestCompany()
-    mocker.patch("views.company.operations.get_company_by_person", return_value=mock_db_company)
+    mocker.patch(
+        "views.company.operations.get_company_by_person", return_value=mock_db_company
+    )
     response = client_with_auth.get(f"/v1/company/person/{TEST_PERSON_ID}")
 
     assert mocked_log_context.log.error is None
@@ -187,14 +400,19 @@ def test_get_company_by_person_success(
     assert json_response == mock_db_company.properties
 
 
-def test_create_person_company_relationship_failed(
+def test_create_person_company_relationship_already_connected(
     client_with_auth: TestClient,
     mocker: MockerFixture,
     log_output: LogCapture,
     mocked_log_context: RequestContext,
 ):
-    mocker.patch("views.company.operations.create_person_company_relationship", return_value=False)
-    response = client_with_auth.post(f"/v1/person/{TEST_PERSON_ID}/company/{TEST_COMPANY_ID}")
+    mocker.patch(
+        "views.company.operations.create_person_company_relationship",
+        return_value=False,
+    )
+    response = client_with_auth.post(
+        f"/v1/person/{TEST_PERSON_ID}/company/{TEST_COMPANY_ID}"
+    )
 
     assert mocked_log_context.log.error is None
 
@@ -208,22 +426,26 @@ def test_create_person_company_relationship_failed(
 
     assert log_out["level"] == "info"
     assert log_out["message"] == (
-        f"Failed to connect company with ID: {TEST_COMPANY_ID} with person with ID: {TEST_PERSON_ID}"
+        f"Already connected company with ID: {TEST_COMPANY_ID} with person with ID: {TEST_PERSON_ID}"
     )
 
     assert response.status_code == status.HTTP_200_OK
     json_response = response.json()
-    assert json_response == {"isConnected": False}
+    assert json_response == {"isConnected": True, "created": False}
 
 
-def test_create_person_claim_relationship_failed(
+def test_create_person_claim_relationship_already_connected(
     client_with_auth: TestClient,
     mocker: MockerFixture,
     log_output: LogCapture,
     mocked_log_context: RequestContext,
 ):
-    mocker.patch("views.company.operations.create_person_claim_relationship", return_value=False)
-    response = client_with_auth.post(f"/v1/person/{TEST_PERSON_ID}/claim/{TEST_CLAIM_ID}")
+    mocker.patch(
+        "views.company.operations.create_person_claim_relationship", return_value=False
+    )
+    response = client_with_auth.post(
+        f"/v1/person/{TEST_PERSON_ID}/claim/{TEST_CLAIM_ID}"
+    )
 
     assert mocked_log_context.log.error is None
 
@@ -237,22 +459,27 @@ def test_create_person_claim_relationship_failed(
 
     assert log_out["level"] == "info"
     assert log_out["message"] == (
-        f"Failed to connect claim with ID: {TEST_CLAIM_ID} with person with ID: {TEST_PERSON_ID}"
+        f"Already connected claim with ID: {TEST_CLAIM_ID} with person with ID: {TEST_PERSON_ID}"
     )
 
     assert response.status_code == status.HTTP_200_OK
     json_response = response.json()
-    assert json_response == {"isConnected": False}
+    assert json_response == {"isConnected": True, "created": False}
 
 
-def test_create_person_document_relationship_failed(
+def test_create_person_document_relationship_already_connected(
     client_with_auth: TestClient,
     mocker: MockerFixture,
     log_output: LogCapture,
     mocked_log_context: RequestContext,
 ):
-    mocker.patch("views.company.operations.create_person_document_relationship", return_value=False)
-    response = client_with_auth.post(f"/v1/person/{TEST_PERSON_ID}/document/{TEST_DOCUMENT_ID}")
+    mocker.patch(
+        "views.company.operations.create_person_document_relationship",
+        return_value=False,
+    )
+    response = client_with_auth.post(
+        f"/v1/person/{TEST_PERSON_ID}/document/{TEST_DOCUMENT_ID}"
+    )
 
     assert mocked_log_context.log.error is None
 
@@ -266,9 +493,85 @@ def test_create_person_document_relationship_failed(
 
     assert log_out["level"] == "info"
     assert log_out["message"] == (
-        f"Failed to connect document with ID: {TEST_DOCUMENT_ID} with person with ID: {TEST_PERSON_ID}"
+        f"Already connected document with ID: {TEST_DOCUMENT_ID} with person with ID: {TEST_PERSON_ID}"
     )
 
     assert response.status_code == status.HTTP_200_OK
     json_response = response.json()
-    assert json_response == {"isConnected": False}
+    assert json_response == {"isConnected": True, "created": False}
+
+
+def test_bulk_create_relationships_success(
+    client_with_auth: TestClient,
+    mocker: MockerFixture,
+    log_output: LogCapture,
+    mocked_log_context: RequestContext,
+):
+    mocked_operation = mocker.patch(
+        "views.relationship.operations.bulk_create_relationships",
+        return_value=BulkLinkResult(
+            linked=1, skipped=1, not_found={"Claim": ["missing"]}
+        ),
+    )
+    links = [
+        {"from_id": TEST_PERSON_ID, "to_id": TEST_COMPANY_ID, "type": "WORKS_FOR"},
+        {"from_id": "missing", "to_id": TEST_COMPANY_ID, "type": "HAS_CLAIMANT"},
+    ]
+    response = client_with_auth.post("/v1/relationships/bulk", json=links)
+
+    assert mocked_log_context.log.error is None
+    mocked_operation.assert_called_once_with(links=links)
+
+    log_out = log_output.entries[0]
+    assert log_out["http"]["status_code"] == status.HTTP_200_OK
+    assert log_out["message"] == "Successfully linked 1 of 2 relationships"
+    for entity in ("person", "company", "claim"):
+        assert log_out[entity]["method"] == "bulk_create_relationships"
+    assert "document" not in log_out
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "linked": 1,
+        "skipped": 1,
+        "notFound": {"Claim": ["missing"]},
+    }
+
+
+def test_bulk_create_relationships_failed_unknown_type(client_with_auth: TestClient):
+    response = client_with_auth.post(
+        "/v1/relationships/bulk",
+        json=[{"from_id": TEST_PERSON_ID, "to_id": TEST_COMPANY_ID, "type": "OWNS"}],
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_claims_by_company_with_fields(
+    client_with_auth: TestClient, mocker: MockerFixture
+):
+    claim = {
+        "pid": TEST_CLAIM_ID,
+        "status": "Submitted",
+        "submission_date": 1748361728.0,
+    }
+    mocked_operation = mocker.patch(
+        "views.relationship.operations.get_claims_by_company",
+        return_value=Page(items=[claim], next_cursor=None),
+    )
+    response = client_with_auth.get(
+        f"/v1/claims/company/{TEST_COMPANY_ID}?fields=status"
+    )
+
+    mocked_operation.assert_called_once_with(
+        company_id=TEST_COMPANY_ID,
+        limit=100,
+        cursor=None,
+        fields=("pid", "status"),
+        since=None,
+        until=None,
+        status=None,
+    )
+    assert response.json() == {
+        "items": [{"pid": TEST_CLAIM_ID, "status": "Submitted"}],
+        "next_cursor": None,
+    }
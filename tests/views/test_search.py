@@ -0,0 +1,65 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
+from structlog.testing import LogCapture
+
+from external.neo4j.pagination import Page
+from external.neo4j.query import SearchHit
+from tests.mocks.db_responses import TestCompany, TestPerson
+
+
+def test_search_persons_success(
+    client_with_auth: TestClient, mocker: MockerFixture, log_output: LogCapture
+):
+    page = Page(
+        items=[SearchHit(TestPerson(), 2.5), SearchHit(TestPerson("other"), 1.0)],
+        next_cursor="next",
+    )
+    search = mocker.patch("views.search.operations.search", return_value=page)
+
+    response = client_with_auth.get(
+        "/v1/search/person", params={"q": "Test Name", "limit": 2}
+    )
+
+    search.assert_called_once_with(
+        label="Person", text="Test Name", limit=2, cursor=None
+    )
+    assert log_output.entries[0]["message"] == "Successfully found 2 person results"
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "items": [
+            {"entity": TestPerson().properties, "score": 2.5},
+            {"entity": TestPerson("other").properties, "score": 1.0},
+        ],
+        "next_cursor": "next",
+    }
+
+
+def test_search_companies_next_page(
+    client_with_auth: TestClient, mocker: MockerFixture
+):
+    search = mocker.patch(
+        "views.search.operations.search",
+        return_value=Page(items=[SearchHit(TestCompany(), 0.5)], next_cursor=None),
+    )
+
+    response = client_with_auth.get(
+        "/v1/search/company", params={"q": "23454", "cursor": "abc"}
+    )
+
+    search.assert_called_once_with(
+        label="Company", text="23454", limit=100, cursor="abc"
+    )
+    assert response.json()["next_cursor"] is None
+
+
+def test_search_blank_text(client_with_auth: TestClient):
+    response = client_with_auth.get("/v1/search/person", params={"q": "   "})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_search_claims_is_not_supported(client_with_auth: TestClient):
+    response = client_with_auth.get("/v1/search/claim", params={"q": "#1234"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST